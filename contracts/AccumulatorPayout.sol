@@ -0,0 +1,369 @@
+// SPDX-License-Identifier: MIT
+pragma solidity ^0.8.0;
+
+import '@openzeppelin/contracts/access/Ownable.sol';
+import '@openzeppelin/contracts/token/ERC20/IERC20.sol';
+import '@openzeppelin/contracts/token/ERC20/utils/SafeERC20.sol';
+import '@openzeppelin/contracts/utils/math/SafeMath.sol';
+import '../interfaces/IVested.sol';
+
+/**
+  * @dev
+  *   Payout variant with the shares of `DailyPayout` and `QuarterlyPayout`, i.e. proportional to
+  *   veFLEX at each epoch start block, settled through prefix sums instead of a loop over epochs.
+  *
+  *   Between two checkpoints of an owner, veFLEX balance at the epoch start time `T` is
+  *   `bias - slope * (T - ts)`, so the reward of a run of epochs is
+  *   `(bias + slope * (ts - T0)) * sum(payout / supply) - slope * sum(payout * (T - T0) / supply)`.
+  *   Both sums are kept as cumulative arrays once an epoch has started, which makes a claim cost
+  *   grow with the owner's checkpoints rather than with the number of unclaimed epochs.
+  */
+contract AccumulatorPayout is Ownable
+{
+  using SafeERC20 for IERC20;
+  using SafeMath for uint256;
+
+  /* =========  MEMBER VARS ========== */
+  IERC20 immutable public token;  // FLEX token
+  IVested immutable public vested; // veFLEX
+  uint256 public constant EPOCH_BLOCKS = 15730; // 10 is for test and 15730 is average blocks in 1 day
+  uint256 public constant PRECISION = 1e27; // scale of the accumulators, about the magnitude of veFLEX balances
+  uint256 public constant CLAIM_CHECKPOINT_EPOCHS = 50; // epochs a claim finalizes at most; keepers or `checkpointEpochs` catch up longer gaps
+  uint256 public startBlockHeight;
+  uint256[] public payoutForEpoch;
+  uint256[] public epochTimestamp; // veFLEX time of each finalized epoch start block
+  uint256[] public cumulativeRewardPerVe; // prefix sums of payout * PRECISION / supply, rounded down
+  uint256[] public cumulativeRewardTimePerVe; // prefix sums of payout * (T - T0) * PRECISION / supply, rounded up
+  uint256 internal lastPointEpoch; // veFLEX global epoch found for the latest finalized epoch
+  mapping(address => uint256) public claimedEpoches;
+  mapping(address => bool) public isDistributor;
+  mapping(address => bool) public isOperator;
+  mapping(address => mapping(address => bool)) public isClaimer; // owner -> account allowed to claim on their behalf
+
+  /* ===========   EVENTS  =========== */
+  event Claim(address indexed from, uint256 amount, uint256 lastClaimedEpoch, uint256 endingEpoch);
+  event IsDistributor(address indexed account, bool status);
+  event IsOperator(address indexed account, bool status);
+  event Distribute(address distributor, uint256 amount);
+  event IsClaimer(address indexed owner, address indexed claimer, bool status);
+  event EpochFinalized(uint256 epoch, uint256 totalSupply, uint256 timestamp);
+  /* ========== CONSTRUCTOR ========== */
+  constructor(address tknAddr, address veAddr)
+  {
+    require(tknAddr != address(0), 'Token address cannot be zero.');  // FLEX token
+    require(veAddr != address(0) , 'Vested address cannot be zero.'); // veFLEX
+    token = IERC20(tknAddr);
+    vested = IVested(veAddr);
+    cumulativeRewardPerVe.push(0);
+    cumulativeRewardTimePerVe.push(0);
+  }
+
+  function addDistributor(address account) public onlyOwner {
+    require(account != address(0), 'Account address cannot be zero');
+    isDistributor[account] = true;
+    emit IsDistributor(account, true);
+  }
+
+  function removeDistributor(address account) public onlyOwner {
+    require(account != address(0), 'Account address cannot be zero');
+    isDistributor[account] = false;
+    emit IsDistributor(account, false);
+  }
+
+  function addOperator(address account) public onlyOwner {
+    require(account != address(0), 'Account address cannot be zero');
+    isOperator[account] = true;
+    emit IsOperator(account, true);
+  }
+
+  function removeOperator(address account) public onlyOwner {
+    require(account != address(0), 'Account address cannot be zero');
+    isOperator[account] = false;
+    emit IsOperator(account, false);
+  }
+
+  function setClaimer(address claimer, bool status) external {
+    require(claimer != address(0), 'Account address cannot be zero');
+    isClaimer[msg.sender][claimer] = status;
+    emit IsClaimer(msg.sender, claimer, status);
+  }
+
+  function setStartBlockHeight(uint256 blockHeight) public onlyOwner {
+    require(startBlockHeight == 0, "Start block height already set!");
+    startBlockHeight = blockHeight;
+  }
+
+  function distribute(uint256 amount) external {
+    require(msg.sender == owner() || isDistributor[msg.sender], "Distributor not authorized!");
+    require(amount > 0, "Amount to be distributed must be greater than zero!");
+    payoutForEpoch.push(amount);
+    emit Distribute(msg.sender, amount);
+    token.safeTransferFrom(msg.sender, address(this), amount);
+  }
+
+ /**
+  * @dev 
+  *   This is not current epoch, but rather the number of claimable epochs.
+  *   Name not changed for the sake of compatibility with former implementation.
+  */
+  function currentEpoch() public view returns(uint256) {
+    return payoutForEpoch.length;
+  }
+
+ /**
+  * @dev Number of epochs whose accumulators are written; only those can be claimed.
+  */
+  function finalizedEpochs() public view returns(uint256) {
+    return epochTimestamp.length;
+  }
+
+ /**
+  * @dev
+  *   Write the accumulators of up to `maxEpochs` distributed epochs that have started.
+  *   Claims finalize at most `CLAIM_CHECKPOINT_EPOCHS`, so after a longer gap anyone can call this in
+  *   batches until claims are fully up to date again.
+  */
+  function checkpointEpochs(uint256 maxEpochs) external {
+    _checkpointEpochs(maxEpochs);
+  }
+
+  function claim(address owner) external {
+    require(owner == msg.sender, "Can only claim for own account");
+    _checkpointEpochs(CLAIM_CHECKPOINT_EPOCHS);
+    uint256 epoch = finalizedEpochs();
+    if (epoch > 0) {
+      _claimUntilEpoch(owner, epoch.sub(1));
+    }
+  }
+
+/**
+  * @dev
+  *   Settle every owner in one transaction, rewards going to the owners themselves.
+  *   The caller must be each owner or a claimer they set.
+  */
+  function claimMany(address[] calldata owners) external {
+    _checkpointEpochs(CLAIM_CHECKPOINT_EPOCHS);
+    uint256 epoch = finalizedEpochs();
+    for (uint256 i = 0; i < owners.length; i++) {
+      require(owners[i] == msg.sender || isClaimer[owners[i]][msg.sender], "Not authorized to claim for owner");
+      if (epoch > 0) {
+        _claimUntilEpoch(owners[i], epoch.sub(1));
+      }
+    }
+  }
+
+ /**
+  * @dev Only counts finalized epochs, see `checkpointEpochs`.
+  */
+  function getClaimable(address owner) external view returns(uint256) {
+    uint256 epoch = finalizedEpochs();
+    if (epoch == 0) return 0;
+    (uint256 amount, ) = _getClaimableUntilEpoch(owner, epoch.sub(1));
+    return amount;
+  }
+
+/**
+  * @dev get current epoch
+  */
+  function getCurrentEpoch() external view returns(uint256) {
+    require(msg.sender == owner() || isOperator[msg.sender], "Not authorized!");
+    return _getCurrentEpoch();
+  }
+
+/**
+  * @dev get epoch start block height
+  */
+  function getEpochStartBlockHeight(uint256 epoch) external view returns(uint256) {
+    require(msg.sender == owner() || isOperator[msg.sender], "Not authorized!");
+    return _getEpochStartBlockHeight(epoch);
+  }
+
+ /**
+  * @dev
+  *   A global veFLEX checkpoint comes first, so that the supply and time interpolated at each
+  *   epoch start block can no longer change once written.
+  */
+  function _checkpointEpochs(uint256 maxEpochs) internal {
+    uint256 epoch = finalizedEpochs();
+    uint256 endingEpoch = currentEpoch();
+    if (endingEpoch.sub(epoch) > maxEpochs) endingEpoch = epoch.add(maxEpochs);
+    if (startBlockHeight == 0 || epoch >= endingEpoch || block.number <= _getEpochStartBlockHeight(epoch)) return;
+    vested.checkpoint();
+    uint256 blockHeightAtEpochStartTime;
+    uint256 totalSupply;
+    uint256 timestamp;
+    for (; epoch < endingEpoch; epoch++) {
+      blockHeightAtEpochStartTime = _getEpochStartBlockHeight(epoch);
+      if (block.number <= blockHeightAtEpochStartTime) break;
+      totalSupply = vested.totalSupplyAt(blockHeightAtEpochStartTime);
+      timestamp = _getBlockTime(blockHeightAtEpochStartTime);
+      uint256 rewardPerVe = 0;
+      uint256 rewardTimePerVe = 0;
+      if (totalSupply > 0) {
+        rewardPerVe = payoutForEpoch[epoch].mul(PRECISION).div(totalSupply);
+        rewardTimePerVe = _ceilDiv(payoutForEpoch[epoch].mul(timestamp - _baseTimestamp(timestamp)).mul(PRECISION), totalSupply);
+      }
+      epochTimestamp.push(timestamp);
+      cumulativeRewardPerVe.push(cumulativeRewardPerVe[epoch].add(rewardPerVe));
+      cumulativeRewardTimePerVe.push(cumulativeRewardTimePerVe[epoch].add(rewardTimePerVe));
+      emit EpochFinalized(epoch, totalSupply, timestamp);
+    }
+  }
+
+ /**
+  * @dev
+  *   Walks the owner's veFLEX checkpoints from the first unclaimed epoch on; each checkpoint
+  *   covers the epochs starting before the next one and before its lock runs out.
+  */
+  function _getClaimableUntilEpoch(address owner, uint256 endingEpoch) internal view returns(uint256, uint256) {
+    uint256 epoch = claimedEpoches[owner];
+    uint256 end = endingEpoch.add(1);
+    if (end > finalizedEpochs()) end = finalizedEpochs();
+    if (epoch >= end) return (0, epoch);
+    uint256 userEpoch = _findUserEpoch(owner, _getEpochStartBlockHeight(epoch));
+    uint256 maxUserEpoch = vested.user_point_epoch(owner);
+    uint256 scaledAmount = 0;
+    while (epoch < end) {
+      (uint256 reward, uint256 segmentEnd) = _getCheckpointReward(owner, userEpoch, maxUserEpoch, epoch, end);
+      scaledAmount = scaledAmount.add(reward);
+      if (segmentEnd > epoch) epoch = segmentEnd;
+      userEpoch++;
+    }
+    return (scaledAmount / PRECISION, end);
+  }
+
+ /**
+  * @dev
+  *   Reward of the owner's checkpoint `userEpoch` over epochs from `fromEpoch`, scaled by `PRECISION`,
+  *   and the first epoch that falls under the next checkpoint.
+  */
+  function _getCheckpointReward(address owner, uint256 userEpoch, uint256 maxUserEpoch, uint256 fromEpoch, uint256 toEpoch) internal view returns(uint256 reward, uint256 segmentEnd) {
+    segmentEnd = toEpoch;
+    if (userEpoch < maxUserEpoch) {
+      (, , , uint256 nextBlk) = vested.user_point_history(owner, userEpoch + 1);
+      uint256 nextEpoch = _getFirstEpochFromBlock(nextBlk);
+      if (nextEpoch < segmentEnd) segmentEnd = nextEpoch;
+    }
+    if (segmentEnd <= fromEpoch) return (0, segmentEnd);
+    (int128 bias, int128 slope, uint256 ts, ) = vested.user_point_history(owner, userEpoch);
+    if (slope <= 0) return (0, segmentEnd);
+    uint256 activeEnd = _getFirstEpochAfterTime(ts + uint256(int256(bias / slope)), fromEpoch, segmentEnd); // lock runs out
+    if (activeEnd > fromEpoch) {
+      reward = _getSegmentReward(int256(bias), int256(slope), ts, fromEpoch, activeEnd);
+    }
+  }
+
+ /**
+  * @dev
+  *   `(bias + slope * (ts - T0)) * dA - slope * dB` with `dA` rounded down and `dB` rounded up,
+  *   so that the result never exceeds the exact share.
+  */
+  function _getSegmentReward(int256 bias, int256 slope, uint256 ts, uint256 fromEpoch, uint256 toEpoch) internal view returns(uint256) {
+    int256 base = bias + slope * (int256(ts) - int256(epochTimestamp[0]));
+    if (base <= 0) return 0;
+    uint256 credit = uint256(base).mul(cumulativeRewardPerVe[toEpoch] - cumulativeRewardPerVe[fromEpoch]);
+    uint256 debit = uint256(slope).mul(cumulativeRewardTimePerVe[toEpoch] - cumulativeRewardTimePerVe[fromEpoch]);
+    return credit > debit ? credit - debit : 0;
+  }
+
+  function _claimUntilEpoch(address owner, uint256 endingEpoch) internal {
+    (uint256 amount, uint256 nextEpoch) = _getClaimableUntilEpoch(owner, endingEpoch);
+    if (nextEpoch == claimedEpoches[owner]) return;
+    claimedEpoches[owner] = nextEpoch;
+    if (amount > 0) {
+      emit Claim(owner, amount, nextEpoch.sub(1), endingEpoch);
+      token.safeTransfer(owner, amount);
+    }
+  }
+
+ /**
+  * @dev Time of `_block` interpolated between veFLEX global points, as `balanceOfAt` and `totalSupplyAt` do.
+  */
+  function _getBlockTime(uint256 _block) internal returns(uint256) {
+    uint256 _min = lastPointEpoch;
+    uint256 _max = vested.epoch();
+    while (_min < _max) {
+      uint256 _mid = (_min + _max + 1) / 2;
+      (, , , uint256 blk) = vested.point_history(_mid);
+      if (blk <= _block) {
+        _min = _mid;
+      } else {
+        _max = _mid - 1;
+      }
+    }
+    lastPointEpoch = _min;
+    (, , uint256 ts0, uint256 blk0) = vested.point_history(_min);
+    (, , uint256 ts1, uint256 blk1) = vested.point_history(_min + 1); // written by the checkpoint above
+    if (blk1 == blk0) return ts0;
+    return ts0 + (ts1 - ts0) * (_block - blk0) / (blk1 - blk0);
+  }
+
+  function _findUserEpoch(address owner, uint256 _block) internal view returns(uint256) {
+    uint256 _min = 0;
+    uint256 _max = vested.user_point_epoch(owner);
+    while (_min < _max) {
+      uint256 _mid = (_min + _max + 1) / 2;
+      (, , , uint256 blk) = vested.user_point_history(owner, _mid);
+      if (blk <= _block) {
+        _min = _mid;
+      } else {
+        _max = _mid - 1;
+      }
+    }
+    return _min;
+  }
+
+ /**
+  * @dev First epoch whose start block is at or after `_block`.
+  */
+  function _getFirstEpochFromBlock(uint256 _block) internal view returns(uint256) {
+    if (_block <= startBlockHeight) return 0;
+    return (_block - startBlockHeight + _epochBlocks() - 1) / _epochBlocks();
+  }
+
+ /**
+  * @dev First finalized epoch in `[_min, _max)` starting after `timestamp`, or `_max`.
+  */
+  function _getFirstEpochAfterTime(uint256 timestamp, uint256 _min, uint256 _max) internal view returns(uint256) {
+    while (_min < _max) {
+      uint256 _mid = (_min + _max) / 2;
+      if (epochTimestamp[_mid] > timestamp) {
+        _max = _mid;
+      } else {
+        _min = _mid + 1;
+      }
+    }
+    return _min;
+  }
+
+  function _baseTimestamp(uint256 timestamp) internal view returns(uint256) {
+    return epochTimestamp.length > 0 ? epochTimestamp[0] : timestamp;
+  }
+
+  function _ceilDiv(uint256 a, uint256 b) internal pure returns(uint256) {
+    return a == 0 ? 0 : (a - 1) / b + 1;
+  }
+
+ /**
+  * @dev 
+  *   Given epoch number, get the epoch start block height.
+  */
+  function _getEpochStartBlockHeight(uint256 epoch) internal view returns(uint256) {
+    return startBlockHeight.add(_epochBlocks().mul(epoch));
+  }
+
+ /**
+  * @dev This is the actual current epoch.
+  */
+  function _getCurrentEpoch() internal view returns(uint256) {
+    require(block.number >= startBlockHeight, 'The payout contract is not started yet');
+    return (block.number - startBlockHeight).div(_epochBlocks());
+  }
+
+ /**
+  * @dev Length of an epoch in blocks, shortened by the test mocks.
+  */
+  function _epochBlocks() internal view virtual returns(uint256) {
+    return EPOCH_BLOCKS;
+  }
+}
@@ -18,15 +18,18 @@ contract DailyPayout is Ownable
   uint256 public constant EPOCH_BLOCKS = 15730; // 10 is for test and 15730 is average blocks in 1 day
   uint256 public startBlockHeight;
   uint256[] public payoutForEpoch;
+  uint256[] public totalSupplyForEpoch; // veFLEX total supply at the start of each started epoch, snapshotted once for all claimants
   mapping(address => uint256) public claimedEpoches;
   mapping(address => bool) public isDistributor;
   mapping(address => bool) public isOperator;
+  mapping(address => mapping(address => bool)) public isClaimer; // owner -> account allowed to claim on their behalf
 
   /* ===========   EVENTS  =========== */
   event Claim(address indexed from, uint256 amount, uint256 lastClaimedEpoch, uint256 endingEpoch);
   event IsDistributor(address indexed account, bool status);
   event IsOperator(address indexed account, bool status);
   event Distribute(address distributor, uint256 amount);
+  event IsClaimer(address indexed owner, address indexed claimer, bool status);
   /* ========== CONSTRUCTOR ========== */
   constructor(address tknAddr, address veAddr)
   {
@@ -60,6 +63,12 @@ contract DailyPayout is Ownable
     emit IsOperator(account, false);
   }
 
+  function setClaimer(address claimer, bool status) external {
+    require(claimer != address(0), 'Account address cannot be zero');
+    isClaimer[msg.sender][claimer] = status;
+    emit IsClaimer(msg.sender, claimer, status);
+  }
+
   function setStartBlockHeight(uint256 blockHeight) public onlyOwner {
     require(startBlockHeight == 0, "Start block height already set!");
     startBlockHeight = blockHeight;
@@ -69,6 +78,7 @@ contract DailyPayout is Ownable
     require(msg.sender == owner() || isDistributor[msg.sender], "Distributor not authorized!");
     require(amount > 0, "Amount to be distributed must be greater than zero!");
     payoutForEpoch.push(amount);
+    _snapshotTotalSupply(payoutForEpoch.length - 1);
     emit Distribute(msg.sender, amount);
     token.safeTransferFrom(msg.sender, address(this), amount);
   }
@@ -90,6 +100,32 @@ contract DailyPayout is Ownable
     }
   }
 
+/**
+  * @dev
+  *   Claim epochs up to `endingEpoch` only, so that a long unclaimed history
+  *   can be settled over several transactions of bounded gas.
+  */
+  function claimUntil(address owner, uint256 endingEpoch) external {
+    require(owner == msg.sender, "Can only claim for own account");
+    require(endingEpoch < currentEpoch(), "Ending epoch not distributed yet!");
+    _claimUntilEpoch(owner, endingEpoch);
+  }
+
+/**
+  * @dev
+  *   Settle every owner in one transaction, rewards going to the owners themselves.
+  *   The caller must be each owner or a claimer they set.
+  */
+  function claimMany(address[] calldata owners) external {
+    uint256 epoch = currentEpoch();
+    for (uint256 i = 0; i < owners.length; i++) {
+      require(owners[i] == msg.sender || isClaimer[owners[i]][msg.sender], "Not authorized to claim for owner");
+      if (epoch > 0) {
+        _claimUntilEpoch(owners[i], epoch.sub(1));
+      }
+    }
+  }
+
   function getClaimable(address owner) external view returns(uint256) {
     uint256 epoch = currentEpoch();
     if (epoch == 0) return 0;
@@ -97,6 +133,12 @@ contract DailyPayout is Ownable
     return amount;
   }
 
+  function getClaimableUntil(address owner, uint256 endingEpoch) external view returns(uint256) {
+    require(endingEpoch < currentEpoch(), "Ending epoch not distributed yet!");
+    (uint256 amount, ) = _getClaimableUntilEpoch(owner, endingEpoch);
+    return amount;
+  }
+
 /**
   * @dev get current epoch
   */
@@ -124,10 +166,11 @@ contract DailyPayout is Ownable
     uint256 epoch = 0;
     uint256 blockHeightAtEpochStartTime;
     uint256 totalSupply;
+    uint256 snapshots = totalSupplyForEpoch.length;
     for (epoch = claimedEpoches[owner]; epoch <= endingEpoch; epoch++) {
       blockHeightAtEpochStartTime = _getEpochStartBlockHeight(epoch);
       if (block.number <= blockHeightAtEpochStartTime) break;
-      totalSupply = vested.totalSupplyAt(blockHeightAtEpochStartTime);
+      totalSupply = epoch < snapshots ? totalSupplyForEpoch[epoch] : vested.totalSupplyAt(blockHeightAtEpochStartTime);
       if (totalSupply > 0) {
         amount += payoutForEpoch[epoch].mul(vested.balanceOfAt(owner, blockHeightAtEpochStartTime)).div(totalSupply);
       }
@@ -136,6 +179,7 @@ contract DailyPayout is Ownable
   }
 
   function _claimUntilEpoch(address owner, uint256 endingEpoch) internal {
+    _snapshotTotalSupply(endingEpoch);
     (uint256 amount, uint256 lastClaimedEpoch) = _getClaimableUntilEpoch(owner, endingEpoch);
     claimedEpoches[owner] = lastClaimedEpoch.add(1);
     if (amount > 0) {
@@ -144,12 +188,30 @@ contract DailyPayout is Ownable
     }
   }
 
+ /**
+  * @dev
+  *   Record the veFLEX total supply of every started epoch up to `endingEpoch` not recorded yet,
+  *   once the start block height is set.
+  *   veFLEX is checkpointed first: `totalSupplyAt` of a block after the last global point is
+  *   extrapolated to the current block and would still drift, whereas between two points it is final.
+  */
+  function _snapshotTotalSupply(uint256 endingEpoch) internal {
+    uint256 epoch = totalSupplyForEpoch.length;
+    if (startBlockHeight == 0 || epoch > endingEpoch || block.number <= _getEpochStartBlockHeight(epoch)) return; // epochs not placed yet, or nothing new started
+    vested.checkpoint();
+    for (; epoch <= endingEpoch; epoch++) {
+      uint256 blockHeightAtEpochStartTime = _getEpochStartBlockHeight(epoch);
+      if (block.number <= blockHeightAtEpochStartTime) break;
+      totalSupplyForEpoch.push(vested.totalSupplyAt(blockHeightAtEpochStartTime));
+    }
+  }
+
  /**
   * @dev 
   *   Given epoch number, get the epoch start block height.
   */
   function _getEpochStartBlockHeight(uint256 epoch) internal view returns(uint256) {
-    return startBlockHeight.add(EPOCH_BLOCKS.mul(epoch));
+    return startBlockHeight.add(_epochBlocks().mul(epoch));
   }
 
  /**
@@ -157,6 +219,13 @@ contract DailyPayout is Ownable
   */
   function _getCurrentEpoch() internal view returns(uint256) {
     require(block.number >= startBlockHeight, 'The payout contract is not started yet');
-    return (block.number - startBlockHeight).div(EPOCH_BLOCKS);
+    return (block.number - startBlockHeight).div(_epochBlocks());
+  }
+
+ /**
+  * @dev Length of an epoch in blocks, shortened by the test mocks.
+  */
+  function _epochBlocks() internal view virtual returns(uint256) {
+    return EPOCH_BLOCKS;
   }
 } 
\ No newline at end of file
@@ -0,0 +1,172 @@
+// SPDX-License-Identifier: MIT
+pragma solidity ^0.8.0;
+
+import '@openzeppelin/contracts/access/Ownable.sol';
+import '@openzeppelin/contracts/token/ERC20/IERC20.sol';
+import '@openzeppelin/contracts/token/ERC20/utils/SafeERC20.sol';
+import '@openzeppelin/contracts/utils/cryptography/MerkleProof.sol';
+import '@openzeppelin/contracts/utils/math/SafeMath.sol';
+
+/**
+  * @dev
+  *   Payout variant where per-holder entitlements are computed off-chain from veFLEX
+  *   snapshots (see `scripts/utils/merkle.py`) and published as a Merkle root over
+  *   (owner, cumulative entitlement) leaves. A claim costs one proof verification
+  *   regardless of how many epochs are pending.
+  */
+contract MerklePayout is Ownable
+{
+  using SafeERC20 for IERC20;
+  using SafeMath for uint256;
+
+  /* =========  MEMBER VARS ========== */
+  IERC20 immutable public token;  // FLEX token
+  uint256 public constant EPOCH_BLOCKS = 15730; // 10 is for test and 15730 is average blocks in 1 day
+  uint256 public startBlockHeight;
+  uint256[] public payoutForEpoch;
+  bytes32 public merkleRoot;  // root over keccak256(abi.encodePacked(owner, cumulativeAmount)) leaves
+  uint256 public rootEpochs;  // number of epochs, counted from epoch 0, covered by merkleRoot
+  uint256 public coveredPayout; // sum of payoutForEpoch over the epochs covered by merkleRoot
+  uint256 public totalClaimed;  // sum of all claims, never above coveredPayout
+  mapping(address => uint256) public claimedAmount; // cumulative amount already paid out per owner
+  mapping(address => bool) public isDistributor;
+  mapping(address => bool) public isOperator;
+
+  /* ===========   EVENTS  =========== */
+  event Claim(address indexed from, uint256 amount, uint256 cumulativeAmount);
+  event IsDistributor(address indexed account, bool status);
+  event IsOperator(address indexed account, bool status);
+  event Distribute(address distributor, uint256 amount);
+  event MerkleRootUpdated(bytes32 root, uint256 epochs);
+  /* ========== CONSTRUCTOR ========== */
+  constructor(address tknAddr)
+  {
+    require(tknAddr != address(0), 'Token address cannot be zero.');  // FLEX token
+    token = IERC20(tknAddr);
+  }
+
+  function addDistributor(address account) public onlyOwner {
+    require(account != address(0), 'Account address cannot be zero');
+    isDistributor[account] = true;
+    emit IsDistributor(account, true);
+  }
+
+  function removeDistributor(address account) public onlyOwner {
+    require(account != address(0), 'Account address cannot be zero');
+    isDistributor[account] = false;
+    emit IsDistributor(account, false);
+  }
+
+  function addOperator(address account) public onlyOwner {
+    require(account != address(0), 'Account address cannot be zero');
+    isOperator[account] = true;
+    emit IsOperator(account, true);
+  }
+
+  function removeOperator(address account) public onlyOwner {
+    require(account != address(0), 'Account address cannot be zero');
+    isOperator[account] = false;
+    emit IsOperator(account, false);
+  }
+
+  function setStartBlockHeight(uint256 blockHeight) public onlyOwner {
+    require(startBlockHeight == 0, "Start block height already set!");
+    startBlockHeight = blockHeight;
+  }
+
+  function distribute(uint256 amount) external {
+    require(msg.sender == owner() || isDistributor[msg.sender], "Distributor not authorized!");
+    require(amount > 0, "Amount to be distributed must be greater than zero!");
+    payoutForEpoch.push(amount);
+    emit Distribute(msg.sender, amount);
+    token.safeTransferFrom(msg.sender, address(this), amount);
+  }
+
+ /**
+  * @dev
+  *   Publish the root of cumulative entitlements for epochs `0` to `epochs - 1`.
+  *   Entitlements only ever grow, so owners keep what they already claimed.
+  */
+  function setMerkleRoot(bytes32 root, uint256 epochs) external {
+    require(msg.sender == owner() || isOperator[msg.sender], "Not authorized!");
+    require(epochs >= rootEpochs, "Cannot roll back covered epochs!");
+    require(epochs <= payoutForEpoch.length, "Cannot cover undistributed epochs!");
+    require(epochs == 0 || block.number > _getEpochStartBlockHeight(epochs - 1), "Cannot cover epochs not yet started!");
+    for (uint256 epoch = rootEpochs; epoch < epochs; epoch++) {
+      coveredPayout = coveredPayout.add(payoutForEpoch[epoch]);
+    }
+    merkleRoot = root;
+    rootEpochs = epochs;
+    emit MerkleRootUpdated(root, epochs);
+  }
+
+ /**
+  * @dev
+  *   This is not current epoch, but rather the number of claimable epochs.
+  *   Name not changed for the sake of compatibility with former implementation.
+  */
+  function currentEpoch() public view returns(uint256) {
+    return payoutForEpoch.length;
+  }
+
+  function claim(address owner, uint256 cumulativeAmount, bytes32[] calldata proof) external {
+    require(owner == msg.sender, "Can only claim for own account");
+    uint256 amount = _getClaimable(owner, cumulativeAmount, proof);
+    totalClaimed = totalClaimed.add(amount);
+    require(totalClaimed <= coveredPayout, "Claims exceed covered payouts!"); // an inflated root cannot drain other holders' tokens
+    claimedAmount[owner] = cumulativeAmount;
+    if (amount > 0) {
+      emit Claim(owner, amount, cumulativeAmount);
+      token.safeTransfer(owner, amount);
+    }
+  }
+
+  function getClaimable(address owner, uint256 cumulativeAmount, bytes32[] calldata proof) external view returns(uint256) {
+    return _getClaimable(owner, cumulativeAmount, proof);
+  }
+
+/**
+  * @dev get current epoch
+  */
+  function getCurrentEpoch() external view returns(uint256) {
+    require(msg.sender == owner() || isOperator[msg.sender], "Not authorized!");
+    return _getCurrentEpoch();
+  }
+
+/**
+  * @dev get epoch start block height
+  */
+  function getEpochStartBlockHeight(uint256 epoch) external view returns(uint256) {
+    require(msg.sender == owner() || isOperator[msg.sender], "Not authorized!");
+    return _getEpochStartBlockHeight(epoch);
+  }
+
+  function _getClaimable(address owner, uint256 cumulativeAmount, bytes32[] calldata proof) internal view returns(uint256) {
+    bytes32 leaf = keccak256(abi.encodePacked(owner, cumulativeAmount));
+    require(MerkleProof.verify(proof, merkleRoot, leaf), "Invalid Merkle proof!");
+    return cumulativeAmount.sub(claimedAmount[owner], "Entitlement already claimed!");
+  }
+
+ /**
+  * @dev
+  *   Given epoch number, get the epoch start block height.
+  */
+  function _getEpochStartBlockHeight(uint256 epoch) internal view returns(uint256) {
+    return startBlockHeight.add(_epochBlocks().mul(epoch));
+  }
+
+ /**
+  * @dev This is the actual current epoch.
+  */
+  function _getCurrentEpoch() internal view returns(uint256) {
+    require(block.number >= startBlockHeight, 'The payout contract is not started yet');
+    return (block.number - startBlockHeight).div(_epochBlocks());
+  }
+
+ /**
+  * @dev Length of an epoch in blocks, shortened by the test mocks.
+  */
+  function _epochBlocks() internal view virtual returns(uint256) {
+    return EPOCH_BLOCKS;
+  }
+}
@@ -0,0 +1,18 @@
+// SPDX-License-Identifier: MIT
+pragma solidity ^0.8.0;
+
+import '../AccumulatorPayout.sol';
+
+/**
+  * @dev AccumulatorPayout with 10-block epochs, so that tests can go through many epochs on a local chain.
+  */
+contract AccumulatorPayoutMock is AccumulatorPayout
+{
+  uint256 public constant MOCK_EPOCH_BLOCKS = 10;
+
+  constructor(address tknAddr, address veAddr) AccumulatorPayout(tknAddr, veAddr) {}
+
+  function _epochBlocks() internal pure override returns(uint256) {
+    return MOCK_EPOCH_BLOCKS;
+  }
+}
@@ -0,0 +1,18 @@
+// SPDX-License-Identifier: MIT
+pragma solidity ^0.8.0;
+
+import '../MerklePayout.sol';
+
+/**
+  * @dev MerklePayout with 10-block epochs, so that tests can go through many epochs on a local chain.
+  */
+contract MerklePayoutMock is MerklePayout
+{
+  uint256 public constant MOCK_EPOCH_BLOCKS = 10;
+
+  constructor(address tknAddr) MerklePayout(tknAddr) {}
+
+  function _epochBlocks() internal pure override returns(uint256) {
+    return MOCK_EPOCH_BLOCKS;
+  }
+}
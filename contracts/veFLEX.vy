@@ -81,6 +81,7 @@ event Supply:
 WEEK: constant(uint256) = 7 * 86400  # all future times are rounded by week
 MAXTIME: constant(uint256) = 4 * 365 * 86400  # 4 years
 MULTIPLIER: constant(uint256) = 10 ** 18
+MAX_BATCH: constant(uint256) = 64  # entries of `balanceOfAtMany` and `totalSupplyAtMany`
 
 token: public(address)
 supply: public(uint256)
@@ -221,12 +222,13 @@ def locked__end(_addr: address) -> uint256:
   return self.locked[_addr].end
 
 @internal
-def _checkpoint(addr: address, old_locked: LockedBalance, new_locked: LockedBalance):
+def _checkpoint(addr: address, old_locked: LockedBalance, new_locked: LockedBalance, max_weeks: uint256):
   '''
   @notice Record global and per-user data to checkpoint
   @param addr User's wallet address. No user checkpoint if 0x0
   @param old_locked Pevious locked amount / end lock time for the user
   @param new_locked New locked amount / end lock time for the user
+  @param max_weeks Stop filling history after this many weeks; only global checkpoints may stop short of now
   '''
   u_old: Point = empty(Point)
   u_new: Point = empty(Point)
@@ -266,9 +268,13 @@ def _checkpoint(addr: address, old_locked: LockedBalance, new_locked: LockedBala
   # But that's ok b/c we know the block in such case
   # Go over weeks to fill history and calculate what the current point is
   t_i: uint256 = (last_checkpoint / WEEK) * WEEK
+  n_weeks: uint256 = 0
   for i in range(255):
     # Hopefully it won't happen that this won't get used in 5 years!
     # If it does, users will be able to withdraw but vote weight will be broken
+    if n_weeks >= max_weeks:
+      break  # last week point is already recorded below
+    n_weeks += 1
     t_i += WEEK
     d_slope: int128 = 0
     if t_i > block.timestamp:
@@ -347,7 +353,7 @@ def _deposit_for(_addr: address, _value: uint256, unlock_time: uint256, locked_b
   # Both old_locked.end could be current or expired (>/< block.timestamp)
   # value == 0 (extend lock) or value > 0 (add to lock or extend lock)
   # _locked.end > block.timestamp (always)
-  self._checkpoint(_addr, old_locked, _locked)
+  self._checkpoint(_addr, old_locked, _locked, 255)
   if _value != 0:
     assert ERC20(self.token).transferFrom(_addr, self, _value)
   log Deposit(_addr, _value, _locked.end, type, block.timestamp)
@@ -359,7 +365,18 @@ def checkpoint():
   '''
   @notice Record global data to checkpoint
   '''
-  self._checkpoint(ZERO_ADDRESS, empty(LockedBalance), empty(LockedBalance))
+  self._checkpoint(ZERO_ADDRESS, empty(LockedBalance), empty(LockedBalance), 255)
+
+@external
+def checkpoint_n(max_weeks: uint256):
+  '''
+  @notice Record global data to checkpoint, filling at most `max_weeks` weeks of history
+  @dev Lets keepers catch up a stale history in bounded steps instead of
+       leaving the whole walk to the next user transaction
+  @param max_weeks Number of weekly points to fill at most
+  '''
+  assert max_weeks > 0, 'Must fill at least one week'
+  self._checkpoint(ZERO_ADDRESS, empty(LockedBalance), empty(LockedBalance), max_weeks)
 
 @external
 @nonreentrant('lock')
@@ -444,7 +461,7 @@ def withdraw():
   # old_locked can have either expired <= timestamp or zero end
   # _locked has only 0 end
   # Both can have >= 0 amount
-  self._checkpoint(msg.sender, old_locked, _locked)
+  self._checkpoint(msg.sender, old_locked, _locked, 255)
   assert ERC20(self.token).transfer(msg.sender, value)
   log Withdraw(msg.sender, value, block.timestamp)
   log Supply(supply_before, supply_before - value)
@@ -462,8 +479,21 @@ def find_block_epoch(_block: uint256, max_epoch: uint256) -> uint256:
   @param max_epoch Don't go beyond this epoch
   @return Approximate timestamp for block
   '''
+  return self.find_block_epoch_from(_block, 0, max_epoch)
+
+@internal
+@view
+def find_block_epoch_from(_block: uint256, min_epoch: uint256, max_epoch: uint256) -> uint256:
+  '''
+  @notice Binary search for the global epoch of `_block`, starting from a known lower bound
+  @dev `point_history[min_epoch].blk` must not be after `_block`
+  @param _block Block to find
+  @param min_epoch Don't go below this epoch
+  @param max_epoch Don't go beyond this epoch
+  @return Global epoch
+  '''
   # Binary search
-  _min: uint256 = 0
+  _min: uint256 = min_epoch
   _max: uint256 = max_epoch
   for i in range(128):  # Will be always enough for 128-bit numbers
     if _min >= _max:
@@ -495,22 +525,18 @@ def balanceOf(addr: address, _t: uint256 = block.timestamp) -> uint256:
       last_point.bias = 0
     return convert(last_point.bias, uint256)
 
-@external
+@internal
 @view
-def balanceOfAt(addr: address, _block: uint256) -> uint256:
+def find_user_epoch(addr: address, _block: uint256, max_epoch: uint256) -> uint256:
   '''
-  @notice Measure voting power of `addr` at block height `_block`
-  @dev Adheres to MiniMe `balanceOfAt` interface: https://github.com/Giveth/minime
+  @notice Binary search for the last user point of `addr` at or before `_block`
   @param addr User's wallet address
-  @param _block Block to calculate the voting power at
-  @return Voting power
+  @param _block Block to find
+  @param max_epoch Don't go beyond this epoch
+  @return User epoch
   '''
-  # Copying and pasting totalSupply code because Vyper cannot pass by
-  # reference yet
-  assert _block <= block.number
-  # Binary search
   _min: uint256 = 0
-  _max: uint256 = self.user_point_epoch[addr]
+  _max: uint256 = max_epoch
   for i in range(128):  # Will be always enough for 128-bit numbers
     if _min >= _max:
       break
@@ -519,9 +545,47 @@ def balanceOfAt(addr: address, _block: uint256) -> uint256:
       _min = _mid
     else:
       _max = _mid - 1
-  upoint: Point = self.user_point_history[addr][_min]
+  return _min
+
+@internal
+@view
+def hinted_block_epoch(_block: uint256, max_epoch: uint256, hint: uint256) -> uint256:
+  '''
+  @notice Global epoch of `_block`, taking `hint` when it brackets `_block`
+  @dev Returns the same epoch as `find_block_epoch`; a wrong hint costs the search on top of the check
+  '''
+  if hint <= max_epoch:
+    if hint == 0 or self.point_history[hint].blk <= _block:
+      if hint == max_epoch:
+        return hint
+      if self.point_history[hint + 1].blk > _block:
+        return hint
+  return self.find_block_epoch(_block, max_epoch)
+
+@internal
+@view
+def hinted_user_epoch(addr: address, _block: uint256, max_epoch: uint256, hint: uint256) -> uint256:
+  '''
+  @notice User epoch of `addr` at `_block`, taking `hint` when it brackets `_block`
+  @dev Returns the same epoch as `find_user_epoch`; a wrong hint costs the search on top of the check
+  '''
+  if hint <= max_epoch:
+    if hint == 0 or self.user_point_history[addr][hint].blk <= _block:
+      if hint == max_epoch:
+        return hint
+      if self.user_point_history[addr][hint + 1].blk > _block:
+        return hint
+  return self.find_user_epoch(addr, _block, max_epoch)
+
+@internal
+@view
+def block_time_at(_block: uint256, _epoch: uint256) -> uint256:
+  '''
+  @notice Timestamp of `_block` interpolated between the global points around it
+  @param _block Block to estimate the timestamp of
+  @param _epoch Global epoch of `_block`
+  '''
   max_epoch: uint256 = self.epoch
-  _epoch: uint256 = self.find_block_epoch(_block, max_epoch)
   point_0: Point = self.point_history[_epoch]
   d_block: uint256 = 0
   d_t: uint256 = 0
@@ -535,12 +599,73 @@ def balanceOfAt(addr: address, _block: uint256) -> uint256:
   block_time: uint256 = point_0.ts
   if d_block != 0:
     block_time += d_t * (_block - point_0.blk) / d_block
+  return block_time
+
+@internal
+@view
+def balance_at(addr: address, user_epoch: uint256, block_time: uint256) -> uint256:
+  '''
+  @notice Voting power of `addr` at `block_time`, given the user epoch of the block
+  '''
+  upoint: Point = self.user_point_history[addr][user_epoch]
   upoint.bias -= upoint.slope * convert(block_time - upoint.ts, int128)
   if upoint.bias >= 0:
     return convert(upoint.bias, uint256)
   else:
     return 0
 
+@external
+@view
+def balanceOfAt(addr: address, _block: uint256) -> uint256:
+  '''
+  @notice Measure voting power of `addr` at block height `_block`
+  @dev Adheres to MiniMe `balanceOfAt` interface: https://github.com/Giveth/minime
+  @param addr User's wallet address
+  @param _block Block to calculate the voting power at
+  @return Voting power
+  '''
+  assert _block <= block.number
+  user_epoch: uint256 = self.find_user_epoch(addr, _block, self.user_point_epoch[addr])
+  return self.balance_at(addr, user_epoch, self.block_time_at(_block, self.find_block_epoch(_block, self.epoch)))
+
+@external
+@view
+def balanceOfAtHinted(addr: address, _block: uint256, user_epoch_hint: uint256, epoch_hint: uint256) -> uint256:
+  '''
+  @notice Same as `balanceOfAt`, with the epochs of `_block` supplied by the caller
+  @dev Hints are only checked against their neighbouring points; wrong hints fall back to the binary searches
+  @param addr User's wallet address
+  @param _block Block to calculate the voting power at
+  @param user_epoch_hint Last index of `user_point_history[addr]` with `blk <= _block`
+  @param epoch_hint Last index of `point_history` with `blk <= _block`
+  @return Voting power
+  '''
+  assert _block <= block.number
+  user_epoch: uint256 = self.hinted_user_epoch(addr, _block, self.user_point_epoch[addr], user_epoch_hint)
+  return self.balance_at(addr, user_epoch, self.block_time_at(_block, self.hinted_block_epoch(_block, self.epoch, epoch_hint)))
+
+@external
+@view
+def balanceOfAtMany(addrs: address[MAX_BATCH], _block: uint256) -> uint256[MAX_BATCH]:
+  '''
+  @notice Voting power of up to `MAX_BATCH` addresses at block height `_block`
+  @dev The global epoch and timestamp of `_block` are resolved once for all addresses.
+       Unused entries are padded with `ZERO_ADDRESS`; evaluation stops at the first one.
+  @param addrs Users' wallet addresses
+  @param _block Block to calculate the voting power at
+  @return Voting power of each address, zero for the padding
+  '''
+  assert _block <= block.number
+  balances: uint256[MAX_BATCH] = empty(uint256[MAX_BATCH])
+  block_time: uint256 = self.block_time_at(_block, self.find_block_epoch(_block, self.epoch))
+  i: uint256 = 0
+  for addr in addrs:
+    if addr == ZERO_ADDRESS:
+      break
+    balances[i] = self.balance_at(addr, self.find_user_epoch(addr, _block, self.user_point_epoch[addr]), block_time)
+    i += 1
+  return balances
+
 @internal
 @view
 def supply_at(point: Point, t: uint256) -> uint256:
@@ -580,17 +705,13 @@ def totalSupply(t: uint256 = block.timestamp) -> uint256:
   last_point: Point = self.point_history[_epoch]
   return self.supply_at(last_point, t)
 
-@external
+@internal
 @view
-def totalSupplyAt(_block: uint256) -> uint256:
+def supply_at_block(_block: uint256, target_epoch: uint256) -> uint256:
   '''
-  @notice Calculate total voting power at some point in the past
-  @param _block Block to calculate the total voting power at
-  @return Total voting power at `_block`
+  @notice Total voting power at `_block`, given the global epoch of `_block`
   '''
-  assert _block <= block.number
   _epoch: uint256 = self.epoch
-  target_epoch: uint256 = self.find_block_epoch(_block, _epoch)
   point: Point = self.point_history[target_epoch]
   dt: uint256 = 0
   if target_epoch < _epoch:
@@ -603,6 +724,57 @@ def totalSupplyAt(_block: uint256) -> uint256:
   # Now dt contains info on how far are we beyond point
   return self.supply_at(point, point.ts + dt)
 
+@external
+@view
+def totalSupplyAt(_block: uint256) -> uint256:
+  '''
+  @notice Calculate total voting power at some point in the past
+  @param _block Block to calculate the total voting power at
+  @return Total voting power at `_block`
+  '''
+  assert _block <= block.number
+  return self.supply_at_block(_block, self.find_block_epoch(_block, self.epoch))
+
+@external
+@view
+def totalSupplyAtHinted(_block: uint256, epoch_hint: uint256) -> uint256:
+  '''
+  @notice Same as `totalSupplyAt`, with the global epoch of `_block` supplied by the caller
+  @dev The hint is only checked against its neighbouring points; a wrong hint falls back to the binary search
+  @param _block Block to calculate the total voting power at
+  @param epoch_hint Last index of `point_history` with `blk <= _block`
+  @return Total voting power at `_block`
+  '''
+  assert _block <= block.number
+  return self.supply_at_block(_block, self.hinted_block_epoch(_block, self.epoch, epoch_hint))
+
+@external
+@view
+def totalSupplyAtMany(blocks: uint256[MAX_BATCH]) -> uint256[MAX_BATCH]:
+  '''
+  @notice Total voting power at up to `MAX_BATCH` block heights
+  @dev While `blocks` ascend, each epoch search starts from the epoch of the previous block.
+       Unused entries are padded with zero; evaluation stops at the first one.
+  @param blocks Blocks to calculate the total voting power at
+  @return Total voting power at each block, zero for the padding
+  '''
+  supplies: uint256[MAX_BATCH] = empty(uint256[MAX_BATCH])
+  max_epoch: uint256 = self.epoch
+  _epoch: uint256 = 0
+  prev_block: uint256 = 0
+  i: uint256 = 0
+  for _block in blocks:
+    if _block == 0:
+      break
+    assert _block <= block.number
+    if _block < prev_block:
+      _epoch = 0
+    _epoch = self.find_block_epoch_from(_block, _epoch, max_epoch)
+    supplies[i] = self.supply_at_block(_block, _epoch)
+    prev_block = _block
+    i += 1
+  return supplies
+
 # Dummy methods for compatibility with Aragon
 @external
 def changeController(_newController: address):
@@ -3,8 +3,17 @@ pragma solidity ^0.8.0;
 
 interface IVested {
   function deposit_for(address, uint256) external;
+  function checkpoint() external;
   function balanceOf(address addr, uint256 timestamp) external view returns(uint256);
   function balanceOfAt(address addr, uint256 _block) external view returns(uint256);
   function totalSupply(uint256 timestamp) external view returns(uint256);
   function totalSupplyAt(uint256 _block) external view returns(uint256);
-}
\ No newline at end of file
+  function balanceOfAtHinted(address addr, uint256 _block, uint256 userEpochHint, uint256 epochHint) external view returns(uint256);
+  function totalSupplyAtHinted(uint256 _block, uint256 epochHint) external view returns(uint256);
+  function balanceOfAtMany(address[64] calldata addrs, uint256 _block) external view returns(uint256[64] memory);
+  function totalSupplyAtMany(uint256[64] calldata blocks) external view returns(uint256[64] memory);
+  function epoch() external view returns(uint256);
+  function point_history(uint256 epoch) external view returns(int128 bias, int128 slope, uint256 ts, uint256 blk);
+  function user_point_epoch(address addr) external view returns(uint256);
+  function user_point_history(address addr, uint256 epoch) external view returns(int128 bias, int128 slope, uint256 ts, uint256 blk);
+}
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3.7
+# coding:utf-8
+# Copyright (C) 2019-2021 All rights reserved.
+# FILENAME:  07-publish-merkle-root.py
+# VERSION: 	 1.0
+# CREATED: 	 2026-10-18 16:30
+# AUTHOR: 	 Aekasitt Guruvanich <sitt@coinflex.com>
+# DESCRIPTION:
+#   Computes cumulative entitlements from veFLEX snapshots, publishes their
+#   Merkle root to MerklePayout and writes every holder's proof to `build/merkle`.
+# HISTORY:
+#*************************************************************
+### Standard Packages ###
+import json
+import os
+from typing import List
+### Project Contract(s) ###
+from brownie import MerklePayout, veFLEX, web3
+### Third-Party Packages ###
+from brownie.network import Chain
+from brownie.network.gas.strategies import ExponentialScalingStrategy
+from eth_account.account import Account
+from yaml import safe_load
+### Local Modules ###
+from scripts.utils.merkle import build_tree
+from scripts.utils.multicall import BatchCaller
+from scripts.utils.wallet import load_account, TERM_RED, TERM_NFMT
+
+def main():
+  ### Load Account to use ###
+  chain: Chain  = Chain()
+  print(f'Network Chain-ID: { chain }')
+  acct: Account = load_account(chain)
+  if acct is None:
+    return
+
+  ### Loads Parameters ###
+  try:
+    with open('params/merkle-payout.yml', 'rb') as dep:
+      params: dict        = safe_load(dep)
+      payout_addr: str    = params.get('merkle_payout', None)
+      ve_flex_addr: str   = params.get('ve_flex', None)
+      holders: List[str]  = params.get('holders', None)
+      if payout_addr is None or not isinstance(payout_addr, str) or len(payout_addr) < 1:
+        print(f'{TERM_RED}Invalid `merkle_payout` parameter found in `params/merkle-payout.yml` file.{TERM_NFMT}')
+        return
+      elif ve_flex_addr is None or not isinstance(ve_flex_addr, str) or len(ve_flex_addr) < 1:
+        print(f'{TERM_RED}Invalid `ve_flex` parameter found in `params/merkle-payout.yml` file.{TERM_NFMT}')
+        return
+      elif holders is None or not isinstance(holders, list) or len(holders) < 1:
+        print(f'{TERM_RED}Invalid `holders` parameter found in `params/merkle-payout.yml` file.{TERM_NFMT}')
+        return
+  except FileNotFoundError:
+    print(f'{TERM_RED}Cannot find `params/merkle-payout.yml` file containing parameters.{TERM_NFMT}')
+    return
+
+  payout: MerklePayout = MerklePayout.at(payout_addr)
+  ve_flex: veFLEX      = veFLEX.at(ve_flex_addr)
+  block: int           = web3.eth.block_number
+
+  ### Cover every distributed epoch that has already started ###
+  start_block_height: int = payout.startBlockHeight()
+  epoch_blocks: int       = payout.EPOCH_BLOCKS()
+  epochs: int             = payout.currentEpoch()
+  while epochs > 0 and start_block_height + epoch_blocks * (epochs - 1) >= block:
+    epochs -= 1
+  if epochs <= payout.rootEpochs():
+    return print(f'Merkle root already covers {payout.rootEpochs()} epoch(s), nothing to publish')
+
+  ### Read snapshots in batches pinned to one block ###
+  caller   = BatchCaller()
+  heights  = [ start_block_height + epoch_blocks * i for i in range(epochs) ]
+  payouts  = [ caller.add(payout.payoutForEpoch, i) for i in range(epochs) ]
+  totals   = [ caller.add(ve_flex.totalSupplyAt, height) for height in heights ]
+  balances = [ [ caller.add(ve_flex.balanceOfAt, holder, height) for height in heights ] for holder in holders ]
+  results  = caller.execute(block)
+  tree     = build_tree(
+    holders,
+    [ [ results[index] for index in row ] for row in balances ],
+    [ results[index] for index in payouts ],
+    [ results[index] for index in totals ],
+  )
+  print(f'Entitled holders: {len(tree.owners)}, total entitlement: {sum(tree.entitlements.values())}')
+  print(f'Merkle root: 0x{tree.root.hex()} over {epochs} epoch(s)')
+
+  ### Write proofs before publishing so claimants can always find them ###
+  os.makedirs('build/merkle', exist_ok=True)
+  proof_path: str = f'build/merkle/{payout.address}-{epochs}.json'
+  with open(proof_path, 'w') as f:
+    json.dump(tree.to_dict(epochs), f, indent=2)
+  print(f'Proofs saved into: {proof_path}')
+
+  ### Set Gas Price ##
+  gas_strategy = ExponentialScalingStrategy('1.05 gwei', '5 gwei')
+  payout.setMerkleRoot(tree.root, epochs, { 'from': acct, 'gas_price': gas_strategy })
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3.7
+# coding:utf-8
+# Copyright (C) 2019-2021 All rights reserved.
+# FILENAME:  08-claim-many.py
+# VERSION: 	 1.0
+# CREATED: 	 2026-10-18 18:10
+# AUTHOR: 	 Aekasitt Guruvanich <sitt@coinflex.com>
+# DESCRIPTION:
+#   Claims for many owners through `claimMany`, chunking the owner list so that
+#   each transaction fits under a share of the block gas limit.
+# HISTORY:
+#*************************************************************
+### Standard Packages ###
+from typing import List
+### Project Contract(s) ###
+from brownie import DailyPayout, web3
+### Third-Party Packages ###
+from brownie.network import Chain
+from brownie.network.gas.strategies import ExponentialScalingStrategy
+from eth_account.account import Account
+from yaml import safe_load
+### Local Modules ###
+from scripts.utils.claims import chunk_owners
+from scripts.utils.wallet import load_account, TERM_RED, TERM_NFMT
+
+def main():
+  ### Load Account to use ###
+  chain: Chain  = Chain()
+  print(f'Network Chain-ID: { chain }')
+  acct: Account = load_account(chain)
+  if acct is None:
+    return
+
+  ### Loads Parameters ###
+  try:
+    with open('params/claim-many.yml', 'rb') as dep:
+      params: dict        = safe_load(dep)
+      payout_addr: str    = params.get('payout', None)
+      owners: List[str]   = params.get('owners', None)
+      gas_share: float    = params.get('gas_share', 0.5)
+      if payout_addr is None or not isinstance(payout_addr, str) or len(payout_addr) < 1:
+        print(f'{TERM_RED}Invalid `payout` parameter found in `params/claim-many.yml` file.{TERM_NFMT}')
+        return
+      elif owners is None or not isinstance(owners, list) or len(owners) < 1:
+        print(f'{TERM_RED}Invalid `owners` parameter found in `params/claim-many.yml` file.{TERM_NFMT}')
+        return
+      elif not isinstance(gas_share, (int, float)) or not 0 < gas_share <= 1:
+        print(f'{TERM_RED}Invalid `gas_share` parameter found in `params/claim-many.yml` file.{TERM_NFMT}')
+        return
+  except FileNotFoundError:
+    print(f'{TERM_RED}Cannot find `params/claim-many.yml` file containing parameters.{TERM_NFMT}')
+    return
+
+  ### Owners must have set the account as their claimer ###
+  payout: DailyPayout     = DailyPayout.at(payout_addr)
+  unauthorized: List[str] = [ owner for owner in owners if owner.lower() != acct.address.lower() and not payout.isClaimer(owner, acct) ]
+  if len(unauthorized) > 0:
+    print(f'{TERM_RED}Account is not a claimer of: {", ".join(unauthorized)}{TERM_NFMT}')
+    return
+
+  ### Chunk under the gas budget, then claim ###
+  gas_budget: int = int(web3.eth.get_block('latest').gasLimit * gas_share)
+  chunks          = chunk_owners(lambda chunk: payout.claimMany.estimate_gas(chunk, { 'from': acct }), owners, gas_budget)
+  print(f'Claiming for {len(owners)} owner(s) in {len(chunks)} transaction(s) of at most {gas_budget} gas')
+  gas_strategy = ExponentialScalingStrategy('1.05 gwei', '5 gwei')
+  for i, chunk in enumerate(chunks):
+    txn = payout.claimMany(chunk, { 'from': acct, 'gas_price': gas_strategy })
+    print(f'Chunk {i + 1}/{len(chunks)}: {len(chunk)} owner(s), {txn.gas_used} gas')
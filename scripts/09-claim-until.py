@@ -0,0 +1,53 @@
+#!/usr/bin/env python3.7
+# coding:utf-8
+# Copyright (C) 2019-2021 All rights reserved.
+# FILENAME:  09-claim-until.py
+# VERSION: 	 1.0
+# CREATED: 	 2026-10-18 18:35
+# AUTHOR: 	 Aekasitt Guruvanich <sitt@coinflex.com>
+# DESCRIPTION:
+#   Settles a long unclaimed history through successive `claimUntil` windows,
+#   each the largest range of epochs fitting a share of the block gas limit.
+# HISTORY:
+#*************************************************************
+### Project Contract(s) ###
+from brownie import DailyPayout, web3
+### Third-Party Packages ###
+from brownie.network import Chain
+from brownie.network.gas.strategies import ExponentialScalingStrategy
+from eth_account.account import Account
+from yaml import safe_load
+### Local Modules ###
+from scripts.utils.claims import claim_in_windows
+from scripts.utils.wallet import load_account, TERM_RED, TERM_NFMT
+
+def main():
+  ### Load Account to use ###
+  chain: Chain  = Chain()
+  print(f'Network Chain-ID: { chain }')
+  acct: Account = load_account(chain)
+  if acct is None:
+    return
+
+  ### Loads Parameters ###
+  try:
+    with open('params/claim-until.yml', 'rb') as dep:
+      params: dict      = safe_load(dep)
+      payout_addr: str  = params.get('payout', None)
+      gas_share: float  = params.get('gas_share', 0.5)
+      if payout_addr is None or not isinstance(payout_addr, str) or len(payout_addr) < 1:
+        print(f'{TERM_RED}Invalid `payout` parameter found in `params/claim-until.yml` file.{TERM_NFMT}')
+        return
+      elif not isinstance(gas_share, (int, float)) or not 0 < gas_share <= 1:
+        print(f'{TERM_RED}Invalid `gas_share` parameter found in `params/claim-until.yml` file.{TERM_NFMT}')
+        return
+  except FileNotFoundError:
+    print(f'{TERM_RED}Cannot find `params/claim-until.yml` file containing parameters.{TERM_NFMT}')
+    return
+
+  payout: DailyPayout = DailyPayout.at(payout_addr)
+  gas_budget: int     = int(web3.eth.get_block('latest').gasLimit * gas_share)
+  print(f'Claimable: {payout.getClaimable(acct)}, from epoch {payout.claimedEpoches(acct)} to {payout.currentEpoch() - 1}')
+  gas_strategy = ExponentialScalingStrategy('1.05 gwei', '5 gwei')
+  receipts     = claim_in_windows(payout, acct, gas_budget, { 'gas_price': gas_strategy })
+  print(f'Settled in {len(receipts)} transaction(s) of at most {gas_budget} gas')
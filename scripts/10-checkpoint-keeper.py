@@ -0,0 +1,83 @@
+#!/usr/bin/env python3.7
+# coding:utf-8
+# Copyright (C) 2019-2021 All rights reserved.
+# FILENAME:  10-checkpoint-keeper.py
+# VERSION: 	 1.0
+# CREATED: 	 2026-10-18 19:00
+# AUTHOR: 	 Aekasitt Guruvanich <sitt@coinflex.com>
+# DESCRIPTION:
+#   Keeps veFLEX global history current with bounded `checkpoint_n` calls, so
+#   that the week walk is never left to the next user transaction.
+# HISTORY:
+#*************************************************************
+### Standard Packages ###
+import time
+### Project Contract(s) ###
+from brownie import veFLEX
+### Third-Party Packages ###
+from brownie.network import Chain
+from brownie.network.gas.strategies import ExponentialScalingStrategy
+from eth_account.account import Account
+from yaml import safe_load
+### Local Modules ###
+from scripts.utils.wallet import load_account, TERM_RED, TERM_NFMT
+
+WEEK: int = 7 * 86400
+
+def stale_weeks(ve_flex: veFLEX, now: int) -> int:
+  '''
+  Number of week boundaries passed since the last global point, i.e. left for the next checkpoint to walk
+  '''
+  _, _, ts, _ = ve_flex.point_history(ve_flex.epoch())
+  return now // WEEK - ts // WEEK
+
+def catch_up(ve_flex: veFLEX, acct: Account, max_weeks: int, gas_strategy) -> int:
+  '''
+  Calls `checkpoint_n(max_weeks)` until the global point is in the current week; returns the number of calls
+  '''
+  calls: int = 0
+  while stale_weeks(ve_flex, Chain().time()) > 0:
+    txn    = ve_flex.checkpoint_n(max_weeks, { 'from': acct, 'gas_price': gas_strategy })
+    calls += 1
+    print(f'checkpoint_n({max_weeks}): epoch {ve_flex.epoch()}, {txn.gas_used} gas')
+  return calls
+
+def main(once: str = 'false'):
+  ### Load Account to use ###
+  chain: Chain  = Chain()
+  print(f'Network Chain-ID: { chain }')
+  acct: Account = load_account(chain)
+  if acct is None:
+    return
+
+  ### Loads Parameters ###
+  try:
+    with open('params/checkpoint-keeper.yml', 'rb') as dep:
+      params: dict      = safe_load(dep)
+      ve_flex_addr: str = params.get('ve_flex', None)
+      max_weeks: int    = params.get('max_weeks', 8)
+      poll_seconds: int = params.get('poll_seconds', 3600)
+      if ve_flex_addr is None or not isinstance(ve_flex_addr, str) or len(ve_flex_addr) < 1:
+        print(f'{TERM_RED}Invalid `ve_flex` parameter found in `params/checkpoint-keeper.yml` file.{TERM_NFMT}')
+        return
+      elif not isinstance(max_weeks, int) or not 0 < max_weeks <= 255:
+        print(f'{TERM_RED}Invalid `max_weeks` parameter found in `params/checkpoint-keeper.yml` file.{TERM_NFMT}')
+        return
+      elif not isinstance(poll_seconds, int) or poll_seconds < 1:
+        print(f'{TERM_RED}Invalid `poll_seconds` parameter found in `params/checkpoint-keeper.yml` file.{TERM_NFMT}')
+        return
+  except FileNotFoundError:
+    print(f'{TERM_RED}Cannot find `params/checkpoint-keeper.yml` file containing parameters.{TERM_NFMT}')
+    return
+
+  ve_flex: veFLEX = veFLEX.at(ve_flex_addr)
+  gas_strategy    = ExponentialScalingStrategy('1.05 gwei', '5 gwei')
+  while True:
+    calls: int = catch_up(ve_flex, acct, max_weeks, gas_strategy)
+    if calls == 0:
+      print(f'veFLEX history is current at epoch {ve_flex.epoch()}')
+    if once.lower() == 'true':
+      return
+    ### Wake up shortly after the next week boundary, or at the next poll ###
+    now: int = chain.time()
+    time.sleep(min(poll_seconds, (now // WEEK + 1) * WEEK - now + 60))
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3.7
+# coding:utf-8
+# Copyright (C) 2019-2021 All rights reserved.
+# FILENAME:  11-distribution-keeper.py
+# VERSION: 	 1.0
+# CREATED: 	 2026-10-18 19:30
+# AUTHOR: 	 Aekasitt Guruvanich <sitt@coinflex.com>
+# DESCRIPTION:
+#   Long-running keeper calling `distribute()` on every configured Distributor
+#   holding FLEX, with pipelined transactions and throughput / latency metrics.
+# HISTORY:
+#*************************************************************
+### Standard Packages ###
+import time
+from typing import Dict
+### Project Contract(s) ###
+from brownie import Distributor, FLEXCoin
+### Third-Party Packages ###
+from brownie.network import Chain
+from brownie.network.gas.strategies import ExponentialScalingStrategy
+from eth_account.account import Account
+from yaml import safe_load
+### Local Modules ###
+from scripts.utils.keeper import DistributionKeeper
+from scripts.utils.wallet import load_account, TERM_RED, TERM_NFMT
+
+def main(once: str = 'false'):
+  ### Load Account to use ###
+  chain: Chain  = Chain()
+  print(f'Network Chain-ID: { chain }')
+  acct: Account = load_account(chain)
+  if acct is None:
+    return
+
+  ### Loads Parameters ###
+  try:
+    with open('params/distribution-keeper.yml', 'rb') as dep:
+      params: dict                = safe_load(dep)
+      flex_addr: str              = params.get('flex', None)
+      distributors: Dict[str, str] = params.get('distributors', None)
+      poll_seconds: int           = params.get('poll_seconds', 60)
+      metrics_path: str           = params.get('metrics_path', 'build/keeper/distribution-metrics.json')
+      if flex_addr is None or not isinstance(flex_addr, str) or len(flex_addr) < 1:
+        print(f'{TERM_RED}Invalid `flex` parameter found in `params/distribution-keeper.yml` file.{TERM_NFMT}')
+        return
+      elif distributors is None or not isinstance(distributors, dict) or len(distributors) < 1:
+        print(f'{TERM_RED}Invalid `distributors` parameter found in `params/distribution-keeper.yml` file.{TERM_NFMT}')
+        return
+      elif not isinstance(poll_seconds, (int, float)) or poll_seconds <= 0:
+        print(f'{TERM_RED}Invalid `poll_seconds` parameter found in `params/distribution-keeper.yml` file.{TERM_NFMT}')
+        return
+  except FileNotFoundError:
+    print(f'{TERM_RED}Cannot find `params/distribution-keeper.yml` file containing parameters.{TERM_NFMT}')
+    return
+
+  ### The account must be allowed on every Distributor ###
+  flex: FLEXCoin = FLEXCoin.at(flex_addr)
+  contracts      = { name: Distributor.at(addr) for name, addr in distributors.items() }
+  for name, distributor in contracts.items():
+    if distributor.admin() != acct.address and not distributor.isDistributor(acct):
+      print(f'{TERM_RED}Account is neither admin nor delegatee of `{name}` distributor at {distributor.address}.{TERM_NFMT}')
+      return
+
+  gas_strategy = ExponentialScalingStrategy('1.05 gwei', '5 gwei')
+  keeper       = DistributionKeeper(flex, contracts, acct, { 'gas_price': gas_strategy })
+  try:
+    while True:
+      keeper.poll()
+      keeper.save_metrics(metrics_path)
+      print(f'Metrics: {keeper.metrics.snapshot()}')
+      if once.lower() == 'true':
+        keeper.drain()
+        return
+      time.sleep(poll_seconds)
+  finally:
+    keeper.save_metrics(metrics_path)
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3.7
+# coding:utf-8
+# Copyright (C) 2019-2021 All rights reserved.
+# FILENAME:  12-deploy.py
+# VERSION: 	 1.0
+# CREATED: 	 2026-10-18 20:40
+# AUTHOR: 	 Aekasitt Guruvanich <sitt@coinflex.com>
+# DESCRIPTION:
+#   Deploys and configures the contracts described by a spec file (see
+#   `scripts/utils/deployer.py` for the format); rerun to resume a failed run.
+# HISTORY:
+#*************************************************************
+### Project Contract(s) ###
+from brownie import AccumulatorPayout, DailyPayout, Distributor, MerklePayout, QuarterlyPayout, veFLEX
+### Third-Party Packages ###
+from brownie.network import Chain
+from brownie.network.gas.strategies import ExponentialScalingStrategy
+from eth_account.account import Account
+from yaml import safe_load
+### Local Modules ###
+from scripts.utils.deployer import Deployer, DeploymentState
+from scripts.utils.wallet import load_account, TERM_RED, TERM_NFMT
+
+CONTAINERS = {
+  'AccumulatorPayout': AccumulatorPayout,
+  'DailyPayout': DailyPayout,
+  'Distributor': Distributor,
+  'MerklePayout': MerklePayout,
+  'QuarterlyPayout': QuarterlyPayout,
+  'veFLEX': veFLEX,
+}
+
+def main(spec_path: str = 'params/deploy.yml'):
+  ### Load Account to use ###
+  chain: Chain  = Chain()
+  print(f'Network Chain-ID: { chain }')
+  acct: Account = load_account(chain)
+  if acct is None:
+    return
+
+  ### Loads Deployment Spec ###
+  try:
+    with open(spec_path, 'rb') as dep:
+      spec: dict      = safe_load(dep)
+      gas_price: list = spec.get('gas_price', ['1.05 gwei', '5 gwei'])
+      if not isinstance(gas_price, list) or len(gas_price) != 2:
+        print(f'{TERM_RED}Invalid `gas_price` parameter found in `{ spec_path }` file.{TERM_NFMT}')
+        return
+  except FileNotFoundError:
+    print(f'{TERM_RED}Cannot find `{ spec_path }` file containing the deployment spec.{TERM_NFMT}')
+    return
+
+  ### Set Gas Price ##
+  gas_strategy = ExponentialScalingStrategy(*gas_price)
+
+  state: DeploymentState = DeploymentState.for_spec(chain._chainid, spec_path)
+  try:
+    deployer = Deployer(spec, CONTAINERS, acct, state, { 'gas_price': gas_strategy })
+  except ValueError as err:
+    print(f'{TERM_RED}Invalid spec `{ spec_path }`: { err }{TERM_NFMT}')
+    return
+  for number, level in enumerate(deployer.levels):
+    print(f'\tLevel { number }: { ", ".join(level) }')
+  try:
+    contracts = deployer.run()
+  finally:
+    for line in deployer.pipeline.report():
+      print(f'\t{ line }')
+
+  print(f'{TERM_RED}###DEPLOYMENT SUMMARY###{TERM_NFMT}')
+  for name, contract in contracts.items():
+    print(f'{ name } ({ spec["contracts"][name]["contract"] }): { contract }')
+  print(f'Progress kept at `{ state.path }`')
+  print(f'{TERM_RED}######END###############{TERM_NFMT}')
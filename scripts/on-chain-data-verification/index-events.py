@@ -0,0 +1,45 @@
+from typing import List
+from brownie.network import Chain
+from yaml import safe_load
+from scripts.utils.indexer import EventIndexer
+
+TERM_RED  = '\033[1;31m'
+TERM_NFMT = '\033[0;0m'
+
+def main(to_block: str = 'latest'):
+  '''
+  Indexes payout and distributor events into `build/cache/events.sqlite` and prints a summary.
+  Contracts are listed in `params/indexer.yml` as `name`, `address` and `start_block` entries.
+  Requires the ABIs exported by `scripts/tools/exportAllAbi.py`.
+  '''
+  chain = Chain()
+  print(f'Network Chain-ID: { chain }')
+  try:
+    with open('params/indexer.yml', 'rb') as f:
+      params: dict = safe_load(f)
+      contracts: List[dict] = params.get('contracts', None)
+      if contracts is None or not isinstance(contracts, list) or len(contracts) < 1:
+        print(f'{TERM_RED}Invalid `contracts` parameter found in `params/indexer.yml` file.{TERM_NFMT}')
+        return
+  except FileNotFoundError:
+    print(f'{TERM_RED}Cannot find `params/indexer.yml` file containing indexer parameters.{TERM_NFMT}')
+    return
+
+  indexer = EventIndexer()
+  for contract in contracts:
+    indexer.add_contract(contract['name'], contract['address'], contract.get('start_block', 0))
+  stored = indexer.sync(None if to_block == 'latest' else int(to_block))
+  print(f'\nIndexed {stored} new event(s)\n')
+
+  for contract in contracts:
+    address = contract['address']
+    print(f'{TERM_RED}== {contract["name"]} {address} =={TERM_NFMT}')
+    if contract['name'] in ('DailyPayout', 'QuarterlyPayout'):
+      distributions = indexer.distributions(address)
+      print(f'epochs distributed: {len(distributions)}, total: {sum(amount for _, _, amount in distributions)}')
+      claims = indexer.claim_totals(address)
+      print(f'claimants: {len(claims)}, total claimed: {sum(claims.values())}')
+    elif contract['name'] == 'Distributor':
+      for distributor, (calls, total) in indexer.delegatee_activity(address).items():
+        print(f'\t{distributor}: {calls} distribute call(s), {total} FLEX')
+    print('')
@@ -1,28 +1,148 @@
-from yaml.tokens import TagToken
-from brownie import veFLEX, DailyPayout
+from typing import Any, List, Optional, Union
+from brownie import veFLEX, DailyPayout, web3
 from brownie.network import accounts, Chain
 from yaml import safe_load
 from eth_account.account import Account, ValidationError
+from scripts.utils.async_rpc import AsyncCaller
+from scripts.utils.balance_store import BalanceStore
+from scripts.utils.hints import EpochHints
+from scripts.utils.holders import HolderSet
+from scripts.utils.log_scanner import LogScanner
+from scripts.utils.multicall import BatchCaller
+from scripts.utils.read_cache import ANY_BLOCK, ReadCache
+from scripts.utils.reconcile import ReconciliationState
+from scripts.utils.rewards import epoch_rewards
+from scripts.utils.ve_model import load_model
 
 TERM_RED  = '\033[1;31m'
 TERM_NFMT = '\033[0;0m'
 
-def main():
+def final_block(veflex: veFLEX, block: Optional[int] = None) -> int:
+  '''
+  veFLEX `*At` reads for blocks before its latest global point are bracketed by recorded points
+  and can never change; later blocks are still extrapolated to the chain head.
+  '''
+  epoch: int = veflex.epoch(block_identifier=block)
+  return veflex.point_history(epoch, block_identifier=block)[3]
+
+def read_point_blocks(veflex: veFLEX, block: int, caller: BatchCaller) -> List[int]:
+  '''
+  `point_history(i).blk` for `i` in `0..epoch()` at `block`, read in one batch. Bare `checkpoint()` calls
+  write global points without emitting an event, so these heights cannot be replayed from logs.
+  '''
+  epoch: int         = veflex.epoch(block_identifier=block)
+  points: List[int]  = [ caller.add(veflex.point_history, i, final=True) for i in range(epoch + 1) ]
+  results: List[Any] = caller.execute(block)
+  return [ results[index][3] for index in points ]
+
+def fetch_epochs(payout: DailyPayout, veflex: veFLEX, addresses: List[str], epochs: range, acct: Account, cache: Optional[ReadCache] = None) -> List[dict]:
+  '''
+  Reads every epoch one call at a time.
+  '''
+  finalized: int = final_block(veflex)
+  def read(call, *args, final: bool = True, tx: Optional[dict] = None):
+    if cache is None or not final:
+      return call(*args, tx) if tx is not None else call(*args)
+    return cache.call(call, *args, block=ANY_BLOCK, tx=tx)
+
+  records: List[dict] = []
+  for i in epochs:
+    # get epoch i start block height
+    start_block_height = read(payout.getEpochStartBlockHeight, i, tx={'from': acct})
+    final: bool = start_block_height < finalized
+    records.append({
+      'start_block_height': start_block_height,
+      'final': final,
+      # rewards in the epoch
+      'reward': read(payout.payoutForEpoch, i),
+      # veFlex total balance at the block height
+      'total_veflex': read(veflex.totalSupplyAt, start_block_height, final=final),
+      # addr veflex balance at the height
+      'balances': { addr: read(veflex.balanceOfAt, addr, start_block_height, final=final) for addr in addresses },
+    })
+  if cache is not None:
+    cache.commit()
+  return records
+
+def fetch_epochs_batched(payout: DailyPayout, veflex: veFLEX, addresses: List[str], epochs: range, block: int, caller: Union[AsyncCaller, BatchCaller], hints: Optional[EpochHints] = None) -> List[dict]:
+  '''
+  Reads every epoch through `caller`, either JSON-RPC batches or concurrent requests, pinned to `block`.
+  Epoch start heights are derived the same way as `DailyPayout._getEpochStartBlockHeight`,
+  so the only round trips left are the queued view calls themselves.
+  With `hints`, veFLEX reads go through the hinted variants and skip the on-chain binary searches.
+  '''
+  start_block_height: int = payout.startBlockHeight(block_identifier=block)
+  epoch_blocks: int       = payout.EPOCH_BLOCKS()
+  finalized: int          = final_block(veflex, block)
+  pending: List[dict]     = []
+  for i in epochs:
+    height: int = start_block_height + epoch_blocks * i
+    final: bool = height < finalized
+    pending.append({
+      'start_block_height': height,
+      'final': final,
+      'reward': caller.add(payout.payoutForEpoch, i, final=True),
+      'total_veflex': caller.add(veflex.totalSupplyAt, height, final=final) if hints is None else caller.add(veflex.totalSupplyAtHinted, *hints.supply_args(height), final=final),
+      'balances': {
+        addr: caller.add(veflex.balanceOfAt, addr, height, final=final) if hints is None else caller.add(veflex.balanceOfAtHinted, *hints.balance_args(addr, height), final=final)
+        for addr in addresses
+      },
+    })
+  print(f'Sending {len(caller)} calls pinned to block {block}')
+  results = caller.execute(block)
+  print(f'Completed in {caller.round_trips} round trip(s)\n')
+  return [{
+    'start_block_height': record['start_block_height'],
+    'final': record['final'],
+    'reward': results[record['reward']],
+    'total_veflex': results[record['total_veflex']],
+    'balances': { addr: results[index] for addr, index in record['balances'].items() },
+  } for record in pending]
+
+def report_epoch(i: int, record: dict, rewards: List[int]):
+  print(f'{TERM_RED}== Epoch {i} =={TERM_NFMT}')
+  print(f'start block height:   {record["start_block_height"]}')
+  reward: int = record['reward']
+  print(f'epoch total reward:   {reward}')
+  print(f'total veflex balance: {record["total_veflex"]}')
+
+  sum = 0
+  for (addr, addr_veflex), addr_reward in zip(record['balances'].items(), rewards):
+    print(f'\taddress: {addr}')
+    print(f'\tveflex:  {addr_veflex}')
+    print(f'\treward:  {addr_reward}')
+    sum += addr_reward
+
+  print(f'manually sum of addr reward: {sum}')
+  print(f'contract reward:             {reward}')
+  if sum == reward:
+    print(f'EQUAL')
+  elif sum < reward:
+    print(f'SMALLER!')
+  else:
+    print(f'{TERM_RED}BIGGER!{TERM_NFMT}')
+  print('\n')
+
+def main(mode: str = 'sequential', cache: str = 'on', rate_limit: str = 'none', hinted: str = 'off', store: str = 'off'):
+  '''
+  ---
+  :param: mode  `str`  `sequential` issues one call per value; `batch` packs all calls into JSON-RPC batches;
+    `async` issues the calls concurrently; `incremental` batches only the epochs added since the last
+    saved checkpoint under `build/cache`
+  :param: cache  `str`  `on` serves finalized historical reads from `build/cache`, `off` always asks the node
+  :param: rate_limit  `str`  maximum requests per second in `async` mode, `none` for unlimited
+  :param: hinted  `str`  `on` replays veFLEX locally and reads through `balanceOfAtHinted` / `totalSupplyAtHinted`
+    in `batch`, `async` and `incremental` modes; needs a veFLEX deployment that has them
+  :param: store  `str`  `on` appends the balances of finalized epochs to the memory-mapped store under `build/cache`
+    read by `scripts/utils/balance_store.py`
+  '''
   chain = Chain()
   print(f'Network Chain-ID: { chain }')
   chain_id = chain._chainid
   if chain_id != 10000:
     return print(f'{TERM_RED}network is not in smartbch-mainnet, exit!{TERM_NFMT}')
-
-  addresses = ['0x513b1C3941656b9f8e797693039256c6fF828d22',
-              '0x945e9704D2735b420363071bB935ACf2B9C4b814',
-              '0xfd8E76520296bddb6e3657Af11700F10CC165A98',
-              '0x81f056b3C93379dA0A22ed2De40909a333dF1164',
-              '0x83206707Bb189b811c71cc0d1B3Aa445Da27E4ce',
-              '0x72b3f018e1B9Db47d8C37Fd7549083395391a800',
-              '0x4Ef9435598f078661edF182D0671E4d737F4fc27',
-              '0xDDb3F8cD1303eF25a8dd8f2FA904a771a93DF1a5',
-              '0xd4dee0ADAEf1E4070e8d96F0F6C181c9DaA7270E']
+  if mode not in ('sequential', 'batch', 'async', 'incremental'):
+    return print(f'{TERM_RED}Unknown mode `{mode}`, expected `sequential`, `batch`, `async` or `incremental`.{TERM_NFMT}')
 
   payout_address = '0xe5B22d8240F479f34aBA4913A67964f3Df9dAFCc'
   payout = DailyPayout.at(payout_address)
@@ -47,45 +167,76 @@ def main():
   print(f'Account: {acct}')
   print(f'Balance: {balance}\n\n')
 
+  # every address that locked up to the pinned block, so the rewards of each epoch add up to its whole payout
+  block   = web3.eth.block_number
+  holders = HolderSet.load(chain_id, veFlex_address, veflex.point_history(0)[3])
+  scanner = LogScanner()
+  print(f'Found {holders.sync(scanner, block)} new holder(s) in {scanner.requests} log request(s)')
+  addresses = holders.holders(block)
+  print(f'Verifying rewards of {len(addresses)} holder(s)\n')
 
   epoch = min(payout.getCurrentEpoch({'from': acct}), payout.currentEpoch())
   print(f'Current epoch is {epoch}')
 
-  for i in range(epoch + 1):
-    print(f'{TERM_RED}== Epoch {i} =={TERM_NFMT}')
-    
-    # get epoch i start block height
-    start_block_height = payout.getEpochStartBlockHeight(i, {'from': acct})
-    print(f'start block height:   {start_block_height}')
-    # rewards in the epoch
-    reward = payout.payoutForEpoch(i)
-    print(f'epoch total reward:   {reward}')
-
-    # veFlex total balance at the block height
-    total_veflex = veflex.totalSupplyAt(start_block_height)
-    print(f'total veflex balance: {total_veflex}')
-
-    sum = 0
-    for addr in addresses:
-      print(f'\taddress: {addr}')
-      # addr veflex balance at the height
-      addr_veflex = veflex.balanceOfAt(addr, start_block_height)
-      
-      print(f'\tveflex:  {addr_veflex}')
-      # using integer divide to mimic solidity logic
-      if total_veflex == 0:
-        addr_reward = 0
-      else:
-        addr_reward = (reward * addr_veflex) // total_veflex
-      print(f'\treward:  {addr_reward}')
-      sum += addr_reward
-    
-    print(f'manually sum of addr reward: {sum}')
-    print(f'contract reward:             {reward}')
-    if sum == reward:
-      print(f'EQUAL')
-    elif sum < reward:
-      print(f'SMALLER!')
-    else:
-      print(f'{TERM_RED}BIGGER!{TERM_NFMT}')
-    print('\n')
\ No newline at end of file
+  # epochs past the last distribution have no `payoutForEpoch` entry yet
+  epochs = range(min(epoch + 1, payout.currentEpoch()))
+  state: ReconciliationState = None
+  if mode == 'incremental':
+    state  = ReconciliationState.load(payout_address, addresses, block, holders.first_block)
+    epochs = range(state.next_epoch, max(state.next_epoch, epochs.stop))
+    print(f'Resuming from epoch {state.next_epoch}, {len(epochs)} new epoch(s) to verify\n')
+  read_cache = ReadCache(chain_id) if cache == 'on' else None
+  hints: Optional[EpochHints] = None
+  if hinted == 'on':
+    # global point heights come from the chain; the replayed model only supplies the user points
+    model = load_model(veflex, block, verify=False)
+    hints = EpochHints(
+      read_point_blocks(veflex, block, BatchCaller(cache=read_cache)),
+      { addr: [ point.blk for point in history ] for addr, history in model.user_point_history.items() },
+    )
+    print(f'Built hints from { len(hints.point_blocks) } global point(s)\n')
+  if mode in ('batch', 'incremental'):
+    records = fetch_epochs_batched(payout, veflex, addresses, epochs, block, BatchCaller(cache=read_cache), hints)
+  elif mode == 'async':
+    caller  = AsyncCaller(rate_limit=None if rate_limit == 'none' else float(rate_limit), cache=read_cache)
+    records = fetch_epochs_batched(payout, veflex, addresses, epochs, block, caller, hints)
+    print(f'Retried requests: {caller.retried}\n')
+  else:
+    records = fetch_epochs(payout, veflex, addresses, epochs, acct, read_cache)
+  if read_cache is not None:
+    print(f'Cache hits: {read_cache.hits}, misses: {read_cache.misses}\n')
+    read_cache.close()
+
+  # integer division mimics solidity logic, see `scripts/utils/rewards.py`
+  rewards = epoch_rewards(
+    [ [ record['balances'][addr] for record in records ] for addr in addresses ],
+    [ record['reward'] for record in records ],
+    [ record['total_veflex'] for record in records ],
+  )
+  for column, (i, record) in enumerate(zip(epochs, records)):
+    report_epoch(i, record, [ int(row[column]) for row in rewards ])
+
+  if store == 'on':
+    balance_store = BalanceStore.for_payout(chain_id, payout_address)
+    # epochs are appended in order and only once their veFLEX reads can no longer change
+    for i, record in zip(epochs, records):
+      if i == len(balance_store) and record['final']:
+        balance_store.append_epoch(record['balances'])
+    print(f'Balance store holds {len(balance_store)} epoch(s) of {len(balance_store.holders)} holder(s)\n')
+    balance_store.close()
+
+  if state is None:
+    return
+  # only epochs whose veFLEX reads can no longer change are checkpointed
+  for column, (i, record) in enumerate(zip(epochs, records)):
+    if not record['final']:
+      break
+    state.record(i, record['reward'], { addr: int(row[column]) for addr, row in zip(addresses, rewards) })
+  state.save()
+  print(f'{TERM_RED}== Reconciled epochs 0 to {state.next_epoch - 1} =={TERM_NFMT}')
+  print(f'total contract payout: {state.total_payout}')
+  print(f'total addr rewards:    {state.total_rewards}')
+  for addr, total in state.per_address.items():
+    print(f'\t{addr}: {total}')
+  if state.mismatches:
+    print(f'{TERM_RED}Epochs with rewards BIGGER than payout: {state.mismatches}{TERM_NFMT}')
@@ -1,16 +1,179 @@
+#!/usr/bin/env python3.7
+# coding:utf-8
+# Copyright (C) 2019-2021 All rights reserved.
+# FILENAME:  scripts/tools/exportAllAbi.py
+# VERSION: 	 1.1
+# CREATED: 	 2021-06-13 17:37
+# AUTHOR: 	 Aekasitt Guruvanich <sitt@coinflex.com>
+# DESCRIPTION:
+#   Exports the ABI of every brownie artifact in `build/contracts` to `build/abi`.
+#   Only artifacts changed since the previous run are parsed; optionally writes
+#   a combined bundle and 4-byte selector / event topic maps.
+#     python scripts/tools/exportAllAbi.py [--bundle] [--selectors]
+# HISTORY:
+#   2026-10-18  incremental export with a manifest of content hashes, atomic writes
+#*************************************************************
+### Standard Packages ###
+import glob
+import hashlib
 import json
 import os
-import glob
-import pprint
-keywordList = []
-
-path = 'build/contracts/'
-outputDir = 'build/abi/'
-for filename in glob.glob(os.path.join(path, '*.json')):
-  print(f'Read from      {filename}')
-  with open(filename) as currentFile:
-    abi = json.load(currentFile)["abi"]
-    save_path = os.path.join(outputDir, filename.split('/')[-1])
-    with open(save_path, 'w') as outfile:
-      json.dump(abi, outfile)
-      print(f'Save ABI into: {save_path}\n')
+from argparse import ArgumentParser
+from typing import Dict, List, Tuple
+### Third-Party Packages ###
+from eth_utils import keccak
+
+ARTIFACT_DIR: str  = 'build/contracts/'
+OUTPUT_DIR: str    = 'build/abi/'
+MANIFEST: str      = '.manifest.json' # artifact name -> size, mtime and content hashes of the last export
+BUNDLE: str        = 'bundle.json'    # contract name -> abi
+SELECTORS: str     = 'selectors.json' # 4-byte selector -> function signature and contracts
+TOPICS: str        = 'topics.json'    # event topic0 -> event signature and contracts
+READ_CHUNK: int    = 1 << 16
+
+def _write_json(path: str, content):
+  tmp_path: str = f'{ path }.tmp'
+  with open(tmp_path, 'w') as f:
+    json.dump(content, f)
+  os.replace(tmp_path, path)
+
+def _file_hash(path: str) -> str:
+  digest = hashlib.sha256()
+  with open(path, 'rb') as f:
+    for chunk in iter(lambda: f.read(READ_CHUNK), b''):
+      digest.update(chunk)
+  return digest.hexdigest()
+
+def read_abi(path: str) -> list:
+  '''
+  Decodes only the `abi` value of an artifact. Brownie writes artifacts with sorted keys, so `abi`
+  is the first key and the rest of the file (bytecode, AST, source maps) is never read.
+  Falls back to a full parse for artifacts laid out otherwise.
+  '''
+  decoder = json.JSONDecoder()
+  text: str = ''
+  with open(path) as f:
+    while True:
+      chunk: str = f.read(READ_CHUNK)
+      text      += chunk
+      head: str  = text.lstrip()
+      if head.startswith('{'):
+        head = head[1:].lstrip()
+        if len(head) >= 6 and not head.startswith('"abi"'):
+          break
+        if head.startswith('"abi"'):
+          value: str = head[5:].lstrip()
+          if value.startswith(':'):
+            try:
+              return decoder.raw_decode(value[1:].lstrip())[0]
+            except ValueError:
+              pass # abi value not complete yet
+      if not chunk:
+        break
+  with open(path) as f:
+    return json.load(f)['abi']
+
+def _canonical_type(item: dict) -> str:
+  if item['type'].startswith('tuple'):
+    return f'({ ",".join(map(_canonical_type, item["components"])) }){ item["type"][5:] }'
+  return item['type']
+
+def signature(item: dict) -> str:
+  return f'{ item["name"] }({ ",".join(map(_canonical_type, item["inputs"])) })'
+
+def selector_maps(abis: Dict[str, list]) -> Tuple[dict, dict]:
+  '''
+  `0x`-prefixed 4-byte function selectors and event topics of all `abis`, each with its signature and contracts
+  '''
+  selectors: Dict[str, dict] = {}
+  topics: Dict[str, dict]    = {}
+  for name in sorted(abis):
+    for item in abis[name]:
+      if item.get('type') == 'function':
+        sig: str = signature(item)
+        entry    = selectors.setdefault('0x' + keccak(text=sig)[:4].hex(), { 'signature': sig, 'contracts': [] })
+      elif item.get('type') == 'event' and not item.get('anonymous'):
+        sig: str = signature(item)
+        entry    = topics.setdefault('0x' + keccak(text=sig).hex(), { 'signature': sig, 'contracts': [] })
+      else:
+        continue
+      entry['contracts'].append(name)
+  return selectors, topics
+
+def export(artifact_dir: str = ARTIFACT_DIR, output_dir: str = OUTPUT_DIR, bundle: bool = False, selectors: bool = False) -> List[str]:
+  '''
+  Writes the ABI of each new or changed artifact; returns the names of the contracts whose ABI file was written
+
+  ---
+  :param: artifact_dir  `str`  brownie build artifacts
+  :param: output_dir  `str`  destination of `<Contract>.json` ABI files, created if missing
+  :param: bundle  `bool`  also write all ABIs into one `bundle.json`
+  :param: selectors  `bool`  also write `selectors.json` and `topics.json`
+  :returns: `List[str]`
+  '''
+  os.makedirs(output_dir, exist_ok=True)
+  manifest_path: str = os.path.join(output_dir, MANIFEST)
+  try:
+    with open(manifest_path) as f:
+      manifest: Dict[str, dict] = json.load(f)
+  except FileNotFoundError:
+    manifest = {}
+  written: List[str]     = []
+  abis: Dict[str, list]  = {}
+  seen: List[str]        = []
+  for path in sorted(glob.glob(os.path.join(artifact_dir, '*.json'))):
+    name: str      = os.path.splitext(os.path.basename(path))[0]
+    abi_path: str  = os.path.join(output_dir, f'{ name }.json')
+    stat           = os.stat(path)
+    entry: dict    = manifest.get(name, {})
+    seen.append(name)
+    if not os.path.exists(abi_path):
+      entry = {}
+    elif entry.get('size') == stat.st_size and entry.get('mtime_ns') == stat.st_mtime_ns:
+      continue
+    content_hash: str = _file_hash(path)
+    if entry.get('sha256') != content_hash:
+      abi: list     = read_abi(path)
+      abi_hash: str = hashlib.sha256(json.dumps(abi, sort_keys=True).encode()).hexdigest()
+      if entry.get('abi_sha256') != abi_hash: # recompiled bytecode alone leaves the ABI file untouched
+        _write_json(abi_path, abi)
+        written.append(name)
+        print(f'Save ABI into: { abi_path }')
+      abis[name] = abi
+      entry      = { 'sha256': content_hash, 'abi_sha256': abi_hash }
+    manifest[name] = { **entry, 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns }
+  for name in [ name for name in manifest if name not in seen ]:
+    del manifest[name]
+    if os.path.exists(os.path.join(output_dir, f'{ name }.json')):
+      os.remove(os.path.join(output_dir, f'{ name }.json'))
+      written.append(name)
+      print(f'Removed stale ABI of { name }')
+  _write_json(manifest_path, manifest)
+
+  if bundle or selectors:
+    for name in seen:
+      if name not in abis:
+        with open(os.path.join(output_dir, f'{ name }.json')) as f:
+          abis[name] = json.load(f)
+  if bundle and (written or not os.path.exists(os.path.join(output_dir, BUNDLE))):
+    _write_json(os.path.join(output_dir, BUNDLE), { name: abis[name] for name in sorted(abis) })
+    print(f'Save ABI bundle into: { os.path.join(output_dir, BUNDLE) }')
+  if selectors and (written or not os.path.exists(os.path.join(output_dir, SELECTORS)) or not os.path.exists(os.path.join(output_dir, TOPICS))):
+    function_map, topic_map = selector_maps(abis)
+    _write_json(os.path.join(output_dir, SELECTORS), function_map)
+    _write_json(os.path.join(output_dir, TOPICS), topic_map)
+    print(f'Save { len(function_map) } selector(s) and { len(topic_map) } topic(s) into: { output_dir }')
+  return written
+
+def main():
+  parser = ArgumentParser(description='Export contract ABIs from brownie build artifacts')
+  parser.add_argument('--artifacts', default=ARTIFACT_DIR, help='brownie build artifacts folder')
+  parser.add_argument('--output', default=OUTPUT_DIR, help='ABI output folder')
+  parser.add_argument('--bundle', action='store_true', help=f'also write every ABI into `{ BUNDLE }`')
+  parser.add_argument('--selectors', action='store_true', help=f'also write `{ SELECTORS }` and `{ TOPICS }`')
+  options = parser.parse_args()
+  written: List[str] = export(options.artifacts, options.output, options.bundle, options.selectors)
+  print(f'{ len(written) } ABI file(s) updated')
+
+if __name__ == '__main__':
+  main()
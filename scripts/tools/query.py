@@ -0,0 +1,46 @@
+#!/usr/bin/env python3.7
+# coding:utf-8
+# Copyright (C) 2019-2021 All rights reserved.
+# FILENAME:  scripts/tools/query.py
+# VERSION: 	 1.0
+# CREATED: 	 2026-10-18 21:15
+# AUTHOR: 	 Aekasitt Guruvanich <sitt@coinflex.com>
+# DESCRIPTION:
+#   Read a view method without loading the brownie project, e.g.
+#     python -m scripts.tools.query --rpc <url> DailyPayout 0xB226...C17E currentEpoch
+#   With `--state build/deployments/<chain>-<spec>.json`, the address may be a spec entry name.
+# HISTORY:
+#*************************************************************
+### Standard Packages ###
+import json
+from argparse import ArgumentParser
+### Local Modules ###
+from scripts.utils.readonly import DEFAULT_ABI_DIR, ReadOnlyClient
+
+def _argument(value: str):
+  try:
+    return int(value)
+  except ValueError:
+    return value
+
+def main():
+  parser = ArgumentParser(description='Read a contract view method over plain RPC')
+  parser.add_argument('--rpc', default='http://127.0.0.1:8545', help='RPC url')
+  parser.add_argument('--abi-dir', default=DEFAULT_ABI_DIR, help='folder of exported ABIs')
+  parser.add_argument('--state', default=None, help='deployment state file resolving entry names to addresses')
+  parser.add_argument('--block', type=int, default=None, help='block height to read at')
+  parser.add_argument('contract', help='contract name, e.g. DailyPayout')
+  parser.add_argument('address', help='deployed address, or entry name with --state')
+  parser.add_argument('method', help='view method name')
+  parser.add_argument('args', nargs='*', help='method arguments; integers are converted')
+  options = parser.parse_args()
+
+  address: str = options.address
+  if options.state is not None and not address.startswith('0x'):
+    with open(options.state) as f:
+      address = json.load(f)['contracts'][address]['address']
+  client = ReadOnlyClient(options.rpc, options.abi_dir)
+  print(client.call(options.contract, address, options.method, *map(_argument, options.args), block_identifier=options.block))
+
+if __name__ == '__main__':
+  main()
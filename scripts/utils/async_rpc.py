@@ -0,0 +1,166 @@
+#!/usr/bin/env python3.7
+# coding:utf-8
+# Copyright (C) 2019-2021 All rights reserved.
+# FILENAME:  scripts/utils/async_rpc.py
+# VERSION: 	 1.0
+# CREATED: 	 2026-10-18 14:25
+# AUTHOR: 	 Aekasitt Guruvanich <sitt@coinflex.com>
+# DESCRIPTION:
+#   Concurrent `eth_call` fan-out over a keep-alive HTTP session, bounded by
+#   a semaphore and a requests-per-second limit, with retry and backoff.
+# HISTORY:
+#*************************************************************
+### Standard Packages ###
+import asyncio
+import time
+from typing import Any, List, Optional, Sequence, Tuple
+### Third-Party Packages ###
+from aiohttp import ClientError, ClientSession, ClientTimeout, TCPConnector
+from brownie import web3
+from brownie.network.contract import ContractCall
+### Local Modules ###
+from .read_cache import ReadCache
+
+RETRY_STATUS: Tuple[int, ...] = (429, 500, 502, 503, 504)
+
+class RateLimiter:
+  '''
+  Spaces out request starts so that no more than `rate` begin per second
+  '''
+
+  def __init__(self, rate: Optional[float]):
+    self.interval: float = 1 / rate if rate else 0
+    self._next: float    = 0
+    self._lock           = asyncio.Lock()
+
+  async def wait(self):
+    if not self.interval:
+      return
+    async with self._lock:
+      now: float = time.monotonic()
+      delay: float = self._next - now
+      self._next = max(now, self._next) + self.interval
+    if delay > 0:
+      await asyncio.sleep(delay)
+
+class AsyncCaller:
+  '''
+  Issues read-only contract calls concurrently, every call pinned to the same block.
+  Wall-clock time is bounded by node latency and the configured limits rather than by call count.
+  Queues calls with the same `add` / `execute` interface as `BatchCaller`.
+  '''
+
+  def __init__(self, endpoint: Optional[str] = None, concurrency: int = 16, rate_limit: Optional[float] = None, retries: int = 5, backoff: float = 0.5, timeout: int = 30, cache: Optional[ReadCache] = None):
+    '''
+    ---
+    :param: endpoint  `str`  HTTP RPC url; defaults to the url of the connected brownie network
+    :param: concurrency  `int`  maximum number of requests in flight, also the size of the connection pool
+    :param: rate_limit  `float`  maximum requests started per second; unlimited if `None`
+    :param: retries  `int`  attempts after the first on transport errors, HTTP 429 and 5xx
+    :param: backoff  `float`  initial retry delay in seconds, doubled on each attempt
+    :param: timeout  `int`  seconds to wait for each response
+    :param: cache  `ReadCache`  answers calls queued with `final=True` without a request when already known
+    '''
+    self.endpoint: str     = endpoint or web3.provider.endpoint_uri
+    self.concurrency: int  = concurrency
+    self.rate_limit        = rate_limit
+    self.retries: int      = retries
+    self.backoff: float    = backoff
+    self.timeout: int      = timeout
+    self.cache: ReadCache  = cache
+    self.requests: int     = 0
+    self.retried: int      = 0
+    self._calls: List[Tuple[ContractCall, tuple, bool]] = []
+
+  @property
+  def round_trips(self) -> int:
+    return self.requests
+
+  def __len__(self) -> int:
+    return len(self._calls)
+
+  def add(self, call: ContractCall, *args: Any, final: bool = False) -> int:
+    '''
+    Queue `call(*args)` and return its index in the result list of the next `execute`
+
+    ---
+    :param: call  `ContractCall`  bound view method, e.g. `ve_flex.balanceOfAt`
+    :param: final  `bool`  the result can never change anymore, so it may be served from and stored in the cache
+    :returns: `int`
+    '''
+    self._calls.append((call, args, final))
+    return len(self._calls) - 1
+
+  def execute(self, block_identifier: int) -> List[Any]:
+    '''
+    Run all queued calls at `block_identifier`, skipping those already in the cache
+
+    ---
+    :param: block_identifier  `int`  block height every call is pinned to
+    :returns: `List[Any]`
+    '''
+    calls, self._calls = self._calls, []
+    results: List[Any] = [None] * len(calls)
+    pending: List[int] = []
+    for index, (call, args, final) in enumerate(calls):
+      hit, value = self.cache.get(call, args) if final and self.cache is not None else (False, None)
+      if hit:
+        results[index] = value
+      else:
+        pending.append(index)
+    fetched: List[Any] = self.run([ calls[index][:2] for index in pending ], block_identifier)
+    for index, value in zip(pending, fetched):
+      results[index] = value
+      call, args, final = calls[index]
+      if final and self.cache is not None:
+        self.cache.put(call, args, value)
+    if self.cache is not None:
+      self.cache.commit()
+    return results
+
+  def run(self, calls: Sequence[Tuple[ContractCall, tuple]], block_identifier: int) -> List[Any]:
+    '''
+    Execute `calls` concurrently and return the decoded results in order.
+    Raises `ValueError` if the node rejects a call, e.g. on revert.
+
+    ---
+    :param: calls  `Sequence[Tuple[ContractCall, tuple]]`  bound view methods with their arguments
+    :param: block_identifier  `int`  block height every call is pinned to
+    :returns: `List[Any]`
+    '''
+    return asyncio.run(self.gather(calls, block_identifier))
+
+  async def gather(self, calls: Sequence[Tuple[ContractCall, tuple]], block_identifier: int) -> List[Any]:
+    semaphore = asyncio.Semaphore(self.concurrency)
+    limiter   = RateLimiter(self.rate_limit)
+    connector = TCPConnector(limit=self.concurrency, keepalive_timeout=60)
+    async with ClientSession(connector=connector, timeout=ClientTimeout(total=self.timeout)) as session:
+      tasks = [ self._call(session, semaphore, limiter, index, call, args, hex(block_identifier)) for index, (call, args) in enumerate(calls) ]
+      return await asyncio.gather(*tasks)
+
+  async def _call(self, session: ClientSession, semaphore: asyncio.Semaphore, limiter: RateLimiter, index: int, call: ContractCall, args: tuple, block: str) -> Any:
+    payload: dict = {
+      'jsonrpc': '2.0',
+      'id': index,
+      'method': 'eth_call',
+      'params': [{ 'to': call._address, 'data': call.encode_input(*args) }, block],
+    }
+    async with semaphore:
+      for attempt in range(self.retries + 1):
+        await limiter.wait()
+        self.requests += 1
+        try:
+          async with session.post(self.endpoint, json=payload) as response:
+            if response.status not in RETRY_STATUS:
+              if response.status >= 400:
+                raise ValueError(f'{ call._name }{ args } failed: HTTP { response.status }')
+              reply: dict = await response.json()
+              if 'error' in reply:
+                raise ValueError(f'{ call._name }{ args } failed: { reply["error"].get("message") }')
+              return call.decode_output(reply['result'])
+        except (ClientError, asyncio.TimeoutError):
+          if attempt == self.retries:
+            raise
+        self.retried += 1
+        await asyncio.sleep(self.backoff * (2 ** attempt))
+      raise ValueError(f'{ call._name }{ args } failed after { self.retries } retries')
@@ -0,0 +1,226 @@
+#!/usr/bin/env python3.7
+# coding:utf-8
+# Copyright (C) 2019-2021 All rights reserved.
+# FILENAME:  scripts/utils/balance_store.py
+# VERSION: 	 1.0
+# CREATED: 	 2026-10-19 01:10
+# AUTHOR: 	 Aekasitt Guruvanich <sitt@coinflex.com>
+# DESCRIPTION:
+#   On-disk epoch x holder matrix of veFLEX balances, stored as fixed-width
+#   64-bit limbs in a memory-mapped file so full-population analytics never
+#   hold the whole history as python integers.
+# HISTORY:
+#*************************************************************
+### Standard Packages ###
+import json
+import os
+from typing import Dict, List, Optional, Sequence
+### Third-Party Packages ###
+import numpy as np
+### Local Modules ###
+from .rewards import epoch_rewards
+
+DEFAULT_DIR: str   = 'build/cache'
+META: str          = 'meta.json'               # limbs, holder capacity, committed epochs and holder ids
+DATA: str          = 'balances-{capacity}.bin' # epochs x holder capacity x limbs, least significant limb first
+LIMB_BITS: int     = 64
+LIMB_DTYPE         = np.dtype('<u8')
+DEFAULT_LIMBS: int = 2 # veFLEX biases are int128, so every balance fits in 128 bits
+
+def to_limbs(values: Sequence[int], limbs: int = DEFAULT_LIMBS) -> np.ndarray:
+  '''
+  Splits non-negative integers into `limbs` 64-bit words each, least significant first.
+  Raises `OverflowError` for values wider than `limbs * 64` bits.
+  '''
+  mask: int   = (1 << LIMB_BITS) - 1
+  result      = np.zeros((len(values), limbs), dtype=LIMB_DTYPE)
+  for index, value in enumerate(values):
+    if value < 0 or value >> (LIMB_BITS * limbs):
+      raise OverflowError(f'{ value } does not fit in { limbs } unsigned { LIMB_BITS }-bit limbs')
+    for limb in range(limbs):
+      result[index, limb] = (value >> (LIMB_BITS * limb)) & mask
+  return result
+
+def from_limbs(array: np.ndarray) -> np.ndarray:
+  '''
+  Joins the limbs of the last axis back into an object array of python integers
+  '''
+  result = array[..., 0].astype(object)
+  for limb in range(1, array.shape[-1]):
+    if array[..., limb].any(): # upper limbs are zero for all but the largest balances
+      result += array[..., limb].astype(object) << (LIMB_BITS * limb)
+  return result
+
+class BalanceStore:
+  '''
+  Balances of every holder at the start block of every epoch, appended one epoch at a time as epochs close.
+  Holders get ids in order of first appearance; ids and the epoch count live in `meta.json`, written after
+  the data is flushed, so an interrupted append leaves the last committed epoch and its holders intact. Rows are reserved for
+  a holder capacity that doubles when exceeded, so appending an epoch only extends the file; a grown capacity
+  is copied into a new data file named after it before `meta.json` switches over.
+  '''
+
+  def __init__(self, directory: str, limbs: int = DEFAULT_LIMBS, holder_capacity: int = 1024, readonly: bool = False):
+    '''
+    ---
+    :param: directory  `str`  folder of `meta.json` and the data file, created if missing
+    :param: limbs  `int`  64-bit limbs per balance of a new store; an existing store keeps its own
+    :param: holder_capacity  `int`  initial holder rows per epoch of a new store
+    :param: readonly  `bool`  map the data read-only, for reports running next to the writer
+    '''
+    self.directory: str              = directory
+    self.readonly: bool              = readonly
+    self.limbs: int                  = limbs
+    self.holder_capacity: int        = holder_capacity
+    self.epochs: int                 = 0
+    self.holders: List[str]          = []
+    self.holder_ids: Dict[str, int]  = {}
+    self._committed: int             = 0 # holders written to `meta.json`; later ones are committed by `append_epoch`
+    self._map: Optional[np.memmap]   = None
+    if not readonly:
+      os.makedirs(directory, exist_ok=True)
+    try:
+      with open(os.path.join(directory, META)) as f:
+        meta: dict = json.load(f)
+      self.limbs           = meta['limbs']
+      self.holder_capacity = meta['holder_capacity']
+      self.epochs          = meta['epochs']
+      self.holders         = meta['holders']
+      self.holder_ids      = { holder: index for index, holder in enumerate(self.holders) }
+      self._committed      = len(self.holders)
+    except FileNotFoundError: pass
+    self._open()
+
+  @classmethod
+  def for_payout(cls, chain_id: int, payout: str, directory: str = DEFAULT_DIR, readonly: bool = False) -> 'BalanceStore':
+    return cls(os.path.join(directory, f'balances-{ chain_id }-{ payout.lower() }'), readonly=readonly)
+
+  def __len__(self) -> int:
+    return self.epochs
+
+  ### Writes ###
+  def add_holders(self, holders: Sequence[str]) -> List[int]:
+    '''
+    Ids of `holders`, assigning new ids to unknown ones; committed with the next appended epoch
+    '''
+    for holder in holders:
+      if holder not in self.holder_ids:
+        self.holder_ids[holder] = len(self.holders)
+        self.holders.append(holder)
+    if len(self.holders) > self.holder_capacity:
+      capacity: int = self.holder_capacity
+      while capacity < len(self.holders):
+        capacity *= 2
+      self._resize(capacity)
+    return [ self.holder_ids[holder] for holder in holders ]
+
+  def append_epoch(self, balances: Dict[str, int]) -> int:
+    '''
+    Stores the balances at the start block of the next epoch; holders left out are stored as zero.
+    Returns the epoch index.
+    '''
+    if self.readonly:
+      raise ValueError(f'Balance store at `{ self.directory }` is read-only')
+    ids: List[int] = self.add_holders(list(balances))
+    row            = np.zeros((self.holder_capacity, self.limbs), dtype=LIMB_DTYPE)
+    row[ids]       = to_limbs(list(balances.values()), self.limbs)
+    with open(self._path(), 'ab') as f:
+      f.truncate(self._offset(self.epochs))
+      f.write(row.tobytes())
+    self.epochs    += 1
+    self._committed = len(self.holders)
+    self._save_meta()
+    self._open()
+    return self.epochs - 1
+
+  ### Zero-copy reads ###
+  def matrix(self) -> np.ndarray:
+    '''
+    `uint64` view shaped epochs x holders x limbs of the mapped file
+    '''
+    if self._map is None:
+      return np.zeros((self.epochs, len(self.holders), self.limbs), dtype=LIMB_DTYPE)
+    return self._map[:self.epochs, :len(self.holders)]
+
+  def row(self, epoch: int) -> np.ndarray:
+    '''
+    `uint64` view shaped holders x limbs of the balances at the start of `epoch`
+    '''
+    if not 0 <= epoch < self.epochs:
+      raise IndexError(f'Epoch { epoch } not stored, { self.epochs } epoch(s) available')
+    return self.matrix()[epoch]
+
+  def column(self, holder: str) -> np.ndarray:
+    '''
+    `uint64` view shaped epochs x limbs of the balances of `holder`
+    '''
+    return self.matrix()[:, self.holder_ids[holder]]
+
+  ### Integer reads ###
+  def balances(self, epoch: int) -> Dict[str, int]:
+    return dict(zip(self.holders, map(int, from_limbs(self.row(epoch)))))
+
+  def balance(self, holder: str, epoch: int) -> int:
+    if holder not in self.holder_ids:
+      return 0
+    return int(from_limbs(self.row(epoch)[self.holder_ids[holder]]))
+
+  def close(self):
+    self._map = None
+
+  def _path(self, capacity: Optional[int] = None) -> str:
+    return os.path.join(self.directory, DATA.format(capacity=capacity or self.holder_capacity))
+
+  def _offset(self, epoch: int) -> int:
+    return epoch * self.holder_capacity * self.limbs * LIMB_DTYPE.itemsize
+
+  def _open(self):
+    self._map = None
+    if self.epochs > 0:
+      self._map = np.memmap(
+        self._path(), dtype=LIMB_DTYPE, mode='r' if self.readonly else 'r+',
+        shape=(self.epochs, self.holder_capacity, self.limbs)
+      )
+
+  def _resize(self, capacity: int):
+    '''
+    Rewrites the committed epochs with `capacity` holder rows each
+    '''
+    old_path: str = self._path()
+    if self.epochs > 0:
+      resized = np.memmap(self._path(capacity), dtype=LIMB_DTYPE, mode='w+', shape=(self.epochs, capacity, self.limbs))
+      resized[:, :self.holder_capacity] = self._map
+      resized.flush()
+      del resized
+    self._map            = None
+    self.holder_capacity = capacity
+    self._save_meta()
+    if os.path.exists(old_path):
+      os.remove(old_path)
+    self._open()
+
+  def _save_meta(self):
+    if self._map is not None:
+      self._map.flush()
+    tmp_path: str = os.path.join(self.directory, f'{ META }.tmp')
+    with open(tmp_path, 'w') as f:
+      json.dump({ 'limbs': self.limbs, 'holder_capacity': self.holder_capacity, 'epochs': self.epochs, 'holders': self.holders[:self._committed] }, f)
+    os.replace(tmp_path, os.path.join(self.directory, META))
+
+def claimable_from_store(store: BalanceStore, payouts: Sequence[int], totals: Sequence[int]) -> Dict[str, int]:
+  '''
+  Claimable amount of every holder of `store` over its first `len(payouts)` epochs, as `_getClaimableUntilEpoch`
+  sums it. Balances are converted to integers one epoch row at a time.
+
+  ---
+  :param: store  `BalanceStore`  balances at the start block of each epoch
+  :param: payouts  `Sequence[int]`  `payoutForEpoch` for each epoch
+  :param: totals  `Sequence[int]`  `totalSupplyAt` at the start block of each epoch
+  :returns: `Dict[str, int]`
+  '''
+  if len(payouts) > len(store):
+    raise ValueError(f'{ len(payouts) } epoch(s) requested, { len(store) } stored')
+  amounts = np.zeros(len(store.holders), dtype=object)
+  for epoch, (payout, total) in enumerate(zip(payouts, totals)):
+    amounts += epoch_rewards(from_limbs(store.row(epoch))[:, None], [payout], [total])[:, 0]
+  return { holder: int(amount) for holder, amount in zip(store.holders, amounts) }
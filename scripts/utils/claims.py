@@ -0,0 +1,103 @@
+#!/usr/bin/env python3.7
+# coding:utf-8
+# Copyright (C) 2019-2021 All rights reserved.
+# FILENAME:  scripts/utils/claims.py
+# VERSION: 	 1.0
+# CREATED: 	 2026-10-18 18:10
+# AUTHOR: 	 Aekasitt Guruvanich <sitt@coinflex.com>
+# DESCRIPTION:
+#   Sizing of claim transactions against a gas budget from gas estimates.
+# HISTORY:
+#*************************************************************
+### Standard Packages ###
+from typing import Any, Callable, List, Optional, Sequence
+
+def _fits(estimate: Callable[..., int], argument: Any, gas_budget: int) -> bool:
+  try:
+    return estimate(argument) <= gas_budget
+  except ValueError: # the node fails the estimate of a transaction above its gas cap
+    return False
+
+def _largest_fitting(fits: Callable[[int], bool], limit: int) -> int:
+  '''
+  Largest size in `[1, limit]` for which `fits` holds, assuming size 1 fits and gas grows with size.
+  Doubles then bisects, so it takes a logarithmic number of estimates.
+  '''
+  low: int            = 1    # largest size known to fit
+  high: Optional[int] = None # smallest size known not to fit
+  while high is None and low < limit:
+    size: int = min(low * 2, limit)
+    if fits(size):
+      low = size
+    else:
+      high = size
+  while high is not None and high - low > 1:
+    size: int = (low + high) // 2
+    if fits(size):
+      low = size
+    else:
+      high = size
+  return low
+
+def chunk_owners(estimate: Callable[[Sequence[str]], int], owners: Sequence[str], gas_budget: int) -> List[List[str]]:
+  '''
+  Splits `owners` into consecutive chunks, each the largest whose `claimMany` estimate fits `gas_budget`
+
+  ---
+  :param: estimate  `Callable[[Sequence[str]], int]`  gas estimate of `claimMany(owners)`, e.g. `payout.claimMany.estimate_gas`
+  :param: owners  `Sequence[str]`  accounts to claim for
+  :param: gas_budget  `int`  gas allowed per transaction, typically a fraction of the block gas limit
+  :returns: `List[List[str]]`
+  '''
+  chunks: List[List[str]] = []
+  start: int              = 0
+  while start < len(owners):
+    if not _fits(estimate, owners[start:start + 1], gas_budget):
+      raise ValueError(f'Claim of { owners[start] } alone does not fit { gas_budget } gas')
+    size: int = _largest_fitting(lambda size: _fits(estimate, owners[start:start + size], gas_budget), len(owners) - start)
+    chunks.append(list(owners[start:start + size]))
+    start += size
+  return chunks
+
+def largest_window(estimate: Callable[[int], int], first_epoch: int, last_epoch: int, gas_budget: int) -> int:
+  '''
+  Furthest ending epoch in `[first_epoch, last_epoch]` whose `claimUntil` estimate fits `gas_budget`
+
+  ---
+  :param: estimate  `Callable[[int], int]`  gas estimate of `claimUntil(owner, endingEpoch)` given the ending epoch
+  :param: first_epoch  `int`  first unclaimed epoch, i.e. `claimedEpoches(owner)`
+  :param: last_epoch  `int`  last epoch to settle, at most `currentEpoch() - 1`
+  :param: gas_budget  `int`  gas allowed per transaction
+  :returns: `int`
+  '''
+  if not _fits(estimate, first_epoch, gas_budget):
+    raise ValueError(f'Claim of epoch { first_epoch } alone does not fit { gas_budget } gas')
+  return first_epoch - 1 + _largest_fitting(lambda size: _fits(estimate, first_epoch + size - 1, gas_budget), last_epoch - first_epoch + 1)
+
+def claim_in_windows(payout, owner, gas_budget: int, tx_params: dict) -> List[Any]:
+  '''
+  Claims every distributed epoch of `owner` through successive `claimUntil` windows of at most `gas_budget` gas.
+  Stops as soon as the epochs that have started hold nothing left to claim, so no transaction is sent that claims nothing.
+
+  ---
+  :param: payout  `DailyPayout`  payout contract, or `QuarterlyPayout`
+  :param: owner  `Account`  claimant, also the sender
+  :param: gas_budget  `int`  gas allowed per transaction
+  :param: tx_params  `dict`  extra transaction parameters, e.g. the gas price strategy
+  :returns: `List[TransactionReceipt]`
+  '''
+  receipts: List[Any] = []
+  last_epoch: int     = payout.currentEpoch() - 1
+  first_epoch: int    = payout.claimedEpoches(owner)
+  while first_epoch <= last_epoch:
+    if payout.getClaimableUntil(owner, last_epoch) == 0: # counts only the epochs that have started
+      break
+    estimate   = lambda ending: payout.claimUntil.estimate_gas(owner, ending, { 'from': owner })
+    ending: int = largest_window(estimate, first_epoch, last_epoch, gas_budget)
+    receipts.append(payout.claimUntil(owner, ending, { 'from': owner, **tx_params }))
+    claimed: int = payout.claimedEpoches(owner)
+    print(f'Claimed epochs { first_epoch }-{ claimed - 1 }: { receipts[-1].gas_used } gas')
+    if claimed <= first_epoch: # remaining epochs have not started yet
+      break
+    first_epoch = claimed
+  return receipts
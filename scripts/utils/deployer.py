@@ -0,0 +1,234 @@
+#!/usr/bin/env python3.7
+# coding:utf-8
+# Copyright (C) 2019-2021 All rights reserved.
+# FILENAME:  scripts/utils/deployer.py
+# VERSION: 	 1.0
+# CREATED: 	 2026-10-18 20:40
+# AUTHOR: 	 Aekasitt Guruvanich <sitt@coinflex.com>
+# DESCRIPTION:
+#   Declarative deployer: a spec of contracts, constructor arguments and
+#   post-deploy calls is turned into a dependency graph and executed level by
+#   level, with progress kept in a state file so failed runs resume.
+# HISTORY:
+#*************************************************************
+### Standard Packages ###
+import json
+import os
+from typing import Any, Dict, List, Optional, Set
+### Local Modules ###
+from .pipeline import Step, TxPipeline
+
+REF: str         = '@' # `@name` refers to the contract of another spec entry
+VAR: str         = '$' # `$name` refers to an entry of `variables`
+DEFAULT_DIR: str = 'build/deployments'
+
+# Example spec, as read from YAML:
+#
+# variables:
+#   flex: '0x98Dd7eC28FB43b3C4c770AE532417015fa939Dd3'
+# contracts:
+#   ve_flex:
+#     contract: veFLEX
+#     args: [ '$flex', 'vested FLEX', 'veFLEX', '1.0.0' ]
+#   daily_payout:
+#     contract: DailyPayout
+#     args: [ '$flex', '@ve_flex' ]
+#     calls:
+#       - [ setStartBlockHeight, 1000 ]
+#       - [ addDistributor, '@distributor_daily' ]
+#   distributor_daily:
+#     contract: Distributor
+#     args: [ '@daily_payout', '$flex', 'daily' ]
+#   legacy_payout:
+#     contract: DailyPayout
+#     address: '0xB226C60886e81920d3d913858678d8C9e71eC17E' # already deployed, only its calls are sent
+#     calls:
+#       - [ transferOwnership, '0x...' ]
+
+class Node:
+  '''
+  Deployment of one spec entry, or one of its post-deploy calls
+  '''
+
+  def __init__(self, key: str, name: str, method: Optional[str], args: List[Any], deps: Set[str]):
+    self.key: str             = key
+    self.name: str            = name   # spec entry the node belongs to
+    self.method: Optional[str] = method # `None` for the deployment itself
+    self.args: List[Any]      = args
+    self.deps: Set[str]       = deps
+
+def _refs(value: Any) -> Set[str]:
+  if isinstance(value, str) and value.startswith(REF):
+    return { value[1:] }
+  if isinstance(value, (list, tuple)):
+    return set().union(*map(_refs, value)) if value else set()
+  return set()
+
+def build_graph(spec: dict) -> Dict[str, Node]:
+  '''
+  Turns the `contracts` of `spec` into graph nodes keyed `<name>` for deployments and
+  `<name>.<method>#<index>` for calls. A deployment depends on the entries referenced by its
+  arguments; a call also depends on its own contract and on the previous call of the same entry.
+  Raises `ValueError` on unknown references or entries.
+  '''
+  entries: dict = spec.get('contracts') or {}
+  if not isinstance(entries, dict) or len(entries) < 1:
+    raise ValueError('Spec has no `contracts`')
+  nodes: Dict[str, Node] = {}
+  for name, entry in entries.items():
+    if not isinstance(entry, dict) or not isinstance(entry.get('contract'), str):
+      raise ValueError(f'Entry `{ name }` needs a `contract` name')
+    previous: Optional[str] = None
+    if entry.get('address') is None:
+      args: list       = entry.get('args') or []
+      nodes[name]      = Node(name, name, None, args, _refs(args))
+      previous         = name
+    for index, call in enumerate(entry.get('calls') or []):
+      if not isinstance(call, (list, tuple)) or len(call) < 1 or not isinstance(call[0], str):
+        raise ValueError(f'Call #{ index } of `{ name }` must be a list starting with the method name')
+      key: str    = f'{ name }.{ call[0] }#{ index }'
+      deps: Set[str] = _refs(call[1:]) | ({ previous } if previous else set())
+      nodes[key]  = Node(key, name, call[0], list(call[1:]), deps)
+      previous    = key
+  for node in nodes.values():
+    unknown: Set[str] = { dep for dep in node.deps if dep not in nodes and dep not in entries }
+    if unknown:
+      raise ValueError(f'`{ node.key }` refers to unknown entries: { ", ".join(sorted(unknown)) }')
+    node.deps = { dep for dep in node.deps if dep in nodes } # references to existing contracts need no waiting
+  return nodes
+
+def levels(nodes: Dict[str, Node]) -> List[List[str]]:
+  '''
+  Groups node keys so that every node only depends on nodes of earlier levels; nodes of one
+  level are independent and are broadcast together. Raises `ValueError` on a dependency cycle.
+  '''
+  remaining: Dict[str, Set[str]] = { key: set(node.deps) for key, node in nodes.items() }
+  result: List[List[str]]        = []
+  while remaining:
+    ready: List[str] = sorted(key for key, deps in remaining.items() if not deps)
+    if not ready:
+      raise ValueError(f'Dependency cycle between: { ", ".join(sorted(remaining)) }')
+    result.append(ready)
+    for key in ready:
+      del remaining[key]
+    for deps in remaining.values():
+      deps.difference_update(ready)
+  return result
+
+class DeploymentState:
+  '''
+  Deployed addresses and completed calls of one spec on one chain, saved after every mined node
+  '''
+
+  def __init__(self, path: str):
+    self.path: str                       = path
+    self.contracts: Dict[str, dict]      = {} # name -> { 'address', 'args' }
+    self.calls: List[str]                = []
+    try:
+      with open(path) as f:
+        content: dict = json.load(f)
+      self.contracts = content['contracts']
+      self.calls     = content['calls']
+    except FileNotFoundError: pass
+
+  @classmethod
+  def for_spec(cls, chain_id: int, spec_path: str, directory: str = DEFAULT_DIR) -> 'DeploymentState':
+    spec_name: str = os.path.splitext(os.path.basename(spec_path))[0]
+    return cls(os.path.join(directory, f'{ chain_id }-{ spec_name }.json'))
+
+  def save(self):
+    os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+    tmp_path: str = f'{ self.path }.tmp'
+    with open(tmp_path, 'w') as f:
+      json.dump({ 'contracts': self.contracts, 'calls': self.calls }, f, indent=2)
+    os.replace(tmp_path, self.path)
+
+class Deployer:
+  '''
+  Executes a deployment spec with one account. Independent nodes of a level are broadcast back to back
+  through `TxPipeline`, then the level is awaited before the next one is sent. Nodes found in the state
+  file are skipped, so a failed run can simply be started again.
+  '''
+
+  def __init__(self, spec: dict, containers: Dict[str, Any], account, state: DeploymentState, tx_params: Optional[dict] = None):
+    '''
+    ---
+    :param: spec  `dict`  parsed spec with `contracts` and optional `variables`
+    :param: containers  `Dict[str, ContractContainer]`  contract name to container, e.g. `{ 'veFLEX': veFLEX }`
+    :param: account  `Account`  deployer and sender of every call
+    :param: state  `DeploymentState`  progress of previous runs
+    :param: tx_params  `dict`  extra transaction parameters, e.g. the gas price strategy
+    '''
+    self.entries: dict              = spec['contracts']
+    self.variables: dict            = spec.get('variables') or {}
+    self.containers: Dict[str, Any] = containers
+    self.state: DeploymentState     = state
+    self.nodes: Dict[str, Node]     = build_graph(spec)
+    self.levels: List[List[str]]    = levels(self.nodes)
+    self.pipeline: TxPipeline       = TxPipeline(account, tx_params)
+    self.contracts: Dict[str, Any]  = {}
+    for name, entry in self.entries.items():
+      if entry['contract'] not in containers:
+        raise ValueError(f'Unknown contract `{ entry["contract"] }` of entry `{ name }`')
+      address: Optional[str] = entry.get('address') or state.contracts.get(name, {}).get('address')
+      if address is not None:
+        self.contracts[name] = containers[entry['contract']].at(address)
+
+  def run(self) -> Dict[str, Any]:
+    '''
+    Sends every node not yet done; returns the contract of each spec entry.
+    Raises the first failure of a level once all other transactions of that level are mined and recorded.
+    '''
+    for number, level in enumerate(self.levels):
+      sent: List[tuple] = []
+      for key in level:
+        node: Node = self.nodes[key]
+        if self._done(node):
+          continue
+        args: List[Any] = [ self._resolve(arg) for arg in node.args ]
+        if node.method is None:
+          sent.append((node, args, self.pipeline.deploy(key, self.containers[self.entries[key]['contract']], *args)))
+        else:
+          sent.append((node, args, self.pipeline.call(key, self.contracts[node.name], node.method, *args)))
+      error: Optional[Exception] = None
+      for node, args, step in sent:
+        try:
+          self._record(node, args, step)
+        except Exception as err:
+          error = error or err
+      if error is not None:
+        raise error
+      if sent:
+        print(f'Level { number }: { ", ".join(node.key for node, _, _ in sent) } done')
+    return self.contracts
+
+  def _done(self, node: Node) -> bool:
+    if node.method is not None:
+      return node.key in self.state.calls
+    recorded: Optional[dict] = self.state.contracts.get(node.key)
+    if recorded is None:
+      return False
+    args: List[str] = [ str(self._resolve(arg)) for arg in node.args ]
+    if recorded['args'] != args:
+      raise ValueError(f'Arguments of `{ node.key }` changed since it was deployed at { recorded["address"] }; remove it from `{ self.state.path }` to redeploy')
+    return True
+
+  def _record(self, node: Node, args: List[Any], step: Step):
+    result = self.pipeline.result(step)
+    if node.method is None:
+      self.contracts[node.key]       = result
+      self.state.contracts[node.key] = { 'address': result.address, 'args': [ str(arg) for arg in args ] }
+    else:
+      self.state.calls.append(node.key)
+    self.state.save()
+
+  def _resolve(self, value: Any) -> Any:
+    if isinstance(value, (list, tuple)):
+      return [ self._resolve(item) for item in value ]
+    if isinstance(value, str) and value.startswith(REF):
+      return self.contracts[value[1:]]
+    if isinstance(value, str) and value.startswith(VAR):
+      if value[1:] not in self.variables:
+        raise ValueError(f'Unknown variable `{ value }`')
+      return self.variables[value[1:]]
+    return value
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3.7
+# coding:utf-8
+# Copyright (C) 2019-2021 All rights reserved.
+# FILENAME:  scripts/utils/hints.py
+# VERSION: 	 1.0
+# CREATED: 	 2026-10-18 23:05
+# AUTHOR: 	 Aekasitt Guruvanich <sitt@coinflex.com>
+# DESCRIPTION:
+#   Epoch hints for `veFLEX.balanceOfAtHinted` / `totalSupplyAtHinted`, computed
+#   off-chain from the checkpoint history rebuilt by `scripts/utils/ve_model.py`.
+# HISTORY:
+#*************************************************************
+### Standard Packages ###
+from bisect import bisect_right
+from typing import Dict, List, Tuple
+### Local Modules ###
+from .ve_model import VotingEscrowModel
+
+class EpochHints:
+  '''
+  Block heights of every global and user point, answering the same "last index with `blk <= block`"
+  question as the binary searches of veFLEX. Hints are only as current as the history they were built
+  from; a point written on-chain afterwards makes the contract fall back to its own search.
+  '''
+
+  def __init__(self, point_blocks: List[int], user_point_blocks: Dict[str, List[int]]):
+    '''
+    ---
+    :param: point_blocks  `List[int]`  `point_history(i).blk` for `i` in `0..epoch()`
+    :param: user_point_blocks  `Dict[str, List[int]]`  `user_point_history(addr, i).blk` for `i` in `0..user_point_epoch(addr)`
+    '''
+    self.point_blocks: List[int]                 = point_blocks
+    self.user_point_blocks: Dict[str, List[int]] = user_point_blocks
+
+  @classmethod
+  def from_model(cls, model: VotingEscrowModel) -> 'EpochHints':
+    return cls(
+      [ point.blk for point in model.point_history[:model.epoch + 1] ],
+      { addr: [ point.blk for point in history ] for addr, history in model.user_point_history.items() },
+    )
+
+  def epoch(self, block: int) -> int:
+    '''
+    Global epoch hint of `block`, as `veFLEX.find_block_epoch(block, epoch())`
+    '''
+    return max(bisect_right(self.point_blocks, block) - 1, 0)
+
+  def user_epoch(self, addr: str, block: int) -> int:
+    '''
+    User epoch hint of `addr` at `block`; 0 for addresses that never locked
+    '''
+    return max(bisect_right(self.user_point_blocks.get(addr, [0]), block) - 1, 0)
+
+  def balance_args(self, addr: str, block: int) -> Tuple[str, int, int, int]:
+    '''
+    Arguments of `veFLEX.balanceOfAtHinted`
+    '''
+    return (addr, block, self.user_epoch(addr, block), self.epoch(block))
+
+  def supply_args(self, block: int) -> Tuple[int, int]:
+    '''
+    Arguments of `veFLEX.totalSupplyAtHinted`
+    '''
+    return (block, self.epoch(block))
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3.7
+# coding:utf-8
+# Copyright (C) 2019-2021 All rights reserved.
+# FILENAME:  scripts/utils/holders.py
+# VERSION: 	 1.0
+# CREATED: 	 2026-10-19 00:20
+# AUTHOR: 	 Aekasitt Guruvanich <sitt@coinflex.com>
+# DESCRIPTION:
+#   Set of veFLEX lockers discovered from `Deposit` / `Withdraw` logs, kept in
+#   a JSON file under `build/cache` and extended incrementally on each sync.
+# HISTORY:
+#*************************************************************
+### Standard Packages ###
+import json
+import os
+from typing import Dict, List, Optional, Union
+### Third-Party Packages ###
+from eth_utils import keccak, to_checksum_address
+### Local Modules ###
+from .log_scanner import LogScanner
+
+DEFAULT_DIR: str    = 'build/cache'
+DEPOSIT_TOPIC: str  = '0x' + keccak(text='Deposit(address,uint256,uint256,int128,uint256)').hex()
+WITHDRAW_TOPIC: str = '0x' + keccak(text='Withdraw(address,uint256,uint256)').hex()
+
+def _hex(value: Union[bytes, str]) -> str:
+  return '0x' + value.hex() if isinstance(value, bytes) else value
+
+def _words(data: Union[bytes, str]) -> List[int]:
+  raw: bytes = data if isinstance(data, bytes) else bytes.fromhex(data[2:])
+  return [ int.from_bytes(raw[i:i + 32], 'big') for i in range(0, len(raw), 32) ]
+
+class HolderSet:
+  '''
+  Every address that ever locked FLEX in one veFLEX deployment, with its block of first deposit and its
+  current lock. Rewards of past epochs need every holder of that time, including those who withdrew since,
+  so nobody is ever dropped; `active` narrows the set down to locks that have not expired.
+  '''
+
+  def __init__(self, path: str, ve_flex: str, deploy_block: int):
+    '''
+    ---
+    :param: path  `str`  JSON state file
+    :param: ve_flex  `str`  veFLEX address
+    :param: deploy_block  `int`  first block to scan
+    '''
+    self.path: str                   = path
+    self.ve_flex: str                = to_checksum_address(ve_flex)
+    self.last_block: int             = deploy_block - 1
+    self.first_block: Dict[str, int] = {}   # holder -> block of the first deposit
+    self.locks: Dict[str, List[int]] = {}   # holder -> [ locked amount, unlock time ]
+
+  @classmethod
+  def load(cls, chain_id: int, ve_flex: str, deploy_block: int, directory: str = DEFAULT_DIR) -> 'HolderSet':
+    holders = cls(os.path.join(directory, f'holders-{ chain_id }-{ ve_flex.lower() }.json'), ve_flex, deploy_block)
+    try:
+      with open(holders.path) as f:
+        content: dict = json.load(f)
+    except FileNotFoundError:
+      return holders
+    holders.last_block  = content['last_block']
+    holders.first_block = content['first_block']
+    holders.locks       = content['locks']
+    return holders
+
+  def save(self):
+    os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+    tmp_path: str = f'{ self.path }.tmp'
+    with open(tmp_path, 'w') as f:
+      json.dump({ 've_flex': self.ve_flex, 'last_block': self.last_block, 'first_block': self.first_block, 'locks': self.locks }, f)
+    os.replace(tmp_path, self.path)
+
+  def apply_log(self, log: dict):
+    '''
+    Folds one raw `Deposit` or `Withdraw` log into the set; logs must be applied in chain order
+    '''
+    topics: List[str] = [ _hex(topic) for topic in log['topics'] ]
+    holder: str       = to_checksum_address('0x' + topics[1][-40:])
+    if topics[0] == DEPOSIT_TOPIC:
+      value: int = _words(log['data'])[0]
+      self.first_block.setdefault(holder, log['blockNumber'])
+      amount, _  = self.locks.get(holder, [0, 0])
+      self.locks[holder] = [ amount + value, int(topics[2], 16) ] # `locktime` is the lock end after the deposit
+    elif topics[0] == WITHDRAW_TOPIC:
+      self.locks[holder] = [0, 0] # `withdraw` always releases the whole lock
+
+  def sync(self, scanner: LogScanner, to_block: int) -> int:
+    '''
+    Scans the logs since the last sync up to `to_block`, saving after every chunk; returns the number of new holders
+    '''
+    known: int = len(self.first_block)
+    params: dict = { 'address': self.ve_flex, 'topics': [[ DEPOSIT_TOPIC, WITHDRAW_TOPIC ]] }
+    for _, end, logs in scanner.scan(params, self.last_block + 1, to_block):
+      for log in logs:
+        self.apply_log(log)
+      self.last_block = end
+      self.save()
+    return len(self.first_block) - known
+
+  def holders(self, block: Optional[int] = None) -> List[str]:
+    '''
+    Addresses that had locked by `block`, in order of first deposit; all known holders without `block`
+    '''
+    return [ holder for holder, first in self.first_block.items() if block is None or first <= block ]
+
+  def active(self, timestamp: int) -> List[str]:
+    '''
+    Addresses whose lock is still running at `timestamp`
+    '''
+    return [ holder for holder, (amount, end) in self.locks.items() if amount > 0 and end > timestamp ]
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3.7
+# coding:utf-8
+# Copyright (C) 2019-2021 All rights reserved.
+# FILENAME:  scripts/utils/indexer.py
+# VERSION: 	 1.0
+# CREATED: 	 2026-10-18 15:10
+# AUTHOR: 	 Aekasitt Guruvanich <sitt@coinflex.com>
+# DESCRIPTION:
+#   Event-log indexer for the payout and distributor contracts, pulling logs in
+#   block-range chunks and appending them to per-event SQLite tables.
+# HISTORY:
+#*************************************************************
+### Standard Packages ###
+import json
+import os
+import sqlite3
+from collections import defaultdict
+from typing import Dict, List, Tuple
+### Third-Party Packages ###
+from brownie import web3
+### Local Modules ###
+from .log_scanner import LogScanner
+
+DEFAULT_PATH: str    = 'build/cache/events.sqlite'
+DEFAULT_ABI_DIR: str = 'build/abi'
+UINT_DIGITS: int     = 78 # decimal digits of 2**256, uint values are zero-padded so they sort as text
+
+def _column_type(abi_type: str) -> str:
+  return 'INTEGER' if abi_type == 'bool' else 'TEXT'
+
+def _encode(abi_type: str, value):
+  if abi_type.startswith('uint'):
+    return str(value).zfill(UINT_DIGITS)
+  if abi_type.startswith('int'):
+    return str(value)
+  if abi_type == 'bool':
+    return int(value)
+  if isinstance(value, bytes):
+    return '0x' + value.hex()
+  return str(value)
+
+class EventIndexer:
+  '''
+  Indexes every event declared in the ABI of each registered contract, e.g. `Distribute`, `Claim`,
+  `IsDistributor` and `IsOperator` of the payout contracts, or `CallDistribute` and `RevertTransfer`
+  of `Distributor`. Each event gets its own `<Contract>_<Event>` table, shared by all deployments
+  of that contract; progress is kept per deployment so runs are incremental.
+  '''
+
+  def __init__(self, path: str = DEFAULT_PATH, abi_dir: str = DEFAULT_ABI_DIR, chunk_size: int = 10000):
+    '''
+    ---
+    :param: path  `str`  SQLite database file, created on first use
+    :param: abi_dir  `str`  folder of ABIs written by `scripts/tools/exportAllAbi.py`
+    :param: chunk_size  `int`  initial block range of each `eth_getLogs` request, adapted to the node while syncing
+    '''
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    self.abi_dir: str    = abi_dir
+    self.scanner: LogScanner = LogScanner(chunk_size)
+    self.chain_id: int   = web3.eth.chain_id
+    self._db             = sqlite3.connect(path)
+    self._contracts: Dict[str, Tuple[str, int]] = {}   # address -> (contract name, deployment block)
+    self._topics: Dict[Tuple[str, str], Tuple[object, dict, str]] = {}  # (address, topic0) -> (web3 event, abi, table)
+    self._db.execute('''
+      CREATE TABLE IF NOT EXISTS cursors (
+        chain_id   INTEGER NOT NULL,
+        address    TEXT    NOT NULL,
+        last_block INTEGER NOT NULL,
+        PRIMARY KEY (chain_id, address)
+      )
+    ''')
+
+  def add_contract(self, name: str, address: str, start_block: int = 0):
+    '''
+    Register a deployed contract to index
+
+    ---
+    :param: name  `str`  contract name whose ABI is read from `abi_dir`, e.g. `DailyPayout`
+    :param: address  `str`  deployed address
+    :param: start_block  `int`  first block to scan, typically the deployment block
+    '''
+    with open(os.path.join(self.abi_dir, f'{ name }.json')) as f:
+      abi: list = json.load(f)
+    address  = web3.toChecksumAddress(address)
+    contract = web3.eth.contract(address=address, abi=abi)
+    for item in abi:
+      if item.get('type') != 'event' or item.get('anonymous'):
+        continue
+      signature: str = f'{ item["name"] }({ ",".join(i["type"] for i in item["inputs"]) })'
+      table: str     = f'{ name }_{ item["name"] }'
+      self._topics[(address, web3.keccak(text=signature).hex())] = (getattr(contract.events, item['name'])(), item, table)
+      self._create_table(table, item)
+    self._contracts[address] = (name, start_block)
+
+  def sync(self, to_block: int = None) -> int:
+    '''
+    Fetch and store all logs of the registered contracts up to `to_block`; returns the number of new rows
+    '''
+    to_block = web3.eth.block_number if to_block is None else to_block
+    stored: int = 0
+    for address, (name, start_block) in self._contracts.items():
+      row = self._db.execute('SELECT last_block FROM cursors WHERE chain_id = ? AND address = ?', (self.chain_id, address)).fetchone()
+      from_block: int = row[0] + 1 if row else start_block
+      topics          = [ topic for contract, topic in self._topics if contract == address ]
+      for start, end, logs in self.scanner.scan({ 'address': address, 'topics': [ topics ] }, from_block, to_block):
+        for log in logs:
+          stored += self._store(log)
+        self._db.execute('INSERT OR REPLACE INTO cursors VALUES (?, ?, ?)', (self.chain_id, address, end))
+        self._db.commit()
+        print(f'{ name } { address }: blocks { start }-{ end }, { len(logs) } log(s)')
+    return stored
+
+  ### Queries ###
+  def claim_totals(self, address: str) -> Dict[str, int]:
+    '''
+    Total claimed per owner from payout contract `address`
+    '''
+    address                = web3.toChecksumAddress(address)
+    totals: Dict[str, int] = defaultdict(int)
+    for owner, amount in self._db.execute(f'SELECT "from", amount FROM "{ self._table(address, "Claim") }" WHERE chain_id = ? AND address = ?', (self.chain_id, address)):
+      totals[owner] += int(amount)
+    return dict(totals)
+
+  def distributions(self, address: str) -> List[Tuple[int, str, int]]:
+    '''
+    `(epoch, distributor, amount)` of payout contract `address`; each `distribute` pushes one epoch
+    '''
+    address = web3.toChecksumAddress(address)
+    rows    = self._db.execute(
+      f'SELECT distributor, amount FROM "{ self._table(address, "Distribute") }" WHERE chain_id = ? AND address = ? ORDER BY block_number, log_index',
+      (self.chain_id, address)
+    )
+    return [ (epoch, distributor, int(amount)) for epoch, (distributor, amount) in enumerate(rows) ]
+
+  def delegatee_activity(self, address: str) -> Dict[str, Tuple[int, int]]:
+    '''
+    `(calls, total amount)` of `distribute()` per caller of `Distributor` at `address`
+    '''
+    address                              = web3.toChecksumAddress(address)
+    activity: Dict[str, Tuple[int, int]] = {}
+    for distributor, amount in self._db.execute(f'SELECT distributor, amount FROM "{ self._table(address, "CallDistribute") }" WHERE chain_id = ? AND address = ?', (self.chain_id, address)):
+      calls, total = activity.get(distributor, (0, 0))
+      activity[distributor] = (calls + 1, total + int(amount))
+    return activity
+
+  def _table(self, address: str, event: str) -> str:
+    return f'{ self._contracts[address][0] }_{ event }'
+
+  def _create_table(self, name: str, event_abi: dict):
+    columns: str = ''.join(f', "{ i["name"] }" { _column_type(i["type"]) }' for i in event_abi['inputs'])
+    self._db.execute(f'''
+      CREATE TABLE IF NOT EXISTS "{ name }" (
+        chain_id     INTEGER NOT NULL,
+        address      TEXT    NOT NULL,
+        block_number INTEGER NOT NULL,
+        tx_hash      TEXT    NOT NULL,
+        log_index    INTEGER NOT NULL{ columns },
+        PRIMARY KEY (chain_id, tx_hash, log_index)
+      )
+    ''')
+    self._db.execute(f'CREATE INDEX IF NOT EXISTS "{ name }_block" ON "{ name }" (chain_id, address, block_number)')
+    for i in event_abi['inputs']:
+      if i['type'] == 'address':
+        self._db.execute(f'CREATE INDEX IF NOT EXISTS "{ name }_{ i["name"] }" ON "{ name }" (chain_id, address, "{ i["name"] }")')
+
+  def _store(self, log) -> int:
+    event, abi, table = self._topics[(log['address'], log['topics'][0].hex())]
+    decoded    = event.processLog(log)
+    values     = [ _encode(i['type'], decoded['args'][i['name']]) for i in abi['inputs'] ]
+    columns    = ''.join(f', "{ i["name"] }"' for i in abi['inputs'])
+    marks      = ', ?' * len(values)
+    cursor     = self._db.execute(
+      f'INSERT OR IGNORE INTO "{ table }" (chain_id, address, block_number, tx_hash, log_index{ columns }) VALUES (?, ?, ?, ?, ?{ marks })',
+      [ self.chain_id, decoded['address'], decoded['blockNumber'], decoded['transactionHash'].hex(), decoded['logIndex'] ] + values
+    )
+    return cursor.rowcount
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3.7
+# coding:utf-8
+# Copyright (C) 2019-2021 All rights reserved.
+# FILENAME:  scripts/utils/keeper.py
+# VERSION: 	 1.0
+# CREATED: 	 2026-10-18 19:30
+# AUTHOR: 	 Aekasitt Guruvanich <sitt@coinflex.com>
+# DESCRIPTION:
+#   Distribution keeper: watches the FLEX balance of every Distributor and
+#   pipelines `distribute()` calls with local nonces, keeping throughput and
+#   latency metrics.
+# HISTORY:
+#*************************************************************
+### Standard Packages ###
+import json
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+### Third-Party Packages ###
+from brownie import history, web3
+from web3.exceptions import TransactionNotFound
+### Local Modules ###
+from .multicall import BatchCaller
+from .nonces import NonceManager
+
+@dataclass
+class PendingDistribution:
+  name: str
+  amount: int
+  txid: str
+  nonce: int
+  sent_at: float
+  sent_block: int
+
+@dataclass
+class KeeperMetrics:
+  '''
+  Counters and confirmation latencies since the keeper started
+  '''
+  started_at: float        = field(default_factory=time.time)
+  polls: int               = 0
+  sent: int                = 0
+  confirmed: int           = 0
+  failed: int              = 0
+  not_sent: int            = 0
+  distributed: int         = 0
+  latencies: List[float]   = field(default_factory=list) # seconds from broadcast to receipt
+  latency_blocks: List[int] = field(default_factory=list)
+
+  def snapshot(self) -> dict:
+    elapsed: float         = max(time.time() - self.started_at, 1e-9)
+    latencies: List[float] = sorted(self.latencies)
+    percentile             = lambda q: latencies[min(int(q * len(latencies)), len(latencies) - 1)] if latencies else None
+    return {
+      'uptime_seconds': round(elapsed, 1),
+      'polls': self.polls,
+      'sent': self.sent,
+      'confirmed': self.confirmed,
+      'failed': self.failed,
+      'not_sent': self.not_sent,
+      'pending': self.sent - self.confirmed - self.failed,
+      'distributed': str(self.distributed),
+      'throughput_per_hour': round(self.confirmed * 3600 / elapsed, 2),
+      'latency_seconds_mean': round(sum(latencies) / len(latencies), 3) if latencies else None,
+      'latency_seconds_p50': percentile(0.5),
+      'latency_seconds_p95': percentile(0.95),
+      'latency_blocks_mean': round(sum(self.latency_blocks) / len(self.latency_blocks), 2) if self.latency_blocks else None,
+    }
+
+class DistributionKeeper:
+  '''
+  Fires `distribute()` on every Distributor holding a non-zero FLEX balance, at most one pending
+  transaction per Distributor. Transactions are broadcast without waiting for receipts, using
+  locally managed nonces; receipts are collected on later polls. A gas strategy may re-broadcast a pending
+  distribution at a higher price under the same nonce, so distributions are settled by nonce rather than by
+  the hash they were first sent with.
+  '''
+
+  def __init__(self, flex, distributors: Dict[str, object], account, tx_params: Optional[dict] = None, nonces: Optional[NonceManager] = None):
+    '''
+    ---
+    :param: flex  `FLEXCoin`  payout token
+    :param: distributors  `Dict[str, Distributor]`  distributors by name, e.g. daily and quarterly
+    :param: account  `Account`  admin or delegatee of every Distributor
+    :param: tx_params  `dict`  extra transaction parameters, e.g. the gas price strategy
+    :param: nonces  `NonceManager`  shared nonce source of `account`; created if missing
+    '''
+    self.flex                 = flex
+    self.distributors: dict   = distributors
+    self.account              = account
+    self.tx_params: dict      = tx_params or {}
+    self.nonces: NonceManager = nonces or NonceManager(account.address)
+    self.metrics              = KeeperMetrics()
+    self.pending: Dict[str, PendingDistribution] = {}
+
+  def poll(self) -> List[PendingDistribution]:
+    '''
+    Collect receipts, then read every balance at one block and broadcast the distributions due
+    '''
+    self.metrics.polls += 1
+    self.reap()
+    block: int             = web3.eth.block_number
+    caller: BatchCaller    = BatchCaller()
+    names: List[str]       = list(self.distributors)
+    for name in names:
+      caller.add(self.flex.balanceOf, self.distributors[name].address)
+    balances: List[int]    = caller.execute(block)
+    sent: List[PendingDistribution] = []
+    for name, balance in zip(names, balances):
+      if balance == 0 or name in self.pending:
+        continue
+      nonce: int = self.nonces.next()
+      try:
+        txn = self.distributors[name].distribute({ 'from': self.account, 'nonce': nonce, 'required_confs': 0, **self.tx_params })
+      except Exception as err: # not broadcast, e.g. failed gas estimate; its nonce is free again
+        self.nonces.resync()
+        self.metrics.not_sent += 1
+        print(f'{ name }: distribute of { balance } not sent: { err }')
+        continue
+      self.pending[name] = PendingDistribution(name, balance, txn.txid, nonce, time.time(), block)
+      self.metrics.sent += 1
+      sent.append(self.pending[name])
+      print(f'{ name }: distribute { balance } sent with nonce { nonce }: { txn.txid }')
+    return sent
+
+  def reap(self) -> int:
+    '''
+    Record the receipts of pending distributions whose nonce has been mined; returns how many were
+    '''
+    if not self.pending:
+      return 0
+    mined_nonces: int = web3.eth.get_transaction_count(self.account.address) # nonces below it are all mined
+    mined: int        = 0
+    for name, pending in list(self.pending.items()):
+      if pending.nonce >= mined_nonces:
+        continue
+      del self.pending[name]
+      mined  += 1
+      receipt = self._receipt(pending.nonce)
+      if receipt is None:
+        self.metrics.failed += 1
+        print(f'{ name }: nonce { pending.nonce } was mined by a transaction the keeper did not send')
+      elif receipt['status'] == 1:
+        self.metrics.confirmed   += 1
+        self.metrics.distributed += pending.amount
+        self.metrics.latencies.append(time.time() - pending.sent_at)
+        self.metrics.latency_blocks.append(receipt['blockNumber'] - pending.sent_block)
+      else:
+        self.metrics.failed += 1
+        print(f'{ name }: distribute with nonce { pending.nonce } reverted: { receipt["transactionHash"].hex() }')
+    return mined
+
+  def _receipt(self, nonce: int) -> Optional[dict]:
+    '''
+    Receipt of whichever transaction sent by this process with `nonce` was mined: the original or a replacement
+    '''
+    for txn in history.filter(sender=self.account, nonce=nonce):
+      try:
+        receipt = web3.eth.get_transaction_receipt(txn.txid)
+      except TransactionNotFound:
+        continue
+      if receipt is not None:
+        return receipt
+    return None
+
+  def drain(self, timeout: float = 120, interval: float = 1) -> bool:
+    '''
+    Wait until every pending distribution is mined; returns `False` on timeout
+    '''
+    deadline: float = time.time() + timeout
+    while self.pending and time.time() < deadline:
+      if self.reap() == 0:
+        time.sleep(interval)
+    return not self.pending
+
+  def save_metrics(self, path: str):
+    '''
+    Writes the current metrics snapshot as JSON, atomically, for dashboards to pick up
+    '''
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(f'{ path }.tmp', 'w') as f:
+      json.dump(self.metrics.snapshot(), f, indent=2)
+    os.replace(f'{ path }.tmp', path)
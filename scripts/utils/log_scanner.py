@@ -0,0 +1,74 @@
+#!/usr/bin/env python3.7
+# coding:utf-8
+# Copyright (C) 2019-2021 All rights reserved.
+# FILENAME:  scripts/utils/log_scanner.py
+# VERSION: 	 1.0
+# CREATED: 	 2026-10-19 00:20
+# AUTHOR: 	 Aekasitt Guruvanich <sitt@coinflex.com>
+# DESCRIPTION:
+#   `eth_getLogs` over long block ranges in chunks sized to the node: ranges
+#   are halved when the node rejects a request as too large and doubled while
+#   they come back sparse.
+# HISTORY:
+#*************************************************************
+### Standard Packages ###
+from typing import Iterator, List, Tuple
+### Third-Party Packages ###
+from brownie import web3
+from requests.exceptions import Timeout
+
+# fragments of the errors nodes return for oversized `eth_getLogs` requests, e.g. geth
+# `query returned more than 10000 results`, infura `limit exceeded` or `block range is too wide`
+OVERSIZED: Tuple[str, ...] = ('more than', 'too many', 'limit exceeded', 'exceeds', 'response size', 'range', 'timeout', 'timed out')
+
+def _is_oversized(err: Exception) -> bool:
+  return isinstance(err, Timeout) or any(fragment in str(err).lower() for fragment in OVERSIZED)
+
+class LogScanner:
+  '''
+  Adaptive block-range scanner. The chunk size is kept between scans, so one scanner shared by
+  consecutive syncs starts at the size that last worked.
+  '''
+
+  def __init__(self, chunk_size: int = 10000, min_chunk: int = 1, max_chunk: int = 500000, target_logs: int = 1000):
+    '''
+    ---
+    :param: chunk_size  `int`  block range of the first request
+    :param: min_chunk  `int`  smallest range; a node still rejecting it raises the error
+    :param: max_chunk  `int`  largest range the chunk grows to
+    :param: target_logs  `int`  logs per request; the range doubles while fewer than half come back
+    '''
+    self.chunk_size: int  = chunk_size
+    self.min_chunk: int   = min_chunk
+    self.max_chunk: int   = max_chunk
+    self.target_logs: int = target_logs
+    self.requests: int    = 0
+    self.shrinks: int     = 0
+
+  def scan(self, params: dict, from_block: int, to_block: int) -> Iterator[Tuple[int, int, List[dict]]]:
+    '''
+    Yields `(start, end, logs)` for consecutive block ranges covering `from_block` to `to_block`.
+    Ranges are yielded in order, so callers may persist `end` as their cursor after each one.
+
+    ---
+    :param: params  `dict`  `eth_getLogs` filter without the block range, e.g. `{ 'address': ..., 'topics': [...] }`
+    :param: from_block  `int`  first block to scan
+    :param: to_block  `int`  last block to scan
+    :returns: `Iterator[Tuple[int, int, List[dict]]]`
+    '''
+    start: int = from_block
+    while start <= to_block:
+      end: int = min(start + self.chunk_size - 1, to_block)
+      try:
+        self.requests += 1
+        logs: List[dict] = web3.eth.get_logs({ **params, 'fromBlock': start, 'toBlock': end })
+      except (ValueError, Timeout) as err:
+        if end == start or self.chunk_size <= self.min_chunk or not _is_oversized(err):
+          raise
+        self.chunk_size = max(self.min_chunk, min(self.chunk_size, end - start + 1) // 2)
+        self.shrinks   += 1
+        continue
+      yield start, end, logs
+      if len(logs) < self.target_logs // 2 and end - start + 1 == self.chunk_size:
+        self.chunk_size = min(self.max_chunk, self.chunk_size * 2)
+      start = end + 1
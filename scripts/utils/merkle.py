@@ -0,0 +1,89 @@
+#!/usr/bin/env python3.7
+# coding:utf-8
+# Copyright (C) 2019-2021 All rights reserved.
+# FILENAME:  scripts/utils/merkle.py
+# VERSION: 	 1.0
+# CREATED: 	 2026-10-18 16:02
+# AUTHOR: 	 Aekasitt Guruvanich <sitt@coinflex.com>
+# DESCRIPTION:
+#   Off-chain builder of the cumulative-entitlement Merkle tree published to
+#   `contracts/MerklePayout.sol`.
+# HISTORY:
+#*************************************************************
+### Standard Packages ###
+from typing import Dict, List, Sequence
+### Third-Party Packages ###
+from eth_utils import keccak, to_checksum_address
+### Local Modules ###
+from .rewards import claimable
+
+def leaf(owner: str, cumulative_amount: int) -> bytes:
+  '''
+  `keccak256(abi.encodePacked(owner, cumulativeAmount))` as computed by `MerklePayout`
+  '''
+  return keccak(bytes.fromhex(owner[2:]) + cumulative_amount.to_bytes(32, 'big'))
+
+def _hash_pair(a: bytes, b: bytes) -> bytes:
+  return keccak(a + b) if a <= b else keccak(b + a) # sorted pairs, as OpenZeppelin `MerkleProof`
+
+class MerkleTree:
+  '''
+  Merkle tree over (owner, cumulative entitlement) leaves with the sorted-pair hashing of
+  OpenZeppelin `MerkleProof.verify`. An odd node at the end of a level is carried up unchanged.
+  '''
+
+  def __init__(self, entitlements: Dict[str, int]):
+    '''
+    ---
+    :param: entitlements  `Dict[str, int]`  cumulative entitlement of each owner since epoch 0
+    '''
+    self.entitlements: Dict[str, int] = { to_checksum_address(owner): amount for owner, amount in entitlements.items() }
+    self.owners: List[str]            = sorted(self.entitlements)
+    self.levels: List[List[bytes]]    = [[ leaf(owner, self.entitlements[owner]) for owner in self.owners ]]
+    while len(self.levels[-1]) > 1:
+      nodes: List[bytes] = self.levels[-1]
+      self.levels.append([ _hash_pair(nodes[i], nodes[i + 1]) if i + 1 < len(nodes) else nodes[i] for i in range(0, len(nodes), 2) ])
+
+  @property
+  def root(self) -> bytes:
+    return self.levels[-1][0] if self.levels[-1] else bytes(32)
+
+  def proof(self, owner: str) -> List[bytes]:
+    index: int          = self.owners.index(to_checksum_address(owner))
+    proof: List[bytes]  = []
+    for nodes in self.levels[:-1]:
+      sibling: int = index ^ 1
+      if sibling < len(nodes):
+        proof.append(nodes[sibling])
+      index //= 2
+    return proof
+
+  def to_dict(self, epochs: int) -> dict:
+    '''
+    JSON-friendly publication of the tree: root, covered epochs and every owner's claim arguments
+    '''
+    return {
+      'root': '0x' + self.root.hex(),
+      'epochs': epochs,
+      'claims': {
+        owner: {
+          'cumulativeAmount': str(self.entitlements[owner]),
+          'proof': [ '0x' + node.hex() for node in self.proof(owner) ],
+        } for owner in self.owners
+      },
+    }
+
+def build_tree(owners: Sequence[str], balances: Sequence[Sequence[int]], payouts: Sequence[int], totals: Sequence[int]) -> MerkleTree:
+  '''
+  Builds the tree of cumulative entitlements from veFLEX snapshots at each epoch start block,
+  with the same share arithmetic as `DailyPayout._getClaimableUntilEpoch`
+
+  ---
+  :param: owners  `Sequence[str]`  veFLEX holders
+  :param: balances  `Sequence[Sequence[int]]`  `balanceOfAt` shaped owners x epochs
+  :param: payouts  `Sequence[int]`  `payoutForEpoch` of each covered epoch
+  :param: totals  `Sequence[int]`  `totalSupplyAt` at the start block of each covered epoch
+  :returns: `MerkleTree`
+  '''
+  amounts: List[int] = claimable(balances, payouts, totals)
+  return MerkleTree({ owner: amount for owner, amount in zip(owners, amounts) if amount > 0 })
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3.7
+# coding:utf-8
+# Copyright (C) 2019-2021 All rights reserved.
+# FILENAME:  scripts/utils/multicall.py
+# VERSION: 	 1.0
+# CREATED: 	 2026-10-18 10:12
+# AUTHOR: 	 Aekasitt Guruvanich <sitt@coinflex.com>
+# DESCRIPTION:
+#   Packs many read-only contract calls into JSON-RPC batch requests
+#   pinned to a single block height.
+# HISTORY:
+#*************************************************************
+### Standard Packages ###
+from typing import Any, List, Optional, Tuple
+### Third-Party Packages ###
+from brownie import web3
+from brownie.network.contract import ContractCall
+from requests import Session
+### Local Modules ###
+from .read_cache import ReadCache
+
+class BatchCaller:
+  '''
+  Queue of `eth_call` requests sent to the node as JSON-RPC batches.
+  Every call in one `execute` is pinned to the same block so the results form a consistent snapshot.
+  '''
+
+  def __init__(self, endpoint: Optional[str] = None, batch_size: int = 500, sender: Optional[str] = None, timeout: int = 60, cache: Optional[ReadCache] = None):
+    '''
+    ---
+    :param: endpoint  `str`  HTTP RPC url; defaults to the url of the connected brownie network
+    :param: batch_size  `int`  maximum number of calls sent in one HTTP round trip
+    :param: sender  `str`  address used as `from` for every call; needed for operator-gated views
+    :param: timeout  `int`  seconds to wait for each batch response
+    :param: cache  `ReadCache`  answers calls queued with `final=True` without a round trip when already known
+    '''
+    self.endpoint: str   = endpoint or web3.provider.endpoint_uri
+    self.batch_size: int = batch_size
+    self.sender: str     = str(sender) if sender is not None else None
+    self.timeout: int    = timeout
+    self.cache: ReadCache = cache
+    self.round_trips: int = 0
+    self._calls: List[Tuple[ContractCall, tuple, bool]] = []
+    self._cached: dict   = {}
+    self._session        = Session()
+
+  def __len__(self) -> int:
+    return len(self._calls)
+
+  def add(self, call: ContractCall, *args: Any, final: bool = False) -> int:
+    '''
+    Queue `call(*args)` and return its index in the result list of the next `execute`
+
+    ---
+    :param: call  `ContractCall`  bound view method, e.g. `payout.payoutForEpoch`
+    :param: final  `bool`  the result can never change anymore, so it may be served from and stored in the cache
+    :returns: `int`
+    '''
+    index: int = len(self._calls)
+    self._calls.append((call, args, final))
+    if final and self.cache is not None:
+      hit, value = self.cache.get(call, args)
+      if hit:
+        self._cached[index] = value
+    return index
+
+  def execute(self, block_identifier: int) -> List[Any]:
+    '''
+    Send all queued calls at `block_identifier` and return the decoded results in queue order.
+    Raises `ValueError` if the node rejects any call in the batch.
+
+    ---
+    :param: block_identifier  `int`  block height every call is pinned to
+    :returns: `List[Any]`
+    '''
+    calls, self._calls   = self._calls, []
+    cached, self._cached = self._cached, {}
+    block: str           = hex(block_identifier)
+    results: List[Any]   = [None] * len(calls)
+    for index, value in cached.items():
+      results[index] = value
+    pending: List[int]   = [ index for index in range(len(calls)) if index not in cached ]
+    for offset in range(0, len(pending), self.batch_size):
+      chunk    = pending[offset:offset + self.batch_size]
+      payload  = [ self._request(index, calls[index][0], calls[index][1], block) for index in chunk ]
+      response = self._session.post(self.endpoint, json=payload, timeout=self.timeout)
+      response.raise_for_status()
+      self.round_trips += 1
+      replies  = response.json()
+      if not isinstance(replies, list):
+        raise ValueError(f'Node at `{ self.endpoint }` does not support JSON-RPC batches: { replies }')
+      for reply in replies:
+        index: int = reply['id']
+        call, args, final = calls[index]
+        if 'error' in reply:
+          raise ValueError(f'{ call._name }{ args } failed: { reply["error"].get("message") }')
+        results[index] = call.decode_output(reply['result'])
+        if final and self.cache is not None:
+          self.cache.put(call, args, results[index])
+    if self.cache is not None:
+      self.cache.commit()
+    return results
+
+  def _request(self, index: int, call: ContractCall, args: tuple, block: str) -> dict:
+    tx: dict = { 'to': call._address, 'data': call.encode_input(*args) }
+    if self.sender is not None:
+      tx['from'] = self.sender
+    return { 'jsonrpc': '2.0', 'id': index, 'method': 'eth_call', 'params': [tx, block] }
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3.7
+# coding:utf-8
+# Copyright (C) 2019-2021 All rights reserved.
+# FILENAME:  scripts/utils/nonces.py
+# VERSION: 	 1.0
+# CREATED: 	 2026-10-18 19:30
+# AUTHOR: 	 Aekasitt Guruvanich <sitt@coinflex.com>
+# DESCRIPTION:
+#   Local nonce assignment, so that transactions of one account can be
+#   broadcast back to back without waiting for each receipt.
+# HISTORY:
+#*************************************************************
+### Standard Packages ###
+from threading import Lock
+### Third-Party Packages ###
+from brownie import web3
+
+class NonceManager:
+  '''
+  Hands out consecutive nonces of one account, starting from its pending transaction count.
+  Thread-safe; call `resync` whenever a transaction could not be broadcast, as its nonce is then unused.
+  '''
+
+  def __init__(self, address: str):
+    '''
+    ---
+    :param: address  `str`  sending account
+    '''
+    self.address: str = str(address)
+    self._lock        = Lock()
+    self._next: int   = web3.eth.get_transaction_count(self.address, 'pending')
+
+  def next(self) -> int:
+    '''
+    Reserve the next nonce
+    '''
+    with self._lock:
+      nonce: int = self._next
+      self._next += 1
+      return nonce
+
+  def peek(self) -> int:
+    return self._next
+
+  def resync(self) -> int:
+    '''
+    Restart from the node's pending transaction count; returns the next nonce
+    '''
+    with self._lock:
+      self._next = web3.eth.get_transaction_count(self.address, 'pending')
+      return self._next
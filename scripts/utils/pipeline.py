@@ -0,0 +1,165 @@
+#!/usr/bin/env python3.7
+# coding:utf-8
+# Copyright (C) 2019-2021 All rights reserved.
+# FILENAME:  scripts/utils/pipeline.py
+# VERSION: 	 1.0
+# CREATED: 	 2026-10-18 20:00
+# AUTHOR: 	 Aekasitt Guruvanich <sitt@coinflex.com>
+# DESCRIPTION:
+#   Transaction pipeline for deployment scripts: transactions are broadcast
+#   back to back with local nonces and only wait on the steps they depend on.
+# HISTORY:
+#*************************************************************
+### Standard Packages ###
+from threading import Lock
+from typing import Any, Iterable, List, Optional
+### Third-Party Packages ###
+from brownie import history, web3
+### Local Modules ###
+from .nonces import NonceManager
+
+class Step:
+  '''
+  One broadcast transaction of the pipeline, a deployment or a contract call
+  '''
+
+  def __init__(self, name: str, deps: List['Step'], container: Any = None):
+    self.name: str          = name
+    self.deps: List[Step]   = deps
+    self.container          = container # set for deployments
+    self.nonce: int         = None
+    self.txn                = None
+    self.contract           = None
+    self.sent_block: int    = None # chain head when broadcast; the transaction can be mined from the next block on
+    self.mined_block: int   = None
+
+  def overlaps(self, other: 'Step') -> bool:
+    '''
+    Both transactions were pending during at least one common block, going by the chain rather than
+    by when their receipts happened to be awaited
+    '''
+    if other is self or None in (self.sent_block, self.mined_block, other.sent_block, other.mined_block):
+      return False
+    return self.sent_block < other.mined_block and other.sent_block < self.mined_block
+
+class TxPipeline:
+  '''
+  Sends the transactions of one account without waiting for their receipts. A step waits only for the
+  steps given as `deps` or passed among its target and arguments, e.g. a deployment whose address it needs.
+  Steps may be submitted from several threads; nonces are assigned and broadcast under one lock so they never leave a gap.
+  '''
+
+  def __init__(self, account, tx_params: Optional[dict] = None, nonces: Optional[NonceManager] = None):
+    '''
+    ---
+    :param: account  `Account`  sender of every transaction
+    :param: tx_params  `dict`  extra transaction parameters, e.g. the gas price strategy
+    :param: nonces  `NonceManager`  shared nonce source of `account`; created if missing
+    '''
+    self.account              = account
+    self.tx_params: dict      = tx_params or {}
+    self.nonces: NonceManager = nonces or NonceManager(account.address)
+    self.steps: List[Step]    = []
+    self._send_lock           = Lock()
+
+  def deploy(self, name: str, container, *args: Any, deps: Iterable[Step] = ()) -> Step:
+    '''
+    Broadcast the deployment of `container` once its dependencies are mined
+
+    ---
+    :param: name  `str`  step name used in the report
+    :param: container  `ContractContainer`  e.g. `DailyPayout`
+    :param: args  constructor arguments; `Step` arguments resolve to the deployed contract
+    :param: deps  `Iterable[Step]`  further steps to wait for
+    :returns: `Step`
+    '''
+    step: Step = Step(name, self._dependencies(args, deps), container)
+    resolved   = [ self.result(arg) if isinstance(arg, Step) else arg for arg in args ]
+    return self._send(step, container.deploy, resolved)
+
+  def call(self, name: str, target, method: str, *args: Any, deps: Iterable[Step] = ()) -> Step:
+    '''
+    Broadcast `target.method(*args)` once its dependencies are mined
+
+    ---
+    :param: name  `str`  step name used in the report
+    :param: target  `Contract | Step`  contract, or the deployment step of it
+    :param: method  `str`  name of the state-changing method
+    :param: args  method arguments; `Step` arguments resolve to the deployed contract
+    :param: deps  `Iterable[Step]`  further steps to wait for
+    :returns: `Step`
+    '''
+    step: Step = Step(name, self._dependencies((target, *args), deps))
+    contract   = self.result(target) if isinstance(target, Step) else target
+    resolved   = [ self.result(arg) if isinstance(arg, Step) else arg for arg in args ]
+    return self._send(step, getattr(contract, method), resolved)
+
+  def result(self, step: Step):
+    '''
+    Wait for `step` to be mined; returns the deployed contract, or the receipt of a call.
+    Raises `RuntimeError` if the transaction reverted or its nonce was taken by a transaction of another step.
+    '''
+    if step.mined_block is None:
+      step.txn         = self._mined(step)
+      step.mined_block = step.txn.block_number
+      if step.txn.status != 1:
+        raise RuntimeError(f'Step `{ step.name }` reverted: { step.txn.txid }')
+      if step.container is not None:
+        step.contract = step.container.at(step.txn.contract_address)
+    return step.contract if step.container is not None else step.txn
+
+  def wait_all(self):
+    for step in self.steps:
+      self.result(step)
+
+  def report(self) -> List[str]:
+    '''
+    One line per step: nonce, blocks pending and the steps it overlapped with
+    '''
+    lines: List[str] = []
+    for step in self.steps:
+      if step.mined_block is None:
+        lines.append(f'{ step.name }: nonce { step.nonce }, not mined yet')
+        continue
+      overlapped: List[str] = [ other.name for other in self.steps if step.overlaps(other) ]
+      lines.append(
+        f'{ step.name }: nonce { step.nonce }, mined in block { step.mined_block }, { step.mined_block - step.sent_block } block(s) after broadcast'
+        f'{ ", overlapped with " + ", ".join(overlapped) if overlapped else ", alone in flight" }'
+      )
+    return lines
+
+  def _mined(self, step: Step):
+    '''
+    The transaction mined with the nonce of `step`: the one sent, or a re-broadcast of it at a higher
+    price by the gas strategy, in which case the one sent is dropped and never gets a receipt
+    '''
+    step.txn.wait(1)
+    if step.txn.status != -2:
+      return step.txn
+    for txn in history.filter(sender=self.account, nonce=step.nonce):
+      if txn is step.txn:
+        continue
+      txn.wait(1)
+      if txn.status != -2:
+        return txn
+    raise RuntimeError(f'Step `{ step.name }` dropped: nonce { step.nonce } was mined by an unknown transaction')
+
+  def _dependencies(self, args: Iterable[Any], deps: Iterable[Step]) -> List[Step]:
+    found: List[Step] = list(deps)
+    found            += [ arg for arg in args if isinstance(arg, Step) and arg not in found ]
+    for dep in found:
+      self.result(dep)
+    return found
+
+  def _send(self, step: Step, send, args: List[Any]) -> Step:
+    with self._send_lock:
+      step.nonce      = self.nonces.next()
+      step.sent_block = web3.eth.block_number
+      try:
+        step.txn = send(*args, { 'from': self.account, 'nonce': step.nonce, 'required_confs': 0, **self.tx_params })
+      except Exception:
+        self.nonces.resync() # nothing later was assigned yet, so the nonce is simply reused
+        raise
+      self.steps.append(step)
+    print(f'{ step.name }: sent with nonce { step.nonce }')
+    return step
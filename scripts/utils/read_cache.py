@@ -0,0 +1,102 @@
+#!/usr/bin/env python3.7
+# coding:utf-8
+# Copyright (C) 2019-2021 All rights reserved.
+# FILENAME:  scripts/utils/read_cache.py
+# VERSION: 	 1.0
+# CREATED: 	 2026-10-18 13:02
+# AUTHOR: 	 Aekasitt Guruvanich <sitt@coinflex.com>
+# DESCRIPTION:
+#   Persistent read-through cache of immutable historical contract reads,
+#   stored in SQLite under the brownie build folder.
+# HISTORY:
+#*************************************************************
+### Standard Packages ###
+import json
+import os
+import sqlite3
+from typing import Any, Optional, Tuple
+
+ANY_BLOCK: int     = -1 # result no longer depends on the block it is read at
+DEFAULT_PATH: str  = 'build/cache/contract-reads.sqlite'
+
+class ReadCache:
+  '''
+  Stores contract view results keyed by (chain id, contract address, method, args, block).
+  Only reads that can never change should go in: use `ANY_BLOCK` for values that are final
+  regardless of the block they are read at, e.g. `payoutForEpoch(i)` of a distributed epoch.
+  '''
+
+  def __init__(self, chain_id: int, path: str = DEFAULT_PATH):
+    '''
+    ---
+    :param: chain_id  `int`  chain id of the connected network; entries never leak across networks
+    :param: path  `str`  SQLite database file, created on first use
+    '''
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    self.chain_id: int = chain_id
+    self.hits: int     = 0
+    self.misses: int   = 0
+    self._db           = sqlite3.connect(path)
+    self._db.execute('''
+      CREATE TABLE IF NOT EXISTS reads (
+        chain_id INTEGER NOT NULL,
+        address  TEXT    NOT NULL,
+        method   TEXT    NOT NULL,
+        args     TEXT    NOT NULL,
+        block    INTEGER NOT NULL,
+        value    TEXT    NOT NULL,
+        PRIMARY KEY (chain_id, address, method, args, block)
+      ) WITHOUT ROWID
+    ''')
+
+  def get(self, call, args: tuple, block: int = ANY_BLOCK) -> Tuple[bool, Any]:
+    '''
+    Look up `call(*args)`; returns `(hit, value)`
+
+    ---
+    :param: call  `ContractCall`  bound view method, e.g. `payout.payoutForEpoch`
+    :param: args  `tuple`  call arguments
+    :param: block  `int`  block the read is pinned to, or `ANY_BLOCK`
+    '''
+    row = self._db.execute(
+      'SELECT value FROM reads WHERE chain_id = ? AND address = ? AND method = ? AND args = ? AND block = ?',
+      self._key(call, args, block)
+    ).fetchone()
+    if row is None:
+      self.misses += 1
+      return False, None
+    self.hits += 1
+    return True, json.loads(row[0])
+
+  def put(self, call, args: tuple, value: Any, block: int = ANY_BLOCK):
+    self._db.execute('INSERT OR REPLACE INTO reads VALUES (?, ?, ?, ?, ?, ?)', self._key(call, args, block) + (json.dumps(value),))
+
+  def call(self, call, *args: Any, block: int = ANY_BLOCK, tx: Optional[dict] = None) -> Any:
+    '''
+    Read-through `call(*args)`: answer from the cache or query the node and remember the result
+
+    ---
+    :param: call  `ContractCall`  bound view method
+    :param: block  `int`  block the read is pinned to, or `ANY_BLOCK`
+    :param: tx  `dict`  transaction parameters such as `from`, not part of the cache key
+    '''
+    hit, value = self.get(call, args, block)
+    if hit:
+      return value
+    params: tuple = args + ((tx,) if tx is not None else ())
+    value = call(*params) if block == ANY_BLOCK else call(*params, block_identifier=block)
+    self.put(call, args, value, block)
+    return value
+
+  def commit(self):
+    self._db.commit()
+
+  def close(self):
+    self._db.commit()
+    self._db.close()
+
+  def _key(self, call, args: tuple, block: int) -> tuple:
+    abi: dict  = call.abi
+    method     = f'{ abi["name"] }({ ",".join(i["type"] for i in abi["inputs"]) })'
+    normalized = [ arg if isinstance(arg, int) else str(arg).lower() for arg in args ]
+    return (self.chain_id, str(call._address).lower(), method, json.dumps(normalized), block)
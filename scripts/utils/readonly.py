@@ -0,0 +1,63 @@
+#!/usr/bin/env python3.7
+# coding:utf-8
+# Copyright (C) 2019-2021 All rights reserved.
+# FILENAME:  scripts/utils/readonly.py
+# VERSION: 	 1.0
+# CREATED: 	 2026-10-18 21:15
+# AUTHOR: 	 Aekasitt Guruvanich <sitt@coinflex.com>
+# DESCRIPTION:
+#   Read-only contract client for quick operational checks. Uses the ABIs
+#   exported by `scripts/tools/exportAllAbi.py` and plain web3; importing
+#   brownie (project, compiler and network config) is deliberately avoided.
+# HISTORY:
+#*************************************************************
+### Standard Packages ###
+import json
+import os
+from typing import Any, Dict, Optional
+
+DEFAULT_ABI_DIR: str = 'build/abi'
+
+class ReadOnlyClient:
+  '''
+  Connects straight to an RPC url and binds exported ABIs to addresses.
+  `web3` itself is only imported on construction, so importing this module stays free.
+  '''
+
+  def __init__(self, rpc_url: str, abi_dir: str = DEFAULT_ABI_DIR, timeout: int = 10):
+    '''
+    ---
+    :param: rpc_url  `str`  HTTP RPC endpoint, e.g. `https://smartbch.fountainhead.cash/mainnet`
+    :param: abi_dir  `str`  folder of ABIs written by `scripts/tools/exportAllAbi.py`
+    :param: timeout  `int`  seconds to wait for each response
+    '''
+    from web3 import HTTPProvider, Web3
+    self.web3                   = Web3(HTTPProvider(rpc_url, request_kwargs={ 'timeout': timeout }))
+    self.abi_dir: str           = abi_dir
+    self._abis: Dict[str, list] = {}
+
+  def abi(self, name: str) -> list:
+    if name not in self._abis:
+      path: str = os.path.join(self.abi_dir, f'{ name }.json')
+      try:
+        with open(path) as f:
+          self._abis[name] = json.load(f)
+      except FileNotFoundError:
+        raise ValueError(f'No ABI for `{ name }` at `{ path }`, run `scripts/tools/exportAllAbi.py` after `brownie compile`')
+    return self._abis[name]
+
+  def contract(self, name: str, address: str):
+    '''
+    ---
+    :param: name  `str`  contract name, e.g. `DailyPayout`
+    :param: address  `str`  deployed address
+    :returns: `web3.contract.Contract`
+    '''
+    return self.web3.eth.contract(address=self.web3.toChecksumAddress(address), abi=self.abi(name))
+
+  def call(self, name: str, address: str, method: str, *args: Any, block_identifier: Optional[int] = None) -> Any:
+    '''
+    Shorthand for `contract(name, address).functions.<method>(*args).call()`, optionally at a past block
+    '''
+    function = getattr(self.contract(name, address).functions, method)(*args)
+    return function.call(block_identifier='latest' if block_identifier is None else block_identifier)
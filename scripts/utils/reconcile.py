@@ -0,0 +1,112 @@
+#!/usr/bin/env python3.7
+# coding:utf-8
+# Copyright (C) 2019-2021 All rights reserved.
+# FILENAME:  scripts/utils/reconcile.py
+# VERSION: 	 1.0
+# CREATED: 	 2026-10-18 13:48
+# AUTHOR: 	 Aekasitt Guruvanich <sitt@coinflex.com>
+# DESCRIPTION:
+#   Checkpointed state of the epoch-by-epoch payout reconciliation, so each
+#   run only verifies the epochs distributed since the previous one.
+# HISTORY:
+#*************************************************************
+### Standard Packages ###
+import json
+import os
+from typing import Dict, List
+
+DEFAULT_DIR: str = 'build/cache'
+
+class ReconciliationState:
+  '''
+  Last verified epoch, running sums and per-address totals of one payout contract, as of the block the run was pinned to.
+  The state is tied to the set of reconciled addresses. Holders whose first lock came after the pinned block of the
+  last run are added with zero totals, as they had no balance in the epochs already reconciled; any other change
+  starts over from epoch 0.
+  '''
+
+  def __init__(self, path: str, payout: str, addresses: List[str], block: int):
+    '''
+    ---
+    :param: path  `str`  JSON state file
+    :param: payout  `str`  address of the payout contract being reconciled
+    :param: addresses  `List[str]`  holders whose rewards are reconciled
+    :param: block  `int`  block height the reads of this run are pinned to
+    '''
+    self.path: str                  = path
+    self.payout: str                = payout
+    self.addresses: List[str]       = list(addresses)
+    self.block: int                 = block
+    self.next_epoch: int            = 0
+    self.total_payout: int          = 0
+    self.total_rewards: int         = 0
+    self.per_address: Dict[str, int] = { addr: 0 for addr in addresses }
+    self.mismatches: List[int]      = []
+
+  @classmethod
+  def load(cls, payout: str, addresses: List[str], block: int, first_block: Dict[str, int], directory: str = DEFAULT_DIR) -> 'ReconciliationState':
+    '''
+    Loads the state of `payout` from `directory`, or a fresh one if missing, or if `addresses` dropped any
+    reconciled address or added one that had locked by the pinned block of the saved run
+
+    ---
+    :param: payout  `str`  address of the payout contract being reconciled
+    :param: addresses  `List[str]`  holders whose rewards are reconciled
+    :param: block  `int`  block height the reads of this run are pinned to
+    :param: first_block  `Dict[str, int]`  block of the first deposit of each holder, i.e. `HolderSet.first_block`
+    :returns: `ReconciliationState`
+    '''
+    state = cls(os.path.join(directory, f'reconcile-{ payout.lower() }.json'), payout, addresses, block)
+    try:
+      with open(state.path) as f:
+        content: dict = json.load(f)
+    except FileNotFoundError:
+      return state
+    known: set  = set(content.get('addresses', []))
+    pinned: int = content.get('block')
+    # a holder missing from the saved run is only safe to add with zero totals if it locked after that run's block
+    late: bool  = pinned is not None and all(first_block.get(addr, 0) > pinned for addr in set(state.addresses) - known)
+    if not (late and known.issubset(state.addresses)):
+      print(f'Reconciled addresses changed since `{ state.path }` was written, starting over from epoch 0')
+      return state
+    state.next_epoch    = content['next_epoch']
+    state.total_payout  = content['total_payout']
+    state.total_rewards = content['total_rewards']
+    state.per_address   = { addr: content['per_address'].get(addr, 0) for addr in state.addresses }
+    state.mismatches    = content['mismatches']
+    return state
+
+  def record(self, epoch: int, payout: int, rewards: Dict[str, int]):
+    '''
+    Folds a verified epoch into the running sums; epochs must be recorded in order
+    '''
+    if epoch != self.next_epoch:
+      raise ValueError(f'Expected epoch { self.next_epoch }, got { epoch }')
+    epoch_rewards: int = sum(rewards.values())
+    for addr, reward in rewards.items():
+      self.per_address[addr] += reward
+    self.total_payout  += payout
+    self.total_rewards += epoch_rewards
+    if epoch_rewards > payout:
+      self.mismatches.append(epoch)
+    self.next_epoch = epoch + 1
+
+  def save(self):
+    '''
+    Writes the state atomically, so an interrupted run leaves the previous checkpoint intact
+    '''
+    os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+    content: dict = {
+      'payout': self.payout,
+      'addresses': self.addresses,
+      'block': self.block,
+      'next_epoch': self.next_epoch,
+      'total_payout': self.total_payout,
+      'total_rewards': self.total_rewards,
+      'per_address': self.per_address,
+      'mismatches': self.mismatches,
+    }
+    tmp_path: str = f'{ self.path }.tmp'
+    with open(tmp_path, 'w') as f:
+      json.dump(content, f, indent=2)
+    os.replace(tmp_path, self.path)
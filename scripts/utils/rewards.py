@@ -0,0 +1,75 @@
+#!/usr/bin/env python3.7
+# coding:utf-8
+# Copyright (C) 2019-2021 All rights reserved.
+# FILENAME:  scripts/utils/rewards.py
+# VERSION: 	 1.0
+# CREATED: 	 2026-10-18 12:20
+# AUTHOR: 	 Aekasitt Guruvanich <sitt@coinflex.com>
+# DESCRIPTION:
+#   Batch reward calculator with the uint256 semantics of
+#   `DailyPayout._getClaimableUntilEpoch`.
+# HISTORY:
+#*************************************************************
+### Standard Packages ###
+from typing import List, Optional, Sequence
+### Third-Party Packages ###
+try:
+  import numpy as np
+except ImportError: # numpy is a project dependency; plain python integers keep the scripts usable without it
+  np = None
+
+UINT256_MAX: int = 2 ** 256 - 1
+
+def epoch_rewards(balances: Sequence[Sequence[int]], payouts: Sequence[int], totals: Sequence[int]):
+  '''
+  Per-epoch reward of every holder, `payoutForEpoch[e] * balanceOfAt(owner, start_e) / totalSupplyAt(start_e)`
+  floored as SafeMath does, and zero when the total supply is zero.
+  Raises `OverflowError` where `SafeMath.mul` would revert.
+
+  ---
+  :param: balances  `Sequence[Sequence[int]]`  veFLEX balances shaped addresses x epochs
+  :param: payouts  `Sequence[int]`  `payoutForEpoch` for each epoch
+  :param: totals  `Sequence[int]`  `totalSupplyAt` at the start block of each epoch
+  :returns: rows of per-epoch rewards shaped addresses x epochs; an object `ndarray` when numpy is available
+  '''
+  if np is None:
+    rows: List[List[int]] = []
+    for row in balances:
+      rewards: List[int] = []
+      for balance, payout, total in zip(row, payouts, totals):
+        product: int = payout * balance
+        if product > UINT256_MAX:
+          raise OverflowError(f'SafeMath: multiplication overflow ({ payout } * { balance })')
+        rewards.append(product // total if total > 0 else 0)
+      rows.append(rewards)
+    return rows
+  matrix  = np.asarray(balances, dtype=object).reshape(len(balances), len(payouts))
+  payout  = np.asarray(payouts, dtype=object)
+  total   = np.asarray(totals, dtype=object)
+  empty   = total == 0
+  product = matrix * payout
+  if (product > UINT256_MAX).any():
+    raise OverflowError('SafeMath: multiplication overflow')
+  rewards = product // np.where(empty, 1, total)
+  rewards[:, empty] = 0
+  return rewards
+
+def claimable(balances: Sequence[Sequence[int]], payouts: Sequence[int], totals: Sequence[int], claimed_epochs: Optional[Sequence[int]] = None) -> List[int]:
+  '''
+  Claimable amount of every holder over the given epochs, as `_getClaimableUntilEpoch` sums it
+
+  ---
+  :param: balances  `Sequence[Sequence[int]]`  veFLEX balances shaped addresses x epochs
+  :param: payouts  `Sequence[int]`  `payoutForEpoch` for each epoch
+  :param: totals  `Sequence[int]`  `totalSupplyAt` at the start block of each epoch
+  :param: claimed_epochs  `Sequence[int]`  `claimedEpoches` of each holder; epochs before it are skipped
+  :returns: `List[int]`
+  '''
+  rewards = epoch_rewards(balances, payouts, totals)
+  if np is None:
+    starts: Sequence[int] = claimed_epochs if claimed_epochs is not None else [0] * len(rewards)
+    return [ sum(row[start:]) for row, start in zip(rewards, starts) ]
+  if claimed_epochs is not None:
+    unclaimed = np.arange(len(payouts))[None, :] >= np.asarray(claimed_epochs)[:, None]
+    rewards   = np.where(unclaimed, rewards, 0)
+  return [ int(amount) for amount in rewards.sum(axis=1) ]
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3.7
+# coding:utf-8
+# Copyright (C) 2019-2021 All rights reserved.
+# FILENAME:  scripts/utils/ve_batch.py
+# VERSION: 	 1.0
+# CREATED: 	 2026-10-18 23:40
+# AUTHOR: 	 Aekasitt Guruvanich <sitt@coinflex.com>
+# DESCRIPTION:
+#   Reads veFLEX voting power of many addresses, or total supply at many blocks,
+#   through `balanceOfAtMany` / `totalSupplyAtMany`, split into chunks that stay
+#   under the node's `eth_call` gas cap.
+# HISTORY:
+#*************************************************************
+### Standard Packages ###
+from typing import Any, Dict, List, Optional, Sequence
+### Third-Party Packages ###
+from brownie import web3
+
+### Constants mirrored from contracts/veFLEX.vy ###
+MAX_BATCH: int    = 64
+ZERO_ADDRESS: str = '0x0000000000000000000000000000000000000000'
+
+DEFAULT_GAS_CAP: int = 50_000_000 # geth `--rpc.gascap` default
+
+def _is_gas_error(err: Exception) -> bool:
+  return 'gas' in str(err).lower()
+
+class VeBatchReader:
+  '''
+  Chunked reads of the veFLEX batch views. Each `eth_call` carries `gas_cap` as its gas limit, so a local
+  node fails the same chunks as the production one; a chunk running out of gas is halved and retried, and
+  the smaller size is kept for the remaining chunks.
+  '''
+
+  def __init__(self, ve_flex, gas_cap: int = DEFAULT_GAS_CAP, batch_size: int = MAX_BATCH):
+    '''
+    ---
+    :param: ve_flex  `Contract`  veFLEX contract
+    :param: gas_cap  `int`  gas limit of each `eth_call`, at most the node's cap
+    :param: batch_size  `int`  initial entries per call, at most `MAX_BATCH`
+    '''
+    if not 0 < batch_size <= MAX_BATCH:
+      raise ValueError(f'Batch size must be between 1 and { MAX_BATCH }')
+    self.ve_flex         = ve_flex
+    self.gas_cap: int    = gas_cap
+    self.batch_size: int = batch_size
+    self.calls: int      = 0
+
+  def balances_at(self, addresses: Sequence[str], block: int, block_identifier: Optional[int] = None) -> Dict[str, int]:
+    '''
+    Voting power of each of `addresses` at `block`
+
+    ---
+    :param: addresses  `Sequence[str]`  wallet addresses, `ZERO_ADDRESS` is not allowed as it ends a batch
+    :param: block  `int`  block height to measure the voting power at
+    :param: block_identifier  `int`  block the calls are executed at; defaults to `block`
+    :returns: `Dict[str, int]`
+    '''
+    if ZERO_ADDRESS in addresses:
+      raise ValueError('Zero address cannot be queried in a batch')
+    values: List[int] = self._read(self.ve_flex.balanceOfAtMany, list(addresses), ZERO_ADDRESS, (block,), block if block_identifier is None else block_identifier)
+    return dict(zip(addresses, values))
+
+  def supplies_at(self, blocks: Sequence[int], block_identifier: Optional[int] = None) -> List[int]:
+    '''
+    Total voting power at each of `blocks`; ascending blocks are cheapest
+
+    ---
+    :param: blocks  `Sequence[int]`  block heights, all greater than zero
+    :param: block_identifier  `int`  block the calls are executed at; defaults to the highest of `blocks`
+    :returns: `List[int]`
+    '''
+    if 0 in blocks:
+      raise ValueError('Block zero cannot be queried in a batch')
+    if len(blocks) < 1:
+      return []
+    return self._read(self.ve_flex.totalSupplyAtMany, list(blocks), 0, (), max(blocks) if block_identifier is None else block_identifier)
+
+  def _read(self, call, items: List[Any], padding: Any, args: tuple, block_identifier: int) -> List[int]:
+    results: List[int] = []
+    offset: int        = 0
+    while offset < len(items):
+      chunk: List[Any] = items[offset:offset + self.batch_size]
+      try:
+        values = self._call(call, chunk + [padding] * (MAX_BATCH - len(chunk)), args, block_identifier)
+      except ValueError as err:
+        if len(chunk) < 2 or not _is_gas_error(err):
+          raise
+        self.batch_size = len(chunk) // 2
+        continue
+      results += list(values)[:len(chunk)]
+      offset  += len(chunk)
+    return results
+
+  def _call(self, call, padded: List[Any], args: tuple, block_identifier: int) -> List[int]:
+    tx: dict    = { 'to': call._address, 'data': call.encode_input(padded, *args), 'gas': self.gas_cap }
+    self.calls += 1
+    return call.decode_output(web3.eth.call(tx, block_identifier).hex())
@@ -0,0 +1,347 @@
+#!/usr/bin/env python3.7
+# coding:utf-8
+# Copyright (C) 2019-2021 All rights reserved.
+# FILENAME:  scripts/utils/ve_model.py
+# VERSION: 	 1.0
+# CREATED: 	 2026-10-18 11:05
+# AUTHOR: 	 Aekasitt Guruvanich <sitt@coinflex.com>
+# DESCRIPTION:
+#   Offline reference model of `contracts/veFLEX.vy` rebuilt by replaying
+#   `Deposit` / `Withdraw` events, answering `balanceOfAt` / `totalSupplyAt` locally.
+# HISTORY:
+#*************************************************************
+### Standard Packages ###
+from collections import defaultdict
+from dataclasses import dataclass, replace
+from typing import Dict, Iterable, List, Optional, Tuple
+
+### Constants mirrored from `contracts/veFLEX.vy` ###
+WEEK: int       = 7 * 86400
+MAXTIME: int    = 4 * 365 * 86400
+MULTIPLIER: int = 10 ** 18
+
+@dataclass
+class Point:
+  bias: int  = 0
+  slope: int = 0
+  ts: int    = 0
+  blk: int   = 0
+
+@dataclass
+class LockedBalance:
+  amount: int = 0
+  end: int    = 0
+
+def _sub(a: int, b: int) -> int:
+  '''
+  uint256 subtraction; raises where the contract would revert on underflow
+  '''
+  if b > a:
+    raise ArithmeticError(f'uint256 underflow: { a } - { b }')
+  return a - b
+
+def _div(a: int, b: int) -> int:
+  '''
+  int128 division as compiled by vyper, truncating towards zero
+  '''
+  q: int = abs(a) // abs(b)
+  return q if (a >= 0) == (b > 0) else -q
+
+class VotingEscrowModel:
+  '''
+  Mirrors `_checkpoint`, `slope_changes`, `point_history` and `user_point_history` of veFLEX.
+  Global `checkpoint()` calls emit no event, so they must be fed through `apply_checkpoint`
+  for the model to stay bit-exact; `verify` detects when one was missed.
+  '''
+
+  def __init__(self, deploy_block: int, deploy_ts: int):
+    '''
+    ---
+    :param: deploy_block  `int`  block of the veFLEX constructor, i.e. `point_history(0).blk`
+    :param: deploy_ts  `int`  timestamp of the veFLEX constructor, i.e. `point_history(0).ts`
+    '''
+    self.epoch: int                                 = 0
+    self.supply: int                                = 0
+    self.point_history: List[Point]                 = [ Point(ts=deploy_ts, blk=deploy_block) ]
+    self.user_point_history: Dict[str, List[Point]] = defaultdict(lambda: [ Point() ])
+    self.slope_changes: Dict[int, int]              = defaultdict(int)
+    self.locked: Dict[str, LockedBalance]           = defaultdict(LockedBalance)
+    self.head: Tuple[int, int]                      = (deploy_block, deploy_ts)
+
+  def user_point_epoch(self, addr: str) -> int:
+    return len(self.user_point_history[addr]) - 1 if addr in self.user_point_history else 0
+
+  def set_head(self, block_number: int, timestamp: int):
+    '''
+    Sets the chain head (`block.number`, `block.timestamp`) used by `*At` queries that
+    extrapolate past the last recorded point, as the contract does for the latest epoch
+    '''
+    self.head = (block_number, timestamp)
+
+  ### Replay ###
+  def apply_deposit(self, addr: str, value: int, locktime: int, block_number: int, timestamp: int):
+    '''
+    Replays a `Deposit` event, covering `create_lock`, `deposit_for`, `increase_amount` and `increase_unlock_time`
+    '''
+    old_locked: LockedBalance = replace(self.locked[addr])
+    new_locked: LockedBalance = LockedBalance(old_locked.amount + value, locktime)
+    self.locked[addr]         = new_locked
+    self.supply              += value
+    self._checkpoint(addr, old_locked, new_locked, block_number, timestamp)
+
+  def apply_withdraw(self, addr: str, value: int, block_number: int, timestamp: int):
+    '''
+    Replays a `Withdraw` event
+    '''
+    old_locked: LockedBalance = replace(self.locked[addr])
+    self.locked[addr]         = LockedBalance()
+    self.supply              -= value
+    self._checkpoint(addr, old_locked, LockedBalance(), block_number, timestamp)
+
+  def apply_checkpoint(self, block_number: int, timestamp: int, max_weeks: int = 255):
+    '''
+    Replays a bare `checkpoint()` transaction, or `checkpoint_n(max_weeks)`
+    '''
+    self._checkpoint(None, LockedBalance(), LockedBalance(), block_number, timestamp, max_weeks)
+
+  def replay(self, events: Iterable[dict], checkpoints: Iterable[Tuple[int, ...]] = ()):
+    '''
+    Replays decoded logs in chain order, interleaved with known bare `checkpoint()` calls. Everything is ordered
+    by `(block, transaction index, log index)`, as several of them can share a block.
+
+    ---
+    :param: events  `Iterable[dict]`  web3 log entries of `Deposit` and `Withdraw` with `event`, `args`, `blockNumber`,
+      `transactionIndex`, `logIndex`
+    :param: checkpoints  `Iterable[Tuple[int, ...]]`  `(block_number, transaction_index, timestamp)` of each bare `checkpoint()` call,
+      or `(block_number, transaction_index, timestamp, max_weeks)` of each `checkpoint_n(max_weeks)` call
+    '''
+    steps: list = [ ((log['blockNumber'], log['transactionIndex'], log['logIndex']), log) for log in events ]
+    steps      += [ ((checkpoint[0], checkpoint[1], -1), tuple(checkpoint)) for checkpoint in checkpoints ] # emits no log of its own
+    for _, step in sorted(steps, key=lambda item: item[0]):
+      if isinstance(step, tuple):
+        block_number, _, timestamp, *max_weeks = step
+        self.apply_checkpoint(block_number, timestamp, *max_weeks)
+        self.set_head(block_number, timestamp)
+        continue
+      args = step['args']
+      if step['event'] == 'Deposit':
+        self.apply_deposit(args['provider'], args['value'], args['locktime'], step['blockNumber'], args['ts'])
+      elif step['event'] == 'Withdraw':
+        self.apply_withdraw(args['provider'], args['value'], step['blockNumber'], args['ts'])
+      self.set_head(step['blockNumber'], args['ts'])
+
+  def verify(self, epoch: int, last_point: Tuple[int, int, int, int]):
+    '''
+    Compares the model against `veFLEX.epoch()` and `veFLEX.point_history(epoch)` read at the same block.
+    Raises `ValueError` on divergence, typically caused by a bare `checkpoint()` that was not replayed.
+    '''
+    if epoch != self.epoch or tuple(last_point) != self._as_tuple(self.point_history[self.epoch]):
+      raise ValueError(f'Model diverged from veFLEX: epoch { self.epoch } != { epoch } or point mismatch; missing `checkpoint()` calls?')
+
+  ### Contract Mirror ###
+  def _checkpoint(self, addr: Optional[str], old_locked: LockedBalance, new_locked: LockedBalance, block_number: int, timestamp: int, max_weeks: int = 255):
+    u_old: Point    = Point()
+    u_new: Point    = Point()
+    old_dslope: int = 0
+    new_dslope: int = 0
+    _epoch: int     = self.epoch
+    if addr is not None:
+      if old_locked.end > timestamp and old_locked.amount > 0:
+        u_old.slope = _div(old_locked.amount, MAXTIME)
+        u_old.bias  = u_old.slope * (old_locked.end - timestamp)
+      if new_locked.end > timestamp and new_locked.amount > 0:
+        u_new.slope = _div(new_locked.amount, MAXTIME)
+        u_new.bias  = u_new.slope * (new_locked.end - timestamp)
+      old_dslope = self.slope_changes[old_locked.end]
+      if new_locked.end != 0:
+        if new_locked.end == old_locked.end:
+          new_dslope = old_dslope
+        else:
+          new_dslope = self.slope_changes[new_locked.end]
+    last_point: Point = Point(ts=timestamp, blk=block_number)
+    if _epoch > 0:
+      last_point = replace(self.point_history[_epoch])
+    last_checkpoint: int       = last_point.ts
+    initial_last_point: Point  = replace(last_point)
+    block_slope: int           = 0
+    if timestamp > last_point.ts:
+      block_slope = MULTIPLIER * _sub(block_number, last_point.blk) // (timestamp - last_point.ts)
+    t_i: int = (last_checkpoint // WEEK) * WEEK
+    for _ in range(min(max_weeks, 255)):
+      t_i += WEEK
+      d_slope: int = 0
+      if t_i > timestamp:
+        t_i = timestamp
+      else:
+        d_slope = self.slope_changes[t_i]
+      last_point.bias  -= last_point.slope * _sub(t_i, last_checkpoint)
+      last_point.slope += d_slope
+      if last_point.bias < 0:
+        last_point.bias = 0
+      if last_point.slope < 0:
+        last_point.slope = 0
+      last_checkpoint = t_i
+      last_point.ts   = t_i
+      last_point.blk  = initial_last_point.blk + block_slope * _sub(t_i, initial_last_point.ts) // MULTIPLIER
+      _epoch         += 1
+      if t_i == timestamp:
+        last_point.blk = block_number
+        break
+      else:
+        self._set_point(_epoch, last_point)
+    self.epoch = _epoch
+    if addr is not None:
+      last_point.slope += (u_new.slope - u_old.slope)
+      last_point.bias  += (u_new.bias - u_old.bias)
+      if last_point.slope < 0:
+        last_point.slope = 0
+      if last_point.bias < 0:
+        last_point.bias = 0
+    self._set_point(_epoch, last_point)
+    if addr is not None:
+      if old_locked.end > timestamp:
+        old_dslope += u_old.slope
+        if new_locked.end == old_locked.end:
+          old_dslope -= u_new.slope
+        self.slope_changes[old_locked.end] = old_dslope
+      if new_locked.end > timestamp:
+        if new_locked.end > old_locked.end:
+          new_dslope -= u_new.slope
+          self.slope_changes[new_locked.end] = new_dslope
+      u_new.ts  = timestamp
+      u_new.blk = block_number
+      self.user_point_history[addr].append(u_new)
+
+  def _set_point(self, epoch: int, point: Point):
+    if epoch < len(self.point_history):
+      self.point_history[epoch] = replace(point)
+    else:
+      self.point_history.append(replace(point))
+
+  def find_block_epoch(self, _block: int, max_epoch: int) -> int:
+    '''
+    Same binary search as `veFLEX.find_block_epoch`
+    '''
+    _min: int = 0
+    _max: int = max_epoch
+    while _min < _max:
+      _mid: int = (_min + _max + 1) // 2
+      if self.point_history[_mid].blk <= _block:
+        _min = _mid
+      else:
+        _max = _mid - 1
+    return _min
+
+  def find_user_epoch(self, addr: str, _block: int) -> int:
+    '''
+    Same binary search over `user_point_history` as `veFLEX.balanceOfAt`
+    '''
+    history: List[Point] = self.user_point_history.get(addr, [ Point() ])
+    _min: int = 0
+    _max: int = len(history) - 1
+    while _min < _max:
+      _mid: int = (_min + _max + 1) // 2
+      if history[_mid].blk <= _block:
+        _min = _mid
+      else:
+        _max = _mid - 1
+    return _min
+
+  def balance_of(self, addr: str, _t: int) -> int:
+    _epoch: int = self.user_point_epoch(addr)
+    if _epoch == 0:
+      return 0
+    last_point: Point = self.user_point_history[addr][_epoch]
+    bias: int = last_point.bias - last_point.slope * _sub(_t, last_point.ts)
+    return max(bias, 0)
+
+  def balance_of_at(self, addr: str, _block: int) -> int:
+    head_block, head_ts = self.head
+    if _block > head_block:
+      raise ValueError(f'Block { _block } is beyond the model head { head_block }')
+    upoint: Point    = replace(self.user_point_history.get(addr, [ Point() ])[self.find_user_epoch(addr, _block)])
+    max_epoch: int   = self.epoch
+    _epoch: int      = self.find_block_epoch(_block, max_epoch)
+    point_0: Point   = self.point_history[_epoch]
+    if _epoch < max_epoch:
+      point_1: Point = self.point_history[_epoch + 1]
+      d_block: int   = point_1.blk - point_0.blk
+      d_t: int       = point_1.ts - point_0.ts
+    else:
+      d_block = _sub(head_block, point_0.blk)
+      d_t     = _sub(head_ts, point_0.ts)
+    block_time: int = point_0.ts
+    if d_block != 0:
+      block_time += d_t * _sub(_block, point_0.blk) // d_block
+    upoint.bias -= upoint.slope * _sub(block_time, upoint.ts)
+    return max(upoint.bias, 0)
+
+  def supply_at(self, point: Point, t: int) -> int:
+    last_point: Point = replace(point)
+    t_i: int = (last_point.ts // WEEK) * WEEK
+    for _ in range(255):
+      t_i += WEEK
+      d_slope: int = 0
+      if t_i > t:
+        t_i = t
+      else:
+        d_slope = self.slope_changes.get(t_i, 0)
+      last_point.bias -= last_point.slope * _sub(t_i, last_point.ts)
+      if t_i == t:
+        break
+      last_point.slope += d_slope
+      last_point.ts     = t_i
+    return max(last_point.bias, 0)
+
+  def total_supply(self, t: int) -> int:
+    return self.supply_at(self.point_history[self.epoch], t)
+
+  def total_supply_at(self, _block: int) -> int:
+    head_block, head_ts = self.head
+    if _block > head_block:
+      raise ValueError(f'Block { _block } is beyond the model head { head_block }')
+    _epoch: int       = self.epoch
+    target_epoch: int = self.find_block_epoch(_block, _epoch)
+    point: Point      = self.point_history[target_epoch]
+    dt: int           = 0
+    if target_epoch < _epoch:
+      point_next: Point = self.point_history[target_epoch + 1]
+      if point.blk != point_next.blk:
+        dt = _sub(_block, point.blk) * (point_next.ts - point.ts) // (point_next.blk - point.blk)
+    else:
+      if point.blk != head_block:
+        dt = _sub(_block, point.blk) * _sub(head_ts, point.ts) // (head_block - point.blk)
+    return self.supply_at(point, point.ts + dt)
+
+  @staticmethod
+  def _as_tuple(point: Point) -> Tuple[int, int, int, int]:
+    return (point.bias, point.slope, point.ts, point.blk)
+
+def load_model(ve_flex, to_block: int, chunk_size: int = 10000, checkpoints: Iterable[Tuple[int, ...]] = (), verify: bool = True) -> VotingEscrowModel:
+  '''
+  Builds a model of `ve_flex` by replaying its `Deposit` / `Withdraw` logs up to `to_block`
+
+  ---
+  :param: ve_flex  `veFLEX`  brownie contract object
+  :param: to_block  `int`  last block to replay; also becomes the model head
+  :param: chunk_size  `int`  block range of each `eth_getLogs` request
+  :param: checkpoints  `Iterable[Tuple[int, ...]]`  known bare `checkpoint()` calls as `(block_number, transaction_index, timestamp)`,
+    and `checkpoint_n` calls as `(block_number, transaction_index, timestamp, max_weeks)`
+  :param: verify  `bool`  compare the global points against veFLEX; skip it when only user points are needed,
+    as those are written by `Deposit` / `Withdraw` alone and stay exact even with bare `checkpoint()` calls missing
+  :returns: `VotingEscrowModel`
+  '''
+  from brownie import web3
+  bias, slope, deploy_ts, deploy_block = ve_flex.point_history(0)
+  model: VotingEscrowModel = VotingEscrowModel(deploy_block, deploy_ts)
+  contract = web3.eth.contract(address=ve_flex.address, abi=ve_flex.abi)
+  events: list = []
+  for start in range(deploy_block, to_block + 1, chunk_size):
+    end: int = min(start + chunk_size - 1, to_block)
+    events  += contract.events.Deposit.getLogs(fromBlock=start, toBlock=end)
+    events  += contract.events.Withdraw.getLogs(fromBlock=start, toBlock=end)
+  model.replay(events, checkpoints)
+  model.set_head(to_block, web3.eth.get_block(to_block).timestamp)
+  if verify:
+    model.verify(ve_flex.epoch(block_identifier=to_block), ve_flex.point_history(model.epoch, block_identifier=to_block))
+  return model
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3.7
+# coding:utf-8
+# Copyright (C) 2019-2021 All rights reserved.
+# FILENAME:  scripts/utils/wallet.py
+# VERSION: 	 1.0
+# CREATED: 	 2026-10-18 16:30
+# AUTHOR: 	 Aekasitt Guruvanich <sitt@coinflex.com>
+# DESCRIPTION:
+#   Wallet loading shared by the operational scripts, following the
+#   `wallet.<chain-name>.yml` convention of the numbered deployment scripts.
+# HISTORY:
+#*************************************************************
+### Standard Packages ###
+from typing import Optional
+### Third-Party Packages ###
+from brownie.convert import Wei
+from brownie.network import accounts, Chain
+from eth_account.account import Account, ValidationError
+from yaml import safe_load
+
+TERM_RED  = '\033[1;31m'
+TERM_NFMT = '\033[0;0m'
+
+CHAIN_MAP = {
+  1: None,                   # mainnet
+  3: 'ropsten',              # ropsten testnet
+  42: 'kovan',               # kovan testnet
+  1337: 'dev',               # local ganache-cli evm
+  10000: 'smartbch-mainnet', # smartbch mainnet
+  10001: 'smartbch-amber',   # smartbch testnet
+}
+
+def load_account(chain: Chain) -> Optional[Account]:
+  '''
+  Loads the private key found in `wallet.<chain-name>.yml` (`wallet.yml` on mainnet) as a brownie account.
+  On the local ganache-cli evm, the account is also funded from `accounts[0]`.
+  Prints the reason and returns `None` when no usable wallet is found.
+  '''
+  if chain._chainid not in CHAIN_MAP:
+    print('!! Invalid chainid found.')
+    return None
+  chain_name = CHAIN_MAP[chain._chainid]
+  file_name = 'wallet.yml' if chain_name is None else f'wallet.{chain_name}.yml'
+  ### Load Private Key from YAML File ###
+  try:
+    with open(file_name) as f:
+      content = safe_load(f)
+      privkey = content.get('privkey', None)
+      acct = accounts.add(privkey)
+  except FileNotFoundError:
+    print(f'{TERM_RED}Cannot find wallet mnemonic file defined at `{file_name}`.{TERM_NFMT}')
+    return None
+  except ValidationError:
+    print(f'{TERM_RED}Invalid address found in wallet mnemonic file.{TERM_NFMT}')
+    return None
+  ### Transfers some Ether for usage to dev wallet ###
+  if chain._chainid == 1337:
+    try:
+      accounts[0].transfer(acct, Wei('100 ether').to('wei'))
+    except ValueError: pass
+  print(f'Account: {acct}')
+  balance = acct.balance()
+  print(f'Account Balance: {balance}')
+  if balance == 0:
+    return None # If balance is zero, exits
+  return acct
@@ -36,20 +36,20 @@ def load_account(file_name: str) -> Account:
   except FileNotFoundError:
     print(f'{ RED }Cannot find wallet mnemonic file defined at `{ file_name }`.{ NFMT }')
 
-@fixture
-def admin() -> Account:
+@fixture(scope='module')
+def admin(admin_account: Account) -> Account:
   '''
-  Loads test Treasury account using `wallet.test.yml` found on root-folder
+  Test Treasury account loaded by `admin_account` in `tests/conftest.py`;
+  funded again for each module as `module_isolation` resets the chain in between
   '''
-  acct = load_account('wallet.test.yml')
   try: ### Transfer Initial Balance to Test WAllet ###
-    accounts[0].transfer(acct, Wei('100 ether').to('wei'))
+    accounts[0].transfer(admin_account, Wei('100 ether').to('wei'))
   except ValueError: pass
-  return acct
+  return admin_account
 
-@fixture
+@fixture(scope='session')
 def user_accounts() -> List[Account]:
   '''
   Use remaining accounts set up by Ganache-cli to be list of user accounts.
   '''
-  return accounts[1:10]
\ No newline at end of file
+  return accounts[1:10]
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3.7
+# coding:utf-8
+# Copyright (C) 2019-2021 All rights reserved.
+# FILENAME:  tests/benchmarks/__init__.py
+# VERSION: 	 1.0
+# CREATED: 	 2026-10-18 17:40
+# AUTHOR: 	 Aekasitt Guruvanich <sitt@coinflex.com>
+# DESCRIPTION:
+#   Gas measurements recorded by the benchmark suite and their comparison
+#   against the committed baseline. Benchmarks are excluded from the default
+#   run; use `brownie test tests/benchmarks -m benchmark`.
+# HISTORY:
+#*************************************************************
+### Standard Packages ###
+import csv
+import json
+import os
+from typing import Dict, List, Optional
+### Third-Party Packages ###
+from pytest import fail, fixture
+
+BASELINE_PATH: str  = os.path.join(os.path.dirname(__file__), 'gas-baseline.json')
+RESULTS_DIR: str    = 'build/benchmarks'
+THRESHOLD: float    = float(os.environ.get('GAS_REGRESSION_THRESHOLD', '0.05')) # allowed relative increase
+UPDATE: bool        = os.environ.get('GAS_BASELINE_UPDATE', '') not in ('', '0')
+
+class GasReport:
+  '''
+  Gas used per measurement, keyed as `<contract>/<metric>/epochs=<n>/checkpoints=<n>`;
+  `None` records a call that ran out of gas
+  '''
+
+  def __init__(self, baseline_path: str = BASELINE_PATH):
+    self.baseline_path: str                   = baseline_path
+    self.results: Dict[str, Optional[int]]    = {}
+    self.has_baseline: bool                   = os.path.exists(baseline_path)
+    self.baseline: Dict[str, Optional[int]]   = {}
+    if self.has_baseline:
+      with open(baseline_path) as f:
+        self.baseline = json.load(f)
+
+  def record(self, contract: str, metric: str, epochs: int, checkpoints: int, gas_used: Optional[int]) -> str:
+    key: str          = f'{ contract }/{ metric }/epochs={ epochs }/checkpoints={ checkpoints }'
+    self.results[key] = gas_used
+    return key
+
+  def regressions(self, keys: List[str], threshold: float = THRESHOLD) -> List[str]:
+    '''
+    Describes every measurement among `keys` above its baseline by more than `threshold`,
+    failing where the baseline succeeded, or missing from the baseline. Nothing is reported while
+    `GAS_BASELINE_UPDATE` is set, as the run is writing the new baseline.
+    '''
+    found: List[str] = []
+    for key in keys:
+      if UPDATE or key not in self.results:
+        continue
+      if key not in self.baseline:
+        found.append(f'{ key }: no baseline, run with GAS_BASELINE_UPDATE=1 and commit `{ self.baseline_path }`')
+        continue
+      baseline, current = self.baseline[key], self.results[key]
+      if baseline is None:
+        continue
+      if current is None:
+        found.append(f'{ key }: out of gas, baseline { baseline }')
+      elif current > baseline * (1 + threshold):
+        found.append(f'{ key }: { current } > { baseline } (+{ (current - baseline) / baseline:.1%})')
+    return found
+
+  def save(self, directory: str = RESULTS_DIR):
+    '''
+    Writes the results as CSV and JSON into `directory`; also merges them into the baseline
+    when `GAS_BASELINE_UPDATE` is set
+    '''
+    os.makedirs(directory, exist_ok=True)
+    with open(os.path.join(directory, 'claim-gas.json'), 'w') as f:
+      json.dump(self.results, f, indent=2, sort_keys=True)
+    with open(os.path.join(directory, 'claim-gas.csv'), 'w', newline='') as f:
+      writer = csv.writer(f)
+      writer.writerow(['contract', 'metric', 'epochs', 'checkpoints', 'gas_used', 'baseline'])
+      for key in sorted(self.results):
+        contract, metric, epochs, checkpoints = key.split('/')
+        writer.writerow([contract, metric, epochs.split('=')[1], checkpoints.split('=')[1], self.results[key], self.baseline.get(key)])
+    if UPDATE:
+      with open(self.baseline_path, 'w') as f:
+        json.dump({ **self.baseline, **self.results }, f, indent=2, sort_keys=True)
+
+@fixture(scope='module')
+def gas_report() -> GasReport:
+  '''
+  Shared by the benchmarks of a module, saved once all of them ran. Without a committed baseline the module
+  fails before any sweep runs, as every measurement would count as a regression.
+  '''
+  report = GasReport()
+  if not report.has_baseline and not UPDATE:
+    fail(f'No gas baseline at `{ report.baseline_path }`, run with GAS_BASELINE_UPDATE=1 and commit it', pytrace=False)
+  yield report
+  report.save()
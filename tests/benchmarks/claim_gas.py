@@ -0,0 +1,88 @@
+#!/usr/bin/env python3.7
+# coding:utf-8
+# Copyright (C) 2019-2021 All rights reserved.
+# FILENAME:  tests/benchmarks/claim_gas.py
+# VERSION: 	 1.0
+# CREATED: 	 2026-10-18 17:40
+# AUTHOR: 	 Aekasitt Guruvanich <sitt@coinflex.com>
+# DESCRIPTION:
+#   Gas of claim() and getClaimable() against the number of unclaimed epochs
+#   and veFLEX checkpoints, together with distribute, create_lock and checkpoint.
+# HISTORY:
+#*************************************************************
+### Standard Packages ###
+from typing import List
+### Project Contracts ###
+from brownie import AccumulatorPayoutMock, DailyPayoutMock, Distributor, FLEXCoin, veFLEX, web3
+### Third-Party Packages ###
+from brownie.network import Chain
+from eth_account import Account
+from pytest import mark
+### Local Modules ###
+from tests import admin, user_accounts, BLUE, RED, NFMT
+from tests.benchmarks import gas_report, GasReport
+from tests.deployments.flex import deploy_flex
+from tests.deployments.ve_flex import deploy_ve_flex
+
+SWEEP_EPOCHS: List[int]      = [1, 10, 100, 365, 1000]
+SWEEP_CHECKPOINTS: List[int] = [1, 10, 100]
+PAYOUTS: dict                = { 'DailyPayout': DailyPayoutMock, 'AccumulatorPayout': AccumulatorPayoutMock }
+
+@mark.benchmark
+@mark.parametrize('checkpoints', SWEEP_CHECKPOINTS)
+@mark.parametrize('contract', list(PAYOUTS))
+def test_claim_gas(admin: Account, user_accounts: List[Account], deploy_flex: FLEXCoin, deploy_ve_flex: veFLEX, gas_report: GasReport, contract: str, checkpoints: int):
+  '''
+  BENCHMARK: Each claimant locks with `checkpoints` user checkpoints, then first claims after
+  one of `SWEEP_EPOCHS` epochs, so that every claim settles exactly that many unclaimed epochs.
+  '''
+  flex: FLEXCoin            = deploy_flex
+  ve_flex: veFLEX           = deploy_ve_flex
+  chain: Chain              = Chain()
+  payout                    = PAYOUTS[contract].deploy(flex, ve_flex, { 'from': admin })
+  distributor: Distributor  = Distributor.deploy(payout, flex, f'{ contract } Distributor', { 'from': admin })
+  epoch_blocks: int         = payout.MOCK_EPOCH_BLOCKS()
+  gas_limit: int            = web3.eth.get_block('latest').gasLimit
+  claimants: List[Account]  = user_accounts[:len(SWEEP_EPOCHS)]
+  keys: List[str]           = []
+  payout.addDistributor(distributor, { 'from': admin })
+
+  ### Locks with the given number of user checkpoints ###
+  for claimant in claimants:
+    flex.transfer(claimant, 10 ** 21, { 'from': admin })
+    txn = ve_flex.create_lock(10 ** 18, chain.time() + 4 * 365 * 86400, { 'from': claimant })
+    keys.append(gas_report.record(contract, 'create_lock', 0, checkpoints, txn.gas_used))
+    for _ in range(checkpoints - 1):
+      ve_flex.increase_amount(10 ** 18, { 'from': claimant })
+
+  ### Distribute every epoch ahead of time ###
+  for epoch in range(max(SWEEP_EPOCHS)):
+    flex.transfer(distributor, 10 ** 18, { 'from': admin })
+    txn = distributor.distribute({ 'from': admin })
+    if epoch + 1 in SWEEP_EPOCHS:
+      keys.append(gas_report.record(contract, 'distribute', epoch + 1, checkpoints, txn.gas_used))
+
+  ### First claim of each claimant after more and more epochs ###
+  start: int = chain.height + 1
+  payout.setStartBlockHeight(start, { 'from': admin })
+  for claimant, epochs in zip(claimants, SWEEP_EPOCHS):
+    chain.mine(max(start + epoch_blocks * (epochs - 1) + 1 - chain.height, 0))
+    chain.sleep(86400)
+    txn = ve_flex.checkpoint({ 'from': admin })
+    keys.append(gas_report.record(contract, 'checkpoint', epochs, checkpoints, txn.gas_used))
+    if contract == 'AccumulatorPayout':
+      txn = payout.checkpointEpochs(epochs, { 'from': admin, 'gas_limit': gas_limit, 'allow_revert': True })
+      keys.append(gas_report.record(contract, 'checkpointEpochs', epochs, checkpoints, txn.gas_used if txn.status == 1 else None))
+    try:
+      estimate = payout.getClaimable.estimate_gas(claimant)
+    except ValueError:
+      estimate = None
+    keys.append(gas_report.record(contract, 'getClaimable', epochs, checkpoints, estimate))
+    txn = payout.claim(claimant, { 'from': claimant, 'gas_limit': gas_limit, 'allow_revert': True })
+    keys.append(gas_report.record(contract, 'claim', epochs, checkpoints, txn.gas_used if txn.status == 1 else None))
+    print(f'{ BLUE }{ contract }: claim after { epochs } epoch(s), { checkpoints } checkpoint(s): { gas_report.results[keys[-1]] }{ NFMT }')
+
+  regressions: List[str] = gas_report.regressions(keys)
+  for regression in regressions:
+    print(f'{ RED }{ regression }{ NFMT }')
+  assert not regressions, f'{ len(regressions) } gas regression(s) above threshold'
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3.7
+# coding:utf-8
+# Copyright (C) 2019-2021 All rights reserved.
+# FILENAME:  tests/conftest.py
+# VERSION: 	 1.0
+# CREATED: 	 2026-10-18 21:50
+# AUTHOR: 	 Aekasitt Guruvanich <sitt@coinflex.com>
+# DESCRIPTION:
+#   Chain isolation shared by every test module. Deployment fixtures in
+#   `tests/deployments` are module-scoped, so each module deploys once and
+#   each test starts from a snapshot taken after those deployments. Modules only
+#   share the chain of their own process, so `-n auto` runs them in parallel.
+# HISTORY:
+#*************************************************************
+### Third-Party Packages ###
+from eth_account import Account
+from pytest import fixture
+### Local Modules ###
+from tests import load_account
+
+@fixture(scope='module', autouse=True)
+def module_chain(module_isolation):
+  '''
+  Resets the chain before any module-scoped deployment fixture runs; autouse fixtures of a scope are set up first
+  '''
+  yield
+
+@fixture(autouse=True)
+def isolation(fn_isolation):
+  '''
+  Snapshot before each test, revert after it, leaving module deployments in place for the next test
+  '''
+  yield
+
+@fixture(scope='session')
+def admin_account() -> Account:
+  '''
+  Loads test Treasury account using `wallet.test.yml` found on root-folder, once per test session
+  '''
+  return load_account('wallet.test.yml')
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3.7
+# coding:utf-8
+# Copyright (C) 2019-2021 All rights reserved.
+# FILENAME:  tests/deployments/accumulator_payout.py
+# VERSION: 	 1.0
+# CREATED: 	 2026-10-18 17:05
+# AUTHOR: 	 Aekasitt Guruvanich <sitt@coinflex.com>
+# DESCRIPTION:
+#
+# HISTORY:
+#*************************************************************
+### Project Contracts ###
+from brownie import FLEXCoin, AccumulatorPayout, AccumulatorPayoutMock, DailyPayoutMock, veFLEX
+### Third-Party Packages ###
+from brownie.network.gas.strategies import ExponentialScalingStrategy
+from eth_account import Account
+from pytest import fixture
+### Local Modules ###
+from tests import *
+from .flex import deploy_flex
+from .ve_flex import deploy_ve_flex
+
+@fixture(scope='module')
+def deploy_daily_payout_mock(admin: Account, deploy_flex: FLEXCoin, deploy_ve_flex: veFLEX) -> DailyPayoutMock:
+  '''
+  FIXTURE: Deploy a DailyPayout with 10-block epochs to be used by other contracts' testing.  
+
+  ---
+  :param: admin  `Account`  the wallet address to deploy the contract from  
+  :param: deploy_flex  `FLEXCoin`  generic ERC-20 to serve as the Staking Token  
+  :param: deploy_ve_flex  `veFLEX`  vested balance token for given token  
+  :returns:  `DailyPayoutMock`  
+  '''
+  gas_strategy = ExponentialScalingStrategy('10 gwei', '50 gwei')
+  return DailyPayoutMock.deploy(deploy_flex, deploy_ve_flex, { 'from': admin, 'gas_price': gas_strategy })
+
+@fixture(scope='module')
+def deploy_accumulator_payout_mock(admin: Account, deploy_flex: FLEXCoin, deploy_ve_flex: veFLEX) -> AccumulatorPayoutMock:
+  '''
+  FIXTURE: Deploy an AccumulatorPayout with 10-block epochs to be used by other contracts' testing.  
+
+  ---
+  :param: admin  `Account`  the wallet address to deploy the contract from  
+  :param: deploy_flex  `FLEXCoin`  generic ERC-20 to serve as the Staking Token  
+  :param: deploy_ve_flex  `veFLEX`  vested balance token for given token  
+  :returns:  `AccumulatorPayoutMock`  
+  '''
+  gas_strategy = ExponentialScalingStrategy('10 gwei', '50 gwei')
+  return AccumulatorPayoutMock.deploy(deploy_flex, deploy_ve_flex, { 'from': admin, 'gas_price': gas_strategy })
+
+def test_deploy_accumulator_payout(admin: Account, deploy_flex: FLEXCoin, deploy_ve_flex: veFLEX):
+  '''
+  TEST: Deploy AccumulatorPayout Contract
+  
+  ---
+  :param: admin  `Account`  the wallet address to deploy the contract from  
+  :param: deploy_flex  `FLEXCoin`  generic ERC-20 to serve as the Staking Token  
+  :param: deploy_ve_flex  `veFLEX`  vested balance token for given token  
+  '''
+  gas_strategy                  = ExponentialScalingStrategy('10 gwei', '50 gwei')
+  ### Deployment ###
+  payout: AccumulatorPayout     = AccumulatorPayout.deploy(deploy_flex, deploy_ve_flex, { 'from': admin, 'gas_price': gas_strategy })
+  print(f'AccumulatorPayout: { payout }')
+  assert payout.finalizedEpochs() == 0
+  assert payout.cumulativeRewardPerVe(0) == 0
@@ -21,7 +21,7 @@ from tests import *
 from .flex import deploy_flex
 from .ve_flex import deploy_ve_flex
 
-@fixture
+@fixture(scope='module')
 def deploy_daily_payout(admin: Account, deploy_flex: FLEXCoin, deploy_ve_flex: veFLEX) -> DailyPayout:
   '''
   FIXTURE: Deploy a DailyPayout contract to be used by other contracts' testing.  
@@ -38,7 +38,7 @@ def deploy_daily_payout(admin: Account, deploy_flex: FLEXCoin, deploy_ve_flex: v
   ### Deployment ###
   return DailyPayout.deploy(flex, ve_flex, { 'from': admin, 'gas_price': gas_strategy })
 
-@fixture
+@fixture(scope='module')
 def deploy_quarterly_payout(admin: Account, deploy_flex: FLEXCoin, deploy_ve_flex: veFLEX) -> QuarterlyPayout:
   '''
   TEST: Deploy QuarterlyPayout Contract
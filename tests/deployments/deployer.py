@@ -0,0 +1,74 @@
+#!/usr/bin/env python3.7
+# coding:utf-8
+# Copyright (C) 2019-2021 All rights reserved.
+# FILENAME:  tests/deployments/deployer.py
+# VERSION: 	 1.0
+# CREATED: 	 2026-10-18 20:40
+# AUTHOR: 	 Aekasitt Guruvanich <sitt@coinflex.com>
+# DESCRIPTION:
+#
+# HISTORY:
+#*************************************************************
+### Standard Packages ###
+import os
+### Project Contracts ###
+from brownie import DailyPayout, Distributor, FLEXCoin, QuarterlyPayout, veFLEX
+### Third-Party Packages ###
+from eth_account import Account
+from pytest import raises
+### Local Modules ###
+from scripts.utils.deployer import build_graph, levels, Deployer, DeploymentState
+from tests import admin
+from tests.deployments.flex import deploy_flex
+
+CONTAINERS = { 'DailyPayout': DailyPayout, 'Distributor': Distributor, 'QuarterlyPayout': QuarterlyPayout, 'veFLEX': veFLEX }
+
+def integration_spec(flex: FLEXCoin, start_block_height: int) -> dict:
+  return {
+    'variables': { 'flex': flex.address },
+    'contracts': {
+      've_flex': { 'contract': 'veFLEX', 'args': ['$flex', 'vested FLEX', 'veFLEX', '1.0.0'] },
+      'daily_payout': {
+        'contract': 'DailyPayout',
+        'args': ['$flex', '@ve_flex'],
+        'calls': [['setStartBlockHeight', start_block_height], ['addDistributor', '@distributor_daily']],
+      },
+      'quarterly_payout': { 'contract': 'QuarterlyPayout', 'args': ['$flex', '@ve_flex'] },
+      'distributor_daily': { 'contract': 'Distributor', 'args': ['@daily_payout', '$flex', 'daily'] },
+    },
+  }
+
+def test_graph_levels_and_cycles():
+  spec: dict = integration_spec(type('Flex', (), { 'address': '0x0' })(), 1000)
+  assert levels(build_graph(spec)) == [
+    ['ve_flex'],
+    ['daily_payout', 'quarterly_payout'],
+    ['daily_payout.setStartBlockHeight#0', 'distributor_daily'],
+    ['daily_payout.addDistributor#1'],
+  ]
+  with raises(ValueError):
+    levels(build_graph({ 'contracts': { 'a': { 'contract': 'X', 'args': ['@b'] }, 'b': { 'contract': 'X', 'args': ['@a'] } } }))
+  with raises(ValueError):
+    build_graph({ 'contracts': { 'a': { 'contract': 'X', 'args': ['@missing'] } } })
+
+def test_deployer_resumes(admin: Account, deploy_flex: FLEXCoin, tmp_path):
+  spec: dict      = integration_spec(deploy_flex, 1000)
+  state_path: str = os.path.join(tmp_path, 'state.json')
+  contracts: dict = Deployer(spec, CONTAINERS, admin, DeploymentState(state_path)).run()
+  assert contracts['daily_payout'].vested() == contracts['ve_flex'].address
+  assert contracts['quarterly_payout'].vested() == contracts['ve_flex'].address
+  assert contracts['daily_payout'].startBlockHeight() == 1000
+  assert contracts['daily_payout'].isDistributor(contracts['distributor_daily'])
+
+  ### Nothing is sent again on a second run ###
+  deployer = Deployer(spec, CONTAINERS, admin, DeploymentState(state_path))
+  resumed  = deployer.run()
+  assert deployer.pipeline.steps == []
+  assert { name: c.address for name, c in resumed.items() } == { name: c.address for name, c in contracts.items() }
+
+  ### A new call on a finished contract is the only transaction of the next run ###
+  spec['contracts']['quarterly_payout']['calls'] = [['setStartBlockHeight', 2000]]
+  deployer = Deployer(spec, CONTAINERS, admin, DeploymentState(state_path))
+  deployer.run()
+  assert [ step.name for step in deployer.pipeline.steps ] == ['quarterly_payout.setStartBlockHeight#0']
+  assert resumed['quarterly_payout'].startBlockHeight() == 2000
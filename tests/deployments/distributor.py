@@ -23,7 +23,7 @@ from .ve_flex import deploy_ve_flex # used by `deploy_daily_payout` and `deploy_
 from typing import List
 from brownie.convert import Wei
 
-@fixture
+@fixture(scope='module')
 def deploy_daily_distributor(admin: Account, deploy_flex: FLEXCoin, deploy_daily_payout: DailyPayout) -> Distributor:
   '''
   FIXTURE: Deploy DailyPayout Contract with its payout set to DailyPayout contract deployed
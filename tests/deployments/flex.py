@@ -18,7 +18,7 @@ from pytest import fixture, mark
 ### Local Modules ###
 from tests import *
 
-@fixture
+@fixture(scope='module')
 def deploy_flex(admin: Account) -> FLEXCoin:
   '''
   FIXTURE: Deploy a flex contract to be used by other contracts' testing.  
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3.7
+# coding:utf-8
+# Copyright (C) 2019-2021 All rights reserved.
+# FILENAME:  tests/deployments/merkle_payout.py
+# VERSION: 	 1.0
+# CREATED: 	 2026-10-18 16:30
+# AUTHOR: 	 Aekasitt Guruvanich <sitt@coinflex.com>
+# DESCRIPTION:
+#
+# HISTORY:
+#*************************************************************
+### Project Contracts ###
+from brownie import FLEXCoin, MerklePayout, MerklePayoutMock
+### Third-Party Packages ###
+from brownie.network.gas.strategies import ExponentialScalingStrategy
+from eth_account import Account
+from pytest import fixture
+### Local Modules ###
+from tests import *
+from .flex import deploy_flex
+
+@fixture(scope='module')
+def deploy_merkle_payout(admin: Account, deploy_flex: FLEXCoin) -> MerklePayout:
+  '''
+  FIXTURE: Deploy a MerklePayout contract to be used by other contracts' testing.  
+
+  ---
+  :param: admin  `Account`  the wallet address to deploy the contract from  
+  :param: deploy_flex  `FLEXCoin`  generic ERC-20 to serve as the payout token  
+  :returns:  `MerklePayout`  
+  '''
+  flex: FLEXCoin = deploy_flex
+  gas_strategy   = ExponentialScalingStrategy('10 gwei', '50 gwei')
+  ### Deployment ###
+  return MerklePayout.deploy(flex, { 'from': admin, 'gas_price': gas_strategy })
+
+@fixture(scope='module')
+def deploy_merkle_payout_mock(admin: Account, deploy_flex: FLEXCoin) -> MerklePayoutMock:
+  '''
+  FIXTURE: Deploy a MerklePayoutMock contract with 10-block epochs.  
+
+  ---
+  :param: admin  `Account`  the wallet address to deploy the contract from  
+  :param: deploy_flex  `FLEXCoin`  generic ERC-20 to serve as the payout token  
+  :returns:  `MerklePayoutMock`  
+  '''
+  flex: FLEXCoin = deploy_flex
+  gas_strategy   = ExponentialScalingStrategy('10 gwei', '50 gwei')
+  ### Deployment ###
+  return MerklePayoutMock.deploy(flex, { 'from': admin, 'gas_price': gas_strategy })
+
+def test_deploy_merkle_payout(admin: Account, deploy_flex: FLEXCoin):
+  '''
+  TEST: Deploy MerklePayout Contract
+  
+  ---
+  :param: admin  `Account`  the wallet address to deploy the contract from  
+  :param: deploy_flex  `FLEXCoin`  generic ERC-20 to serve as the payout token  
+  '''
+  flex: FLEXCoin            = deploy_flex
+  gas_strategy              = ExponentialScalingStrategy('10 gwei', '50 gwei')
+  ### Deployment ###
+  merkle_payout: MerklePayout = MerklePayout.deploy(flex, { 'from': admin, 'gas_price': gas_strategy })
+  print(f'MerklePayout: { merkle_payout }')
+  assert merkle_payout.rootEpochs() == 0
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3.7
+# coding:utf-8
+# Copyright (C) 2019-2021 All rights reserved.
+# FILENAME:  tests/deployments/pipeline.py
+# VERSION: 	 1.0
+# CREATED: 	 2026-10-18 20:00
+# AUTHOR: 	 Aekasitt Guruvanich <sitt@coinflex.com>
+# DESCRIPTION:
+#
+# HISTORY:
+#*************************************************************
+### Project Contracts ###
+from brownie import DailyPayout, Distributor, FLEXCoin, QuarterlyPayout, history, veFLEX, web3
+### Third-Party Packages ###
+from eth_account import Account
+### Local Modules ###
+from scripts.utils.pipeline import TxPipeline
+from tests import admin
+from tests.deployments.flex import deploy_flex
+
+def test_pipeline_deploys_integration(admin: Account, deploy_flex: FLEXCoin):
+  flex: FLEXCoin      = deploy_flex
+  pipeline            = TxPipeline(admin)
+  ve_flex             = pipeline.deploy('veFLEX', veFLEX, flex, 'veFLEX', 'veFLEX', '1.0.0')
+  daily_payout        = pipeline.deploy('DailyPayout', DailyPayout, flex, ve_flex)
+  quarterly_payout    = pipeline.deploy('QuarterlyPayout', QuarterlyPayout, flex, ve_flex)
+  distributor_daily   = pipeline.deploy('Distributor daily', Distributor, daily_payout, flex, 'daily')
+  set_start           = pipeline.call('DailyPayout.setStartBlockHeight', daily_payout, 'setStartBlockHeight', 1000)
+  add_distributor     = pipeline.call('DailyPayout.addDistributor', daily_payout, 'addDistributor', distributor_daily)
+  pipeline.wait_all()
+
+  ### Nonces are consecutive in submission order ###
+  nonces = [ step.nonce for step in pipeline.steps ]
+  assert nonces == list(range(nonces[0], nonces[0] + len(nonces)))
+
+  ### Dependencies are explicit and resolved to deployed contracts ###
+  assert daily_payout.deps == [ve_flex] and quarterly_payout.deps == [ve_flex]
+  assert add_distributor.deps == [daily_payout, distributor_daily]
+  assert pipeline.result(daily_payout).vested() == pipeline.result(ve_flex).address
+  assert pipeline.result(daily_payout).startBlockHeight() == 1000
+  assert pipeline.result(daily_payout).isDistributor(pipeline.result(distributor_daily))
+  assert pipeline.result(quarterly_payout).vested() == pipeline.result(ve_flex).address
+  assert set_start.txn.status == 1
+
+  ### Every step is mined after the block it was broadcast at ###
+  assert all(step.mined_block > step.sent_block for step in pipeline.steps)
+
+  report = pipeline.report()
+  print('\n'.join(report))
+  assert len(report) == len(pipeline.steps)
+
+def test_pipeline_follows_replaced_step(admin: Account, deploy_flex: FLEXCoin):
+  flex: FLEXCoin = deploy_flex
+  pipeline       = TxPipeline(admin)
+
+  ### Hold the deployment in the mempool and re-broadcast it at a higher price, as a gas strategy does ###
+  web3.provider.make_request('miner_stop', [])
+  try:
+    ve_flex     = pipeline.deploy('veFLEX', veFLEX, flex, 'veFLEX', 'veFLEX', '1.0.0')
+    replacement = ve_flex.txn.replace(increment=1.5)
+  finally:
+    web3.provider.make_request('miner_start', [])
+
+  ### The step resolves to the replacement, which deployed the contract ###
+  contract: veFLEX = pipeline.result(ve_flex)
+  assert ve_flex.txn.txid == replacement.txid
+  assert contract.address == replacement.contract_address
+  assert contract.token() == flex.address
+  assert ve_flex.mined_block == replacement.block_number
+  assert len(history.filter(sender=admin, nonce=ve_flex.nonce)) == 2
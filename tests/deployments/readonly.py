@@ -0,0 +1,31 @@
+#!/usr/bin/env python3.7
+# coding:utf-8
+# Copyright (C) 2019-2021 All rights reserved.
+# FILENAME:  tests/deployments/readonly.py
+# VERSION: 	 1.0
+# CREATED: 	 2026-10-18 21:15
+# AUTHOR: 	 Aekasitt Guruvanich <sitt@coinflex.com>
+# DESCRIPTION:
+#
+# HISTORY:
+#*************************************************************
+### Standard Packages ###
+import json
+import os
+### Project Contracts ###
+from brownie import DailyPayout, web3
+### Local Modules ###
+from scripts.utils.readonly import ReadOnlyClient
+from tests import admin
+from tests.deployments.daily_payout import deploy_daily_payout
+from tests.deployments.flex import deploy_flex
+from tests.deployments.ve_flex import deploy_ve_flex
+
+def test_readonly_client_matches_brownie(deploy_daily_payout: DailyPayout, tmp_path):
+  daily_payout: DailyPayout = deploy_daily_payout
+  with open(os.path.join(tmp_path, 'DailyPayout.json'), 'w') as f:
+    json.dump(daily_payout.abi, f)
+  client = ReadOnlyClient(web3.provider.endpoint_uri, abi_dir=str(tmp_path))
+  assert client.call('DailyPayout', daily_payout.address, 'currentEpoch') == daily_payout.currentEpoch()
+  assert client.call('DailyPayout', daily_payout.address, 'vested') == daily_payout.vested()
+  assert client.call('DailyPayout', daily_payout.address, 'startBlockHeight', block_identifier=web3.eth.block_number) == 0
@@ -20,7 +20,7 @@ from pytest import mark
 from tests import *
 from .flex import deploy_flex
 
-@fixture
+@fixture(scope='module')
 def deploy_ve_flex(admin: Account, deploy_flex: FLEXCoin) -> veFLEX:
   '''
   FIXTURE: Returns deployed veFLEX contract to be used by other contract testing
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3.7
+# coding:utf-8
+# Copyright (C) 2019-2021 All rights reserved.
+# FILENAME:  tests/distributions/accumulator.py
+# VERSION: 	 1.0
+# CREATED: 	 2026-10-18 17:05
+# AUTHOR: 	 Aekasitt Guruvanich <sitt@coinflex.com>
+# DESCRIPTION:
+#   Differential test of AccumulatorPayout against DailyPayout over randomized
+#   stake and distribution histories, printing a claim gas comparison.
+# HISTORY:
+#*************************************************************
+### Standard Packages ###
+from random import Random
+from typing import Dict, List
+### Project Contracts ###
+from brownie import AccumulatorPayoutMock, DailyPayoutMock, FLEXCoin, veFLEX
+### Third-Party Packages ###
+from brownie.network import Chain
+from eth_account import Account
+from pytest import mark
+### Local Modules ###
+from tests import admin, user_accounts, BLUE, NFMT
+from tests.deployments.accumulator_payout import deploy_accumulator_payout_mock, deploy_daily_payout_mock
+from tests.deployments.flex import deploy_flex
+from tests.deployments.ve_flex import deploy_ve_flex
+
+WEEK: int     = 7 * 86400
+MAXTIME: int  = 4 * 365 * 86400
+
+def align_to_epoch(chain: Chain, start: int, epoch_blocks: int):
+  '''
+  Mines until a few blocks into an epoch, so that the next transactions all fall in the same epoch
+  '''
+  while (chain.height - start) % epoch_blocks != 2:
+    chain.mine(1)
+
+def random_action(rng: Random, chain: Chain, ve_flex: veFLEX, holder: Account):
+  '''
+  One of `create_lock`, `increase_amount`, `increase_unlock_time` or `withdraw`, whichever is allowed
+  '''
+  amount, end = ve_flex.locked(holder)
+  now: int    = chain.time()
+  if amount == 0:
+    ve_flex.create_lock(rng.randint(1, 1000) * 10 ** 18, now + rng.randint(1, 208) * WEEK, { 'from': holder })
+  elif end <= now:
+    ve_flex.withdraw({ 'from': holder })
+  elif rng.random() < 0.5:
+    ve_flex.increase_amount(rng.randint(1, 1000) * 10 ** 18, { 'from': holder })
+  elif (end // WEEK + 1) * WEEK <= now + MAXTIME:
+    ve_flex.increase_unlock_time(min(end + rng.randint(1, 52) * WEEK, now + MAXTIME), { 'from': holder })
+
+@mark.parametrize('seed', [1, 2, 3])
+def test_accumulator_matches_daily_payout(admin: Account, user_accounts: List[Account], deploy_flex: FLEXCoin, deploy_ve_flex: veFLEX, deploy_daily_payout_mock: DailyPayoutMock, deploy_accumulator_payout_mock: AccumulatorPayoutMock, seed: int):
+  '''
+  TEST: Both payouts see the same veFLEX history and distributions; claims must agree up to rounding,
+  i.e. DailyPayout floors once per epoch where AccumulatorPayout floors once per claim.
+  '''
+  rng: Random                     = Random(seed)
+  chain: Chain                    = Chain()
+  flex: FLEXCoin                  = deploy_flex
+  ve_flex: veFLEX                 = deploy_ve_flex
+  daily: DailyPayoutMock          = deploy_daily_payout_mock
+  accumulator: AccumulatorPayoutMock = deploy_accumulator_payout_mock
+  holders: List[Account]          = user_accounts[:5]
+  epochs: int                     = 30
+  epoch_blocks: int               = daily.MOCK_EPOCH_BLOCKS()
+  for holder in holders:
+    flex.transfer(holder, 10 ** 23, { 'from': admin })
+  start: int = chain.height + 5
+  daily.setStartBlockHeight(start, { 'from': admin })
+  accumulator.setStartBlockHeight(start, { 'from': admin })
+  claimed: Dict[str, List[int]] = { holder.address: [0, 0] for holder in holders } # DailyPayout, AccumulatorPayout
+  claims: Dict[str, int]        = { holder.address: 0 for holder in holders }
+  gas: List[tuple]              = []
+
+  def claim_both(holder: Account):
+    unclaimed: int = accumulator.currentEpoch() - accumulator.claimedEpoches(holder)
+    daily_txn      = daily.claim(holder, { 'from': holder })
+    accum_txn      = accumulator.claim(holder, { 'from': holder })
+    claimed[holder.address][0] += daily_txn.events['Claim']['amount'] if 'Claim' in daily_txn.events else 0
+    claimed[holder.address][1] += accum_txn.events['Claim']['amount'] if 'Claim' in accum_txn.events else 0
+    claims[holder.address]     += 1
+    gas.append((holder.address, unclaimed, ve_flex.user_point_epoch(holder), daily_txn.gas_used, accum_txn.gas_used))
+
+  ### Randomized history, one distribution per epoch ###
+  for epoch in range(epochs):
+    align_to_epoch(chain, start, epoch_blocks)
+    amount: int = rng.randint(1, 100) * 10 ** 18
+    daily.distribute(amount, { 'from': admin })
+    accumulator.distribute(amount, { 'from': admin })
+    for holder in rng.sample(holders, rng.randint(0, 2)):
+      random_action(rng, chain, ve_flex, holder)
+    chain.sleep(rng.randint(0, 3) * 86400)
+    if rng.random() < 0.2:
+      align_to_epoch(chain, start, epoch_blocks)
+      ve_flex.checkpoint({ 'from': admin })
+      claim_both(rng.choice(holders))
+
+  ### Settle everything ###
+  chain.mine(epoch_blocks)
+  align_to_epoch(chain, start, epoch_blocks)
+  ve_flex.checkpoint({ 'from': admin })
+  accumulator.checkpointEpochs(epochs, { 'from': admin })
+  assert accumulator.finalizedEpochs() == epochs
+  for holder in holders:
+    assert accumulator.getClaimable(holder) <= daily.getClaimable(holder) + epochs
+    claim_both(holder)
+  for holder in holders:
+    daily_total, accum_total = claimed[holder.address]
+    assert daily_total - 2 * claims[holder.address] <= accum_total <= daily_total + epochs
+  assert sum(accum for _, accum in claimed.values()) <= sum(accumulator.payoutForEpoch(i) for i in range(epochs))
+
+  ### Gas comparison ###
+  print(f'{ BLUE }Claim gas, seed { seed }{ NFMT }')
+  print(f'{ "holder":<44}{ "unclaimed":>10}{ "checkpoints":>12}{ "DailyPayout":>14}{ "Accumulator":>14}')
+  for holder, unclaimed, checkpoints, daily_gas, accum_gas in gas:
+    print(f'{ holder:<44}{ unclaimed:>10}{ checkpoints:>12}{ daily_gas:>14}{ accum_gas:>14}')
+  print(f'{ "total":<66}{ sum(row[3] for row in gas):>14}{ sum(row[4] for row in gas):>14}')
+
+def test_claim_finalizes_bounded_epochs(admin: Account, user_accounts: List[Account], deploy_flex: FLEXCoin, deploy_ve_flex: veFLEX, deploy_accumulator_payout_mock: AccumulatorPayoutMock):
+  '''
+  TEST: After a gap longer than `CLAIM_CHECKPOINT_EPOCHS`, a claim only finalizes and pays that many epochs;
+  the rest follows with later claims or `checkpointEpochs`
+  '''
+  chain: Chain                       = Chain()
+  flex: FLEXCoin                     = deploy_flex
+  ve_flex: veFLEX                    = deploy_ve_flex
+  accumulator: AccumulatorPayoutMock = deploy_accumulator_payout_mock
+  holder: Account                    = user_accounts[0]
+  limit: int                         = accumulator.CLAIM_CHECKPOINT_EPOCHS()
+  epochs: int                        = limit + 5
+  flex.transfer(holder, 10 ** 21, { 'from': admin })
+  ve_flex.create_lock(10 ** 21, chain.time() + MAXTIME, { 'from': holder })
+  for _ in range(epochs):
+    accumulator.distribute(10 ** 18, { 'from': admin })
+  accumulator.setStartBlockHeight(chain.height + 1, { 'from': admin })
+  chain.mine(epochs * accumulator.MOCK_EPOCH_BLOCKS())
+
+  txn = accumulator.claim(holder, { 'from': holder })
+  assert accumulator.finalizedEpochs() == limit
+  assert accumulator.claimedEpoches(holder) == limit
+  assert txn.events['Claim']['endingEpoch'] == limit - 1
+  accumulator.claim(holder, { 'from': holder })
+  assert accumulator.finalizedEpochs() == epochs
+  assert accumulator.claimedEpoches(holder) == epochs
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3.7
+# coding:utf-8
+# Copyright (C) 2019-2021 All rights reserved.
+# FILENAME:  tests/distributions/balance_store.py
+# VERSION: 	 1.0
+# CREATED: 	 2026-10-19 01:10
+# AUTHOR: 	 Aekasitt Guruvanich <sitt@coinflex.com>
+# DESCRIPTION:
+#
+# HISTORY:
+#*************************************************************
+### Standard Packages ###
+from random import Random
+from typing import Dict, List
+### Third-Party Packages ###
+from pytest import raises
+### Local Modules ###
+from scripts.utils.balance_store import BalanceStore, claimable_from_store, from_limbs, to_limbs
+from scripts.utils.rewards import claimable
+
+def test_balance_store_round_trip(tmp_path):
+  rng: Random = Random(7)
+  values: List[int] = [ 0, 1, 2 ** 64 - 1, 2 ** 64, 2 ** 127 - 1 ] + [ rng.getrandbits(100) for _ in range(20) ]
+  assert list(from_limbs(to_limbs(values))) == values
+  with raises(OverflowError):
+    to_limbs([ 2 ** 128 ])
+
+  ### Holders joining over the epochs outgrow the initial capacity ###
+  store: BalanceStore            = BalanceStore(str(tmp_path), holder_capacity=4)
+  holders: List[str]             = []
+  history: List[Dict[str, int]]  = []
+  for epoch in range(6):
+    holders += [ f'0x{ rng.getrandbits(160):040x}' for _ in range(3) ]
+    balances: Dict[str, int] = { holder: rng.getrandbits(100) if rng.random() < 0.8 else 0 for holder in holders[-6:] }
+    assert store.append_epoch(balances) == epoch
+    history.append(balances)
+  assert store.holder_capacity == 32
+  assert store.matrix().shape == (6, len(holders), 2)
+
+  ### A read-only reopen sees every committed epoch ###
+  reader: BalanceStore = BalanceStore(str(tmp_path), readonly=True)
+  assert reader.holders == holders
+  for epoch, balances in enumerate(history):
+    assert reader.balances(epoch) == { holder: balances.get(holder, 0) for holder in holders }
+  assert reader.balance(holders[0], 2) == history[2].get(holders[0], 0)
+  assert reader.balance('0x' + '00' * 20, 2) == 0
+  with raises(ValueError):
+    reader.append_epoch({})
+
+  payouts: List[int] = [ 10 ** 21 ] * len(history)
+  totals: List[int]  = [ sum(balances.values()) for balances in history ]
+  expected           = claimable([ [ balances.get(holder, 0) for balances in history ] for holder in holders ], payouts, totals)
+  assert list(claimable_from_store(reader, payouts, totals).values()) == expected
+
+def test_balance_store_commits_holders_with_epochs(tmp_path):
+  store: BalanceStore = BalanceStore(str(tmp_path), holder_capacity=2)
+  store.append_epoch({ '0xa': 1, '0xb': 2 })
+
+  ### Outgrowing the capacity rewrites the data, but ids without an epoch row are not persisted ###
+  store.add_holders([ '0xc', '0xd', '0xe' ])
+  assert store.holder_capacity == 8
+  reopened: BalanceStore = BalanceStore(str(tmp_path), readonly=True)
+  assert reopened.holders == [ '0xa', '0xb' ]
+  assert reopened.holder_capacity == 8
+  assert reopened.balances(0) == { '0xa': 1, '0xb': 2 }
+
+  ### They are committed with the next epoch ###
+  store.append_epoch({ '0xc': 3, '0xa': 4 })
+  reopened = BalanceStore(str(tmp_path), readonly=True)
+  assert reopened.holders == [ '0xa', '0xb', '0xc', '0xd', '0xe' ]
+  assert reopened.balances(1) == { '0xa': 4, '0xb': 0, '0xc': 3, '0xd': 0, '0xe': 0 }
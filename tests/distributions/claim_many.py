@@ -0,0 +1,68 @@
+#!/usr/bin/env python3.7
+# coding:utf-8
+# Copyright (C) 2019-2021 All rights reserved.
+# FILENAME:  tests/distributions/claim_many.py
+# VERSION: 	 1.0
+# CREATED: 	 2026-10-18 18:10
+# AUTHOR: 	 Aekasitt Guruvanich <sitt@coinflex.com>
+# DESCRIPTION:
+#
+# HISTORY:
+#*************************************************************
+### Standard Packages ###
+from typing import List
+### Project Contracts ###
+from brownie import DailyPayoutMock, FLEXCoin, veFLEX, reverts
+### Third-Party Packages ###
+from brownie.network import Chain
+from eth_account import Account
+### Local Modules ###
+from scripts.utils.claims import chunk_owners
+from tests import admin, user_accounts
+from tests.deployments.accumulator_payout import deploy_daily_payout_mock
+from tests.deployments.flex import deploy_flex
+from tests.deployments.ve_flex import deploy_ve_flex
+
+def test_claim_many(admin: Account, user_accounts: List[Account], deploy_flex: FLEXCoin, deploy_ve_flex: veFLEX, deploy_daily_payout_mock: DailyPayoutMock):
+  flex: FLEXCoin          = deploy_flex
+  ve_flex: veFLEX         = deploy_ve_flex
+  payout: DailyPayoutMock = deploy_daily_payout_mock
+  chain: Chain            = Chain()
+  owners: List[Account]   = user_accounts[:4]
+  relayer: Account        = user_accounts[4]
+  stranger: Account       = user_accounts[5]
+  ### Vest ###
+  for owner in owners:
+    flex.transfer(owner, 10 ** 20, { 'from': admin })
+    ve_flex.create_lock(10 ** 20, chain.time() + 4 * 365 * 86400, { 'from': owner })
+  ### Distribute two epochs ###
+  payout.setStartBlockHeight(chain.height + 1, { 'from': admin })
+  for _ in range(2):
+    payout.distribute(10 ** 18, { 'from': admin })
+  chain.mine(2 * payout.MOCK_EPOCH_BLOCKS())
+  ### Authorize relayer ###
+  for owner in owners:
+    txn = payout.setClaimer(relayer, True, { 'from': owner })
+    assert txn.events['IsClaimer']['claimer'] == relayer
+  with reverts('Not authorized to claim for owner'):
+    payout.claimMany(owners, { 'from': stranger })
+  ### Claim on behalf of every owner at once ###
+  claimable: List[int] = [ payout.getClaimable(owner) for owner in owners ]
+  balances: List[int]  = [ flex.balanceOf(owner) for owner in owners ]
+  txn = payout.claimMany(owners, { 'from': relayer })
+  assert len(txn.events['Claim']) == len(owners)
+  for owner, amount, balance in zip(owners, claimable, balances):
+    assert amount > 0
+    assert flex.balanceOf(owner) == balance + amount
+    assert payout.claimedEpoches(owner) == 2
+  ### Revoked claimers cannot claim anymore ###
+  payout.setClaimer(relayer, False, { 'from': owners[0] })
+  with reverts('Not authorized to claim for owner'):
+    payout.claimMany(owners, { 'from': relayer })
+
+def test_chunk_owners():
+  owners: List[str] = [ f'0x{ i:040x}' for i in range(103) ]
+  estimate          = lambda chunk: 30000 + 50000 * len(chunk)
+  chunks            = chunk_owners(estimate, owners, 800000)
+  assert [ len(chunk) for chunk in chunks ] == [15] * 6 + [13]
+  assert sum(chunks, []) == owners
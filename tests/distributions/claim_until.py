@@ -0,0 +1,69 @@
+#!/usr/bin/env python3.7
+# coding:utf-8
+# Copyright (C) 2019-2021 All rights reserved.
+# FILENAME:  tests/distributions/claim_until.py
+# VERSION: 	 1.0
+# CREATED: 	 2026-10-18 18:35
+# AUTHOR: 	 Aekasitt Guruvanich <sitt@coinflex.com>
+# DESCRIPTION:
+#
+# HISTORY:
+#*************************************************************
+### Standard Packages ###
+from typing import List
+### Project Contracts ###
+from brownie import DailyPayoutMock, FLEXCoin, veFLEX, reverts
+### Third-Party Packages ###
+from brownie.network import Chain
+from eth_account import Account
+### Local Modules ###
+from scripts.utils.claims import claim_in_windows
+from tests import admin, user_accounts
+from tests.deployments.accumulator_payout import deploy_daily_payout_mock
+from tests.deployments.flex import deploy_flex
+from tests.deployments.ve_flex import deploy_ve_flex
+
+def test_claim_until(admin: Account, user_accounts: List[Account], deploy_flex: FLEXCoin, deploy_ve_flex: veFLEX, deploy_daily_payout_mock: DailyPayoutMock):
+  flex: FLEXCoin          = deploy_flex
+  ve_flex: veFLEX         = deploy_ve_flex
+  payout: DailyPayoutMock = deploy_daily_payout_mock
+  chain: Chain            = Chain()
+  alice: Account          = user_accounts[0]
+  bob: Account            = user_accounts[1]
+  epochs: int             = 12
+  ### Vest ###
+  for owner in (alice, bob):
+    flex.transfer(owner, 10 ** 20, { 'from': admin })
+    ve_flex.create_lock(10 ** 20, chain.time() + 4 * 365 * 86400, { 'from': owner })
+  ### Distribute and let every epoch start ###
+  payout.setStartBlockHeight(chain.height + 1, { 'from': admin })
+  for _ in range(epochs):
+    payout.distribute(10 ** 18, { 'from': admin })
+  chain.mine(epochs * payout.MOCK_EPOCH_BLOCKS())
+  with reverts('Ending epoch not distributed yet!'):
+    payout.claimUntil(alice, epochs, { 'from': alice })
+  with reverts('Can only claim for own account'):
+    payout.claimUntil(alice, 0, { 'from': bob })
+  ### Windows add up to a full claim ###
+  claimable: int = payout.getClaimable(alice)
+  first: int     = payout.getClaimableUntil(alice, 3)
+  txn            = payout.claimUntil(alice, 3, { 'from': alice })
+  assert txn.events['Claim']['amount'] == first
+  assert payout.claimedEpoches(alice) == 4
+  assert payout.getClaimable(alice) == claimable - first
+  ### Helper splits the rest under a budget of about three epochs ###
+  balance: int = flex.balanceOf(bob)
+  budget: int  = payout.claimUntil.estimate_gas(bob, 2, { 'from': bob })
+  expected: int = payout.getClaimable(bob)
+  receipts     = claim_in_windows(payout, bob, budget, {})
+  assert len(receipts) >= epochs // 3
+  assert payout.claimedEpoches(bob) == epochs
+  assert flex.balanceOf(bob) == balance + expected
+  ### Distributed epochs that have not started yet are left alone, without a transaction claiming nothing ###
+  for _ in range(epochs):
+    payout.distribute(10 ** 18, { 'from': admin })
+  receipts = claim_in_windows(payout, bob, budget, {})
+  assert all('Claim' in receipt.events for receipt in receipts)
+  assert payout.claimedEpoches(bob) < payout.currentEpoch()
+  assert payout.getClaimableUntil(bob, payout.currentEpoch() - 1) == 0
+  assert claim_in_windows(payout, bob, budget, {}) == []
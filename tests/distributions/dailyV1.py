@@ -211,100 +211,3 @@ def test_epoch0_is_not_claimable(admin: Account, user_accounts: List[Account], d
   print(tx.events)
   print(f'====> block height {chain.height}')
   print(f'***** epoch number {payout.getCurrentEpoch()}')
-
-def test_multi_claim(admin: Account, user_accounts: List[Account], deploy_flex: FLEXCoin, deploy_ve_flex: veFLEX, deploy_daily_payout: DailyPayout, deploy_daily_distributor: Distributor):
-  # 1: test set up
-  flex: FLEXCoin           = deploy_flex
-  ve_flex: veFLEX          = deploy_ve_flex
-  payout: DailyPayout      = deploy_daily_payout
-  distributor: Distributor = deploy_daily_distributor
-  gas_strategy             = ExponentialScalingStrategy('10 gwei', '50 gwei')
-  chain                    = Chain()
-  alice                    = user_accounts[1]
-  bob                      = user_accounts[2]
-  eve                      = user_accounts[3]
-  sam                      = user_accounts[4]
-  flex.transfer(alice, 1000*1e18, {'from': admin, 'gas_price': gas_strategy})
-  flex.transfer(bob, 1000*1e18, {'from': admin, 'gas_price': gas_strategy})
-  flex.transfer(eve, 1000*1e18, {'from': admin, 'gas_price': gas_strategy})
-
-  # 2: start block height set and test
-  startBlockHeight: int   = chain.height
-  print(f'epoch starts at block height: {startBlockHeight}')
-  payout.setStartBlockHeight(startBlockHeight, {'from': admin, 'gas_price': gas_strategy})
-  print('set DAO start block height')
-  print(f'====> block height {chain.height}')
-  print(f'***** epoch number {payout.getCurrentEpoch()}')
-
-  # 3: stake some into veFlex from alice at epoch 0
-  _4_years  = chain.time() + (4 * 365 * 86400)
-  _1_years  = chain.time() + (365 * 86400)
-  _1_month  = chain.time() + (30 * 86400)
-  ve_flex.create_lock(flex.balanceOf(alice), _4_years, { 'from': alice, 'gas_price': gas_strategy })
-  print(f'alice stake 4 years at block height {chain.height}')
-  print(f'veFLEX Balance: { ve_flex.balanceOf(alice) }')
-  print(f'***** epoch number {payout.getCurrentEpoch()}') 
-  ve_flex.create_lock(flex.balanceOf(bob), _1_years, { 'from': bob, 'gas_price': gas_strategy })
-  print(f'bob stake 1 year at block height {chain.height}')
-  print(f'veFLEX Balance: { ve_flex.balanceOf(bob) }')
-  print(f'***** epoch number {payout.getCurrentEpoch()}') 
-  ve_flex.create_lock(flex.balanceOf(eve), _1_month, { 'from': eve, 'gas_price': gas_strategy })
-  print(f'eve stake 1 month at block height {chain.height}')
-  print(f'veFLEX Balance: { ve_flex.balanceOf(eve) }')
-  print(f'***** epoch number {payout.getCurrentEpoch()}') 
-  print('sam stake nothing')
-  print(f'veFLEX Balance: { ve_flex.balanceOf(sam) }')
-  print(f'***** epoch number {payout.getCurrentEpoch()}') 
-  # 4: distribute for 50 epochs
-  ### Execute ###
-  payout.addDistributor(distributor, {'from': admin, 'gas_price': gas_strategy})
-  print('activate 10 epochs for rewarding')
-  for i in range(10):
-    payout.distribute(3000 * 1e18, { 'from': admin, 'gas_price': gas_strategy })
-    print(f'Epoch { payout.currentEpoch() - 1 } payout: { payout.payoutForEpoch(i) }')
-  print(f'====> block height {chain.height}')
-  print(f'***** epoch number {payout.getCurrentEpoch()}')
-
-  # 5: claim
-  tx = payout.claim(alice, { 'from': alice, 'gas_price': gas_strategy })
-  print(tx.events)
-  print(f'====> alice claimed at block height {chain.height}')
-  print(f'***** epoch number {payout.getCurrentEpoch()}') 
-  
-  tx = payout.claim(bob, { 'from': bob, 'gas_price': gas_strategy })
-  print(tx.events)
-  print(f'====> bob claimed at block height {chain.height}')
-  print(f'***** epoch number {payout.getCurrentEpoch()}')   
-  
-  tx = payout.claim(eve, { 'from': eve, 'gas_price': gas_strategy })
-  print(tx.events)
-  print(f'====> eve claimed block height {chain.height}')
-  print(f'***** epoch number {payout.getCurrentEpoch()}') 
-
-  tx = payout.claim(sam, { 'from': sam, 'gas_price': gas_strategy })
-  print(tx.events)
-  print(f'====> sam claimed block height {chain.height}')
-  print(f'***** epoch number {payout.getCurrentEpoch()}') 
-
-  # 6: chain is moving and claim again
-
-  chain.mine(100)
-  tx = payout.claim(alice, { 'from': alice, 'gas_price': gas_strategy })
-  print(tx.events)
-  print(f'====> alice claimed at block height {chain.height}')
-  print(f'***** epoch number {payout.getCurrentEpoch()}') 
-  
-  tx = payout.claim(bob, { 'from': bob, 'gas_price': gas_strategy })
-  print(tx.events)
-  print(f'====> bob claimed at block height {chain.height}')
-  print(f'***** epoch number {payout.getCurrentEpoch()}')   
-  
-  tx = payout.claim(eve, { 'from': eve, 'gas_price': gas_strategy })
-  print(tx.events)
-  print(f'====> eve claimed block height {chain.height}')
-  print(f'***** epoch number {payout.getCurrentEpoch()}') 
-
-  tx = payout.claim(sam, { 'from': sam, 'gas_price': gas_strategy })
-  print(tx.events)
-  print(f'====> sam claimed block height {chain.height}')
-  print(f'***** epoch number {payout.getCurrentEpoch()}') 
\ No newline at end of file
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3.7
+# coding:utf-8
+# Copyright (C) 2019-2021 All rights reserved.
+# FILENAME:  tests/distributions/keeper.py
+# VERSION: 	 1.0
+# CREATED: 	 2026-10-18 19:30
+# AUTHOR: 	 Aekasitt Guruvanich <sitt@coinflex.com>
+# DESCRIPTION:
+#
+# HISTORY:
+#*************************************************************
+### Standard Packages ###
+from typing import List
+### Project Contracts ###
+from brownie import DailyPayout, Distributor, FLEXCoin, QuarterlyPayout, history, web3
+### Third-Party Packages ###
+from eth_account import Account
+### Local Modules ###
+from scripts.utils.keeper import DistributionKeeper
+from scripts.utils.nonces import NonceManager
+from tests import admin, user_accounts
+from tests.deployments.daily_payout import deploy_daily_payout, deploy_quarterly_payout
+from tests.deployments.flex import deploy_flex
+from tests.deployments.ve_flex import deploy_ve_flex
+
+def test_keeper_distributes_funded_distributors(admin: Account, user_accounts: List[Account], deploy_flex: FLEXCoin, deploy_daily_payout: DailyPayout, deploy_quarterly_payout: QuarterlyPayout):
+  flex: FLEXCoin           = deploy_flex
+  keeper_acct: Account     = user_accounts[0]
+  payouts: dict            = { 'daily': deploy_daily_payout, 'quarterly': deploy_quarterly_payout }
+  distributors: dict       = {}
+  for name, payout in payouts.items():
+    distributors[name] = Distributor.deploy(payout, flex, f'{ name } distributor', { 'from': admin })
+    distributors[name].addDistributor(keeper_acct, { 'from': admin })
+    payout.addDistributor(distributors[name], { 'from': admin })
+  keeper = DistributionKeeper(flex, distributors, keeper_acct)
+
+  ### Nothing to distribute ###
+  assert keeper.poll() == []
+
+  ### Only the funded distributor fires ###
+  flex.transfer(distributors['daily'], 10 ** 18, { 'from': admin })
+  sent = keeper.poll()
+  assert [ pending.name for pending in sent ] == ['daily']
+  assert keeper.drain(timeout=30)
+  assert payouts['daily'].payoutForEpoch(0) == 10 ** 18
+  assert payouts['quarterly'].currentEpoch() == 0
+
+  ### Both fire back to back on consecutive nonces ###
+  for name in distributors:
+    flex.transfer(distributors[name], 2 * 10 ** 18, { 'from': admin })
+  sent = keeper.poll()
+  assert sorted(pending.name for pending in sent) == ['daily', 'quarterly']
+  assert sent[1].nonce == sent[0].nonce + 1
+  assert keeper.drain(timeout=30)
+  for name, payout in payouts.items():
+    assert payout.payoutForEpoch(payout.currentEpoch() - 1) == 2 * 10 ** 18
+    assert flex.balanceOf(distributors[name]) == 0
+  metrics: dict = keeper.metrics.snapshot()
+  print(f'Keeper metrics: { metrics }')
+  assert metrics['sent'] == metrics['confirmed'] == 3
+  assert metrics['failed'] == 0 and metrics['pending'] == 0
+  assert keeper.nonces.peek() == NonceManager(keeper_acct.address).peek()
+
+def test_keeper_settles_replaced_distribution(admin: Account, user_accounts: List[Account], deploy_flex: FLEXCoin, deploy_daily_payout: DailyPayout):
+  flex: FLEXCoin           = deploy_flex
+  payout: DailyPayout      = deploy_daily_payout
+  keeper_acct: Account     = user_accounts[0]
+  distributor: Distributor = Distributor.deploy(payout, flex, 'daily distributor', { 'from': admin })
+  distributor.addDistributor(keeper_acct, { 'from': admin })
+  payout.addDistributor(distributor, { 'from': admin })
+  keeper = DistributionKeeper(flex, { 'daily': distributor }, keeper_acct)
+  flex.transfer(distributor, 10 ** 18, { 'from': admin })
+  epoch: int = payout.currentEpoch()
+
+  ### Hold the distribution in the mempool and re-broadcast it at a higher price, as a gas strategy does ###
+  web3.provider.make_request('miner_stop', [])
+  try:
+    sent = keeper.poll()
+    assert [ pending.name for pending in sent ] == ['daily']
+    original    = history.filter(sender=keeper_acct, nonce=sent[0].nonce)[0]
+    replacement = original.replace(increment=1.5)
+    assert replacement.txid != sent[0].txid
+  finally:
+    web3.provider.make_request('miner_start', [])
+
+  ### The original hash never gets a receipt, yet the distribution settles with the replacement ###
+  assert keeper.drain(timeout=30)
+  assert replacement.status == 1
+  assert payout.payoutForEpoch(epoch) == 10 ** 18
+  metrics: dict = keeper.metrics.snapshot()
+  assert metrics['confirmed'] == 1 and metrics['failed'] == 0 and metrics['pending'] == 0
+
+  ### Nothing stays pending, so the Distributor is served again on the next funding ###
+  flex.transfer(distributor, 10 ** 18, { 'from': admin })
+  assert [ pending.name for pending in keeper.poll() ] == ['daily']
+  assert keeper.drain(timeout=30)
+  assert keeper.metrics.confirmed == 2
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3.7
+# coding:utf-8
+# Copyright (C) 2019-2021 All rights reserved.
+# FILENAME:  tests/distributions/merkle.py
+# VERSION: 	 1.0
+# CREATED: 	 2026-10-18 16:30
+# AUTHOR: 	 Aekasitt Guruvanich <sitt@coinflex.com>
+# DESCRIPTION:
+#
+# HISTORY:
+#*************************************************************
+### Standard Packages ###
+from typing import List
+### Project Contracts ###
+from brownie import FLEXCoin, MerklePayout, MerklePayoutMock, veFLEX, reverts
+### Third-Party Packages ###
+from brownie.network import Chain
+from brownie.network.gas.strategies import ExponentialScalingStrategy
+from eth_account import Account
+### Local Modules ###
+from scripts.utils.merkle import MerkleTree, build_tree
+from tests import admin, user_accounts
+from tests.deployments.flex import deploy_flex
+from tests.deployments.merkle_payout import deploy_merkle_payout, deploy_merkle_payout_mock
+from tests.deployments.ve_flex import deploy_ve_flex
+
+def test_merkle_claims(admin: Account, user_accounts: List[Account], deploy_flex: FLEXCoin, deploy_ve_flex: veFLEX, deploy_merkle_payout_mock: MerklePayoutMock):
+  flex: FLEXCoin        = deploy_flex
+  ve_flex: veFLEX       = deploy_ve_flex
+  payout: MerklePayout  = deploy_merkle_payout_mock
+  chain: Chain          = Chain()
+  holders: List[Account] = user_accounts[:3]
+  gas_strategy          = ExponentialScalingStrategy('10 gwei', '50 gwei')
+  ### Vest ###
+  stake: int = flex.balanceOf(admin) // 10
+  for holder in holders:
+    flex.transfer(holder, stake, { 'from': admin, 'gas_price': gas_strategy })
+    flex.approve(ve_flex, stake, { 'from': holder, 'gas_price': gas_strategy })
+    ve_flex.create_lock(stake, chain.time() + (4 * 365 * 86400), { 'from': holder, 'gas_price': gas_strategy })
+  ### Distribute one epoch ###
+  amount: int = flex.balanceOf(admin) // 10
+  flex.approve(payout, amount, { 'from': admin, 'gas_price': gas_strategy })
+  payout.distribute(amount, { 'from': admin, 'gas_price': gas_strategy })
+  payout.setStartBlockHeight(chain.height, { 'from': admin, 'gas_price': gas_strategy })
+  chain.mine(1)
+  start: int  = payout.startBlockHeight()
+  tree        = build_tree(
+    [ holder.address for holder in holders ],
+    [ [ ve_flex.balanceOfAt(holder, start) ] for holder in holders ],
+    [ amount ],
+    [ ve_flex.totalSupplyAt(start) ],
+  )
+  payout.setMerkleRoot(tree.root, 1, { 'from': admin, 'gas_price': gas_strategy })
+  ### Claim once per holder, whatever the number of covered epochs ###
+  for holder in holders:
+    entitled: int = tree.entitlements[holder.address]
+    proof         = tree.proof(holder.address)
+    assert payout.getClaimable(holder, entitled, proof) == entitled
+    txn = payout.claim(holder, entitled, proof, { 'from': holder, 'gas_price': gas_strategy })
+    assert txn.events['Claim']['amount'] == entitled
+    assert payout.getClaimable(holder, entitled, proof) == 0
+  assert sum(tree.entitlements.values()) <= amount
+  ### Cumulative amounts only pay the difference ###
+  flex.approve(payout, amount, { 'from': admin, 'gas_price': gas_strategy })
+  payout.distribute(amount, { 'from': admin, 'gas_price': gas_strategy })
+  chain.mine(payout.MOCK_EPOCH_BLOCKS())
+  alice: Account = holders[0]
+  grown          = MerkleTree({ owner: value * 2 for owner, value in tree.entitlements.items() }) # stands in for the entitlements after the second epoch
+  payout.setMerkleRoot(grown.root, 2, { 'from': admin, 'gas_price': gas_strategy })
+  txn = payout.claim(alice, grown.entitlements[alice.address], grown.proof(alice.address), { 'from': alice, 'gas_price': gas_strategy })
+  assert txn.events['Claim']['amount'] == tree.entitlements[alice.address]
+  assert payout.coveredPayout() == 2 * amount
+  assert payout.totalClaimed() == sum(tree.entitlements.values()) + tree.entitlements[alice.address]
+  ### An inflated root cannot pay out more than the covered epochs ###
+  bob: Account = holders[1]
+  inflated     = MerkleTree({ **grown.entitlements, bob.address: tree.entitlements[bob.address] + amount })
+  payout.setMerkleRoot(inflated.root, 2, { 'from': admin, 'gas_price': gas_strategy })
+  with reverts('Claims exceed covered payouts!'):
+    payout.claim(bob, inflated.entitlements[bob.address], inflated.proof(bob.address), { 'from': bob, 'gas_price': gas_strategy })
+
+def test_merkle_invalid_claims(admin: Account, user_accounts: List[Account], deploy_merkle_payout: MerklePayout):
+  payout: MerklePayout = deploy_merkle_payout
+  alice: Account       = user_accounts[0]
+  bob: Account         = user_accounts[1]
+  tree                 = MerkleTree({ alice.address: 100, bob.address: 200 })
+  payout.setMerkleRoot(tree.root, 0, { 'from': admin })
+  with reverts('Invalid Merkle proof!'):
+    payout.claim(alice, 200, tree.proof(alice.address), { 'from': alice })
+  with reverts('Can only claim for own account'):
+    payout.claim(alice, 100, tree.proof(alice.address), { 'from': bob })
+  with reverts('Not authorized!'):
+    payout.setMerkleRoot(tree.root, 0, { 'from': alice })
+  with reverts('Cannot cover undistributed epochs!'):
+    payout.setMerkleRoot(tree.root, 1, { 'from': admin })
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3.7
+# coding:utf-8
+# Copyright (C) 2019-2021 All rights reserved.
+# FILENAME:  tests/distributions/rewards.py
+# VERSION: 	 1.0
+# CREATED: 	 2026-10-19 02:30
+# AUTHOR: 	 Aekasitt Guruvanich <sitt@coinflex.com>
+# DESCRIPTION:
+#   Plain unit tests of `scripts/utils/rewards.py`, no chain needed.
+# HISTORY:
+#*************************************************************
+### Standard Packages ###
+from random import Random
+from typing import List
+### Third-Party Packages ###
+import numpy
+from pytest import fixture, raises
+### Local Modules ###
+from scripts.utils import rewards
+from scripts.utils.rewards import UINT256_MAX, claimable, epoch_rewards
+
+@fixture(params=['python', 'numpy'])
+def backend(request, monkeypatch) -> str:
+  '''
+  Runs a test against numpy and against the pure python fallback
+  '''
+  monkeypatch.setattr(rewards, 'np', numpy if request.param == 'numpy' else None)
+  return request.param
+
+def as_rows(result) -> List[List[int]]:
+  return [ [ int(value) for value in row ] for row in result ]
+
+def test_epoch_rewards_floor(backend: str):
+  ### Three equal holders split 10 into 3 each, leaving 1 undistributed as SafeMath does ###
+  assert as_rows(epoch_rewards([[1], [1], [1]], [10], [3])) == [[3], [3], [3]]
+  assert as_rows(epoch_rewards([[2, 5], [1, 0]], [7, 9], [3, 5])) == [[4, 9], [2, 0]]
+
+def test_epoch_rewards_zero_total(backend: str):
+  ### Epochs without any veFLEX pay nobody instead of dividing by zero ###
+  assert as_rows(epoch_rewards([[0, 3], [0, 1]], [100, 100], [0, 4])) == [[0, 75], [0, 25]]
+
+def test_epoch_rewards_overflow(backend: str):
+  with raises(OverflowError):
+    epoch_rewards([[UINT256_MAX // 2 + 1]], [2], [1])
+
+def test_claimable_claimed_epochs(backend: str):
+  balances: List[List[int]] = [[1, 2, 3], [3, 2, 1]]
+  payouts: List[int]        = [40, 40, 40]
+  totals: List[int]         = [4, 4, 4]
+  assert claimable(balances, payouts, totals) == [60, 60]
+  ### Epochs before `claimedEpoches` are skipped per holder ###
+  assert claimable(balances, payouts, totals, [0, 2]) == [60, 10]
+  assert claimable(balances, payouts, totals, [3, 1]) == [0, 30]
+  assert claimable(balances, payouts, totals, numpy.array([0, 2])) == [60, 10]
+
+def test_numpy_matches_python(monkeypatch):
+  rng: Random               = Random(3)
+  payouts: List[int]        = [ rng.getrandbits(80) for _ in range(12) ]
+  balances: List[List[int]] = [ [ rng.getrandbits(100) if rng.random() < 0.7 else 0 for _ in payouts ] for _ in range(30) ]
+  totals: List[int]         = [ sum(column) + rng.getrandbits(60) if epoch % 5 else 0 for epoch, column in enumerate(zip(*balances)) ]
+  claimed: List[int]        = [ rng.randrange(len(payouts) + 1) for _ in balances ]
+  monkeypatch.setattr(rewards, 'np', numpy)
+  expected = (as_rows(epoch_rewards(balances, payouts, totals)), claimable(balances, payouts, totals, claimed))
+  monkeypatch.setattr(rewards, 'np', None)
+  assert (as_rows(epoch_rewards(balances, payouts, totals)), claimable(balances, payouts, totals, claimed)) == expected
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3.7
+# coding:utf-8
+# Copyright (C) 2019-2021 All rights reserved.
+# FILENAME:  tests/distributions/supply_snapshot.py
+# VERSION: 	 1.0
+# CREATED: 	 2026-10-18 22:30
+# AUTHOR: 	 Aekasitt Guruvanich <sitt@coinflex.com>
+# DESCRIPTION:
+#
+# HISTORY:
+#*************************************************************
+### Standard Packages ###
+from typing import List
+### Project Contracts ###
+from brownie import DailyPayoutMock, FLEXCoin, veFLEX
+### Third-Party Packages ###
+from brownie.network import Chain
+from eth_account import Account
+### Local Modules ###
+from tests import admin, user_accounts
+from tests.deployments.accumulator_payout import deploy_daily_payout_mock
+from tests.deployments.flex import deploy_flex
+from tests.deployments.ve_flex import deploy_ve_flex
+
+def test_total_supply_snapshot(admin: Account, user_accounts: List[Account], deploy_flex: FLEXCoin, deploy_ve_flex: veFLEX, deploy_daily_payout_mock: DailyPayoutMock):
+  flex: FLEXCoin          = deploy_flex
+  ve_flex: veFLEX         = deploy_ve_flex
+  payout: DailyPayoutMock = deploy_daily_payout_mock
+  chain: Chain            = Chain()
+  owners: List[Account]   = user_accounts[:3]
+  epochs: int             = 6
+  for owner in owners:
+    flex.transfer(owner, 10 ** 20, { 'from': admin })
+    ve_flex.create_lock(10 ** 20, chain.time() + 4 * 365 * 86400, { 'from': owner })
+
+  ### Nothing is recorded before the epochs are placed ###
+  payout.distribute(10 ** 18, { 'from': admin })
+  assert payout.currentEpoch() == 1
+  with_start: int = chain.height + 1
+  payout.setStartBlockHeight(with_start, { 'from': admin })
+  for _ in range(epochs - 1):
+    payout.distribute(10 ** 18, { 'from': admin })
+  started: int = (chain.height - with_start - 1) // payout.MOCK_EPOCH_BLOCKS() + 1
+  for epoch in range(started):
+    assert payout.totalSupplyForEpoch(epoch) == ve_flex.totalSupplyAt(payout.getEpochStartBlockHeight(epoch, { 'from': admin }))
+
+  ### First claimant records the remaining epochs; later claimants reuse them ###
+  chain.mine(epochs * payout.MOCK_EPOCH_BLOCKS())
+  first = payout.claim(owners[0], { 'from': owners[0] })
+  heights: List[int] = [ payout.getEpochStartBlockHeight(epoch, { 'from': admin }) for epoch in range(epochs) ]
+  assert [ payout.totalSupplyForEpoch(epoch) for epoch in range(epochs) ] == [ ve_flex.totalSupplyAt(height) for height in heights ]
+  second = payout.claim(owners[1], { 'from': owners[1] })
+  assert second.gas_used < first.gas_used
+  assert second.events['Claim']['amount'] == first.events['Claim']['amount']
+  assert payout.getClaimable(owners[2]) == first.events['Claim']['amount']
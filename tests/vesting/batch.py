@@ -0,0 +1,59 @@
+#!/usr/bin/env python3.7
+# coding:utf-8
+# Copyright (C) 2019-2021 All rights reserved.
+# FILENAME:  tests/vesting/batch.py
+# VERSION: 	 1.0
+# CREATED: 	 2026-10-18 23:40
+# AUTHOR: 	 Aekasitt Guruvanich <sitt@coinflex.com>
+# DESCRIPTION:
+#
+# HISTORY:
+#*************************************************************
+### Standard Packages ###
+from typing import List
+### Project Contracts ###
+from brownie import FLEXCoin, veFLEX
+### Third-Party Packages ###
+from brownie.network import Chain
+from eth_account import Account
+### Local Modules ###
+from scripts.utils.ve_batch import MAX_BATCH, VeBatchReader
+from tests import admin, user_accounts
+from tests.deployments.flex import deploy_flex
+from tests.deployments.ve_flex import deploy_ve_flex
+
+WEEK: int = 7 * 86400
+
+def test_batch_reads_match(admin: Account, user_accounts: List[Account], deploy_flex: FLEXCoin, deploy_ve_flex: veFLEX):
+  flex: FLEXCoin   = deploy_flex
+  ve_flex: veFLEX  = deploy_ve_flex
+  chain: Chain     = Chain()
+  owners           = user_accounts[:4]
+  start: int       = chain.height
+  for week, owner in enumerate(owners):
+    flex.transfer(owner, 10 ** 21, { 'from': admin })
+    ve_flex.create_lock(10 ** 21, chain.time() + (week + 10) * WEEK, { 'from': owner })
+    chain.sleep(WEEK // 2)
+    chain.mine(10)
+  ve_flex.checkpoint({ 'from': admin })
+  blocks: List[int] = list(range(start + 1, chain.height + 1))
+
+  ### One call per batch ###
+  reader: VeBatchReader = VeBatchReader(ve_flex)
+  addresses: List[str]  = [ account.address for account in user_accounts ]
+  for block in blocks[::5]:
+    balances = reader.balances_at(addresses, block)
+    for address in addresses:
+      assert balances[address] == ve_flex.balanceOfAt(address, block)
+  supplies: List[int] = reader.supplies_at(blocks)
+  assert supplies == [ ve_flex.totalSupplyAt(block) for block in blocks ]
+  assert reader.calls == len(blocks[::5]) + 1
+
+  ### Unordered blocks restart the epoch search ###
+  assert reader.supplies_at(blocks[::-1]) == supplies[::-1]
+
+  ### Chunks shrink under a low gas cap ###
+  assert len(blocks) > MAX_BATCH // 2
+  small: VeBatchReader = VeBatchReader(ve_flex, gas_cap=ve_flex.totalSupplyAt.estimate_gas(blocks[-1]) * 8)
+  assert small.supplies_at(blocks) == supplies
+  assert small.batch_size < MAX_BATCH
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3.7
+# coding:utf-8
+# Copyright (C) 2019-2021 All rights reserved.
+# FILENAME:  tests/vesting/checkpoint_n.py
+# VERSION: 	 1.0
+# CREATED: 	 2026-10-18 19:00
+# AUTHOR: 	 Aekasitt Guruvanich <sitt@coinflex.com>
+# DESCRIPTION:
+#
+# HISTORY:
+#*************************************************************
+### Standard Packages ###
+from typing import List
+### Project Contracts ###
+from brownie import FLEXCoin, veFLEX, reverts
+### Third-Party Packages ###
+from brownie.network import Chain
+from eth_account import Account
+### Local Modules ###
+from scripts.utils.ve_model import VotingEscrowModel
+from tests import admin, user_accounts
+from tests.deployments.flex import deploy_flex
+from tests.deployments.ve_flex import deploy_ve_flex
+
+WEEK: int = 7 * 86400
+
+def test_checkpoint_n_pages_history(admin: Account, user_accounts: List[Account], deploy_flex: FLEXCoin, deploy_ve_flex: veFLEX):
+  flex: FLEXCoin   = deploy_flex
+  ve_flex: veFLEX  = deploy_ve_flex
+  chain: Chain     = Chain()
+  alice, bob       = user_accounts[:2]
+  _, _, ts, blk    = ve_flex.point_history(0)
+  model            = VotingEscrowModel(blk, ts)
+  for acct, weeks in ((alice, 10), (bob, 100)):
+    flex.transfer(acct, 10 ** 21, { 'from': admin })
+    txn     = ve_flex.create_lock(10 ** 21, chain.time() + weeks * WEEK, { 'from': acct })
+    deposit = txn.events['Deposit']
+    model.apply_deposit(deposit['provider'], deposit['value'], deposit['locktime'], txn.block_number, deposit['ts'])
+  with reverts('Must fill at least one week'):
+    ve_flex.checkpoint_n(0, { 'from': admin })
+
+  ### Twenty quiet weeks, caught up eight weeks at a time ###
+  chain.sleep(20 * WEEK)
+  chain.mine(1)
+  gas: List[int] = []
+  while True:
+    epoch: int = ve_flex.epoch()
+    txn        = ve_flex.checkpoint_n(8, { 'from': admin })
+    model.apply_checkpoint(txn.block_number, txn.timestamp, 8)
+    gas.append(txn.gas_used)
+    _, _, ts, _ = ve_flex.point_history(ve_flex.epoch())
+    assert ve_flex.epoch() - epoch <= 8
+    if ts == txn.timestamp:
+      break
+  assert len(gas) == 3
+  print(f'checkpoint_n(8) gas: { gas }')
+
+  ### History matches the model, and user transactions no longer walk past weeks ###
+  model.verify(ve_flex.epoch(), ve_flex.point_history(ve_flex.epoch()))
+  assert ve_flex.totalSupply() == ve_flex.balanceOf(alice) + ve_flex.balanceOf(bob)
+  flex.transfer(bob, 10 ** 18, { 'from': admin })
+  txn = ve_flex.increase_amount(10 ** 18, { 'from': bob })
+  print(f'increase_amount gas after catch-up: { txn.gas_used }')
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3.7
+# coding:utf-8
+# Copyright (C) 2019-2021 All rights reserved.
+# FILENAME:  tests/vesting/hints.py
+# VERSION: 	 1.0
+# CREATED: 	 2026-10-18 23:05
+# AUTHOR: 	 Aekasitt Guruvanich <sitt@coinflex.com>
+# DESCRIPTION:
+#
+# HISTORY:
+#*************************************************************
+### Standard Packages ###
+from typing import List
+### Project Contracts ###
+from brownie import FLEXCoin, veFLEX
+### Third-Party Packages ###
+from brownie.network import Chain
+from eth_account import Account
+### Local Modules ###
+from scripts.utils.hints import EpochHints
+from scripts.utils.ve_model import VotingEscrowModel
+from tests import admin, user_accounts
+from tests.deployments.flex import deploy_flex
+from tests.deployments.ve_flex import deploy_ve_flex
+
+WEEK: int = 7 * 86400
+
+def test_hinted_reads_match(admin: Account, user_accounts: List[Account], deploy_flex: FLEXCoin, deploy_ve_flex: veFLEX):
+  flex: FLEXCoin   = deploy_flex
+  ve_flex: veFLEX  = deploy_ve_flex
+  chain: Chain     = Chain()
+  owners           = user_accounts[:3]
+  _, _, ts, blk    = ve_flex.point_history(0)
+  model            = VotingEscrowModel(blk, ts)
+  blocks: List[int] = [ blk ]
+  for week, owner in enumerate(owners * 2):
+    if week < len(owners):
+      flex.transfer(owner, 11 * 10 ** 20, { 'from': admin })
+      txn = ve_flex.create_lock(10 ** 21, chain.time() + (week + 10) * WEEK, { 'from': owner })
+    else:
+      txn = ve_flex.increase_amount(10 ** 20, { 'from': owner })
+    deposit = txn.events['Deposit']
+    model.apply_deposit(deposit['provider'], deposit['value'], deposit['locktime'], txn.block_number, deposit['ts'])
+    blocks.append(txn.block_number)
+    chain.sleep(WEEK // 2)
+    chain.mine(3)
+  txn = ve_flex.checkpoint({ 'from': admin })
+  model.apply_checkpoint(txn.block_number, txn.timestamp)
+  model.verify(ve_flex.epoch(), ve_flex.point_history(ve_flex.epoch()))
+  hints = EpochHints.from_model(model)
+
+  for block in range(blocks[0], chain.height + 1, 2):
+    assert ve_flex.totalSupplyAtHinted(*hints.supply_args(block)) == ve_flex.totalSupplyAt(block)
+    for owner in owners:
+      assert ve_flex.balanceOfAtHinted(*hints.balance_args(owner.address, block)) == ve_flex.balanceOfAt(owner, block)
+
+  ### Wrong hints fall back to the searches ###
+  block: int = blocks[3] + 1
+  assert ve_flex.totalSupplyAtHinted(block, 0) == ve_flex.totalSupplyAt(block)
+  assert ve_flex.totalSupplyAtHinted(block, 10 ** 6) == ve_flex.totalSupplyAt(block)
+  assert ve_flex.balanceOfAtHinted(owners[0], block, 10 ** 6, 0) == ve_flex.balanceOfAt(owners[0], block)
+
+  ### Hints save the searches ###
+  hinted: int   = ve_flex.balanceOfAtHinted.estimate_gas(*hints.balance_args(owners[0].address, block))
+  searched: int = ve_flex.balanceOfAt.estimate_gas(owners[0], block)
+  print(f'balanceOfAt gas: { searched }, hinted: { hinted }')
+  assert hinted < searched
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3.7
+# coding:utf-8
+# Copyright (C) 2019-2021 All rights reserved.
+# FILENAME:  tests/vesting/holders.py
+# VERSION: 	 1.0
+# CREATED: 	 2026-10-19 00:20
+# AUTHOR: 	 Aekasitt Guruvanich <sitt@coinflex.com>
+# DESCRIPTION:
+#
+# HISTORY:
+#*************************************************************
+### Standard Packages ###
+from typing import List
+### Project Contracts ###
+from brownie import FLEXCoin, veFLEX
+### Third-Party Packages ###
+from brownie.network import Chain
+from eth_account import Account
+### Local Modules ###
+from scripts.utils.holders import HolderSet
+from scripts.utils.log_scanner import LogScanner
+from tests import admin, user_accounts
+from tests.deployments.flex import deploy_flex
+from tests.deployments.ve_flex import deploy_ve_flex
+
+WEEK: int = 7 * 86400
+
+def test_holder_set_sync(admin: Account, user_accounts: List[Account], deploy_flex: FLEXCoin, deploy_ve_flex: veFLEX, tmp_path):
+  flex: FLEXCoin   = deploy_flex
+  ve_flex: veFLEX  = deploy_ve_flex
+  chain: Chain     = Chain()
+  owners           = user_accounts[:4]
+  deploy_block     = ve_flex.point_history(0)[3]
+  for weeks, owner in zip([2, 2, 5], owners[:3]):
+    flex.transfer(owner, 10 ** 21, { 'from': admin })
+    ve_flex.create_lock(5 * 10 ** 20, chain.time() + weeks * WEEK, { 'from': owner })
+    chain.mine(5)
+  ve_flex.increase_amount(10 ** 20, { 'from': owners[1] })
+  chain.sleep(2 * WEEK + 1)
+  ve_flex.withdraw({ 'from': owners[0] })
+  first_sync: int = chain.height
+
+  scanner: LogScanner = LogScanner(chunk_size=2, target_logs=4)
+  holders: HolderSet  = HolderSet.load(chain.id, ve_flex.address, deploy_block, directory=str(tmp_path))
+  assert holders.sync(scanner, first_sync) == 3
+  assert holders.holders() == [ owner.address for owner in owners[:3] ]
+  assert holders.locks[owners[0].address] == [0, 0]
+  assert holders.locks[owners[1].address][0] == 6 * 10 ** 20
+  assert holders.active(chain.time()) == [ owners[2].address ]
+  assert scanner.chunk_size > 2 # sparse ranges grow the chunk
+
+  ### Incremental sync from the saved state ###
+  flex.transfer(owners[3], 10 ** 21, { 'from': admin })
+  txn = ve_flex.create_lock(10 ** 20, chain.time() + 4 * WEEK, { 'from': owners[3] })
+  resumed: HolderSet = HolderSet.load(chain.id, ve_flex.address, deploy_block, directory=str(tmp_path))
+  assert resumed.last_block == first_sync
+  requests: int      = scanner.requests
+  assert resumed.sync(scanner, chain.height) == 1
+  assert scanner.requests - requests == 1
+  assert resumed.holders(txn.block_number - 1) == holders.holders()
+  assert resumed.holders(txn.block_number) == [ owner.address for owner in owners ]
+  assert set(resumed.active(chain.time())) == { owners[2].address, owners[3].address }
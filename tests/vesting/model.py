@@ -0,0 +1,86 @@
+#!/usr/bin/env python3.7
+# coding:utf-8
+# Copyright (C) 2019-2021 All rights reserved.
+# FILENAME:  tests/vesting/model.py
+# VERSION: 	 1.0
+# CREATED: 	 2026-10-18 11:40
+# AUTHOR: 	 Aekasitt Guruvanich <sitt@coinflex.com>
+# DESCRIPTION:
+#
+# HISTORY:
+#*************************************************************
+### Standard Packages ###
+from typing import List
+### Project Contracts ###
+from brownie import FLEXCoin, veFLEX
+### Third-Party Packages ###
+from brownie.network import Chain
+from brownie.network.gas.strategies import ExponentialScalingStrategy
+from eth_account import Account
+### Local Modules ###
+from scripts.utils.ve_model import MAXTIME, WEEK, VotingEscrowModel
+from tests import admin, user_accounts
+from tests.deployments.flex import deploy_flex
+from tests.deployments.ve_flex import deploy_ve_flex
+
+def test_model_matches_contract(admin: Account, user_accounts: List[Account], deploy_flex: FLEXCoin, deploy_ve_flex: veFLEX):
+  flex: FLEXCoin   = deploy_flex
+  ve_flex: veFLEX  = deploy_ve_flex
+  chain: Chain     = Chain()
+  gas_strategy     = ExponentialScalingStrategy('10 gwei', '50 gwei')
+  _, _, ts, blk    = ve_flex.point_history(0)
+  model            = VotingEscrowModel(blk, ts)
+  alice, bob, eve  = user_accounts[:3]
+  for acct in (alice, bob, eve):
+    flex.transfer(acct, 1000 * 1e18, { 'from': admin, 'gas_price': gas_strategy })
+
+  def replay(txn):
+    for deposit in txn.events['Deposit'] if 'Deposit' in txn.events else []:
+      model.apply_deposit(deposit['provider'], deposit['value'], deposit['locktime'], txn.block_number, deposit['ts'])
+    for withdraw in txn.events['Withdraw'] if 'Withdraw' in txn.events else []:
+      model.apply_withdraw(withdraw['provider'], withdraw['value'], txn.block_number, withdraw['ts'])
+
+  ### Build up a history of locks, top-ups, extensions, a bare checkpoint and a withdrawal ###
+  replay(ve_flex.create_lock(500 * 1e18, chain.time() + (4 * 365 * 86400), { 'from': alice, 'gas_price': gas_strategy }))
+  replay(ve_flex.create_lock(300 * 1e18, chain.time() + (2 * 7 * 86400), { 'from': bob, 'gas_price': gas_strategy }))
+  chain.sleep(3 * 86400)
+  chain.mine(20)
+  replay(ve_flex.create_lock(700 * 1e18, chain.time() + (365 * 86400), { 'from': eve, 'gas_price': gas_strategy }))
+  replay(ve_flex.increase_amount(200 * 1e18, { 'from': alice, 'gas_price': gas_strategy }))
+  chain.sleep(3 * 7 * 86400)
+  chain.mine(50)
+  txn = ve_flex.checkpoint({ 'from': admin, 'gas_price': gas_strategy })
+  model.apply_checkpoint(txn.block_number, txn.timestamp)
+  replay(ve_flex.withdraw({ 'from': bob, 'gas_price': gas_strategy }))
+  replay(ve_flex.increase_unlock_time(chain.time() + (2 * 365 * 86400), { 'from': eve, 'gas_price': gas_strategy }))
+
+  ### Compare every block up to the last checkpoint, where no extrapolation to the chain head is involved ###
+  model.verify(ve_flex.epoch(), ve_flex.point_history(ve_flex.epoch()))
+  last_block: int = model.point_history[model.epoch].blk
+  model.set_head(last_block, model.point_history[model.epoch].ts)
+  for block in range(blk, last_block + 1):
+    assert model.total_supply_at(block) == ve_flex.totalSupplyAt(block)
+    for acct in (alice, bob, eve):
+      assert model.balance_of_at(acct.address, block) == ve_flex.balanceOfAt(acct, block)
+
+def test_replay_orders_by_transaction_index():
+  ### A bare `checkpoint()` mined after a deposit of the same block must replay after it ###
+  start: int    = 2000 * WEEK
+  alice: str    = '0x' + 'a' * 40
+  bob: str      = '0x' + 'b' * 40
+  deposit = lambda provider, value, block, tx_index, ts: {
+    'event': 'Deposit', 'blockNumber': block, 'transactionIndex': tx_index, 'logIndex': tx_index,
+    'args': { 'provider': provider, 'value': value, 'locktime': start + MAXTIME // WEEK * WEEK, 'ts': ts },
+  }
+  events: list      = [ deposit(alice, 10 ** 21, 110, 0, start + 100), deposit(bob, 3 * 10 ** 20, 120, 2, start + 200) ]
+  checkpoints: list = [ (110, 1, start + 100), (120, 0, start + 200) ]
+  replayed          = VotingEscrowModel(100, start)
+  replayed.replay(reversed(events), reversed(checkpoints))
+  expected          = VotingEscrowModel(100, start)
+  expected.apply_deposit(alice, 10 ** 21, start + MAXTIME // WEEK * WEEK, 110, start + 100)
+  expected.apply_checkpoint(110, start + 100)
+  expected.apply_checkpoint(120, start + 200)
+  expected.apply_deposit(bob, 3 * 10 ** 20, start + MAXTIME // WEEK * WEEK, 120, start + 200)
+  assert replayed.epoch == expected.epoch == 4
+  assert replayed.point_history == expected.point_history
+  assert replayed.head == (120, start + 200)